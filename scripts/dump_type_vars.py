@@ -1,16 +1,139 @@
+"""
+Generates `src/typeapi/_special_aliases.py`, which contains the special generic aliases of the `typing` module (such
+as `typing.List` for `list`) for every supported minor version of Python, together with their type parameters.
 
-import sys
+Since Python 3.9, the special generic aliases no longer carry their type variables, so the type parameters are taken
+from the aliases in Python 3.8. Aliases that have gained type parameters since then must be listed in
+`PARAMETER_OVERRIDES`.
+
+The script runs itself with every version in `VERSIONS` through pyenv, which selects the version from the
+`PYENV_VERSION` environment variable, so all of these versions must be installed.
 
-assert (3, 7) <= sys.version_info[:2] < (3, 8), "Need Python 3.7 or 3.8."
+    $ python scripts/dump_type_vars.py          # Regenerate src/typeapi/_special_aliases.py
+    $ python scripts/dump_type_vars.py --dump   # Print the aliases of the current Python version as JSON
+"""
 
+import argparse
+import json
+import os
+import subprocess
+import sys
 import typing
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+VERSIONS = ["3.8", "3.9", "3.10", "3.11", "3.12", "3.13"]
+OUTPUT = Path(__file__).parent.parent / "src" / "typeapi" / "_special_aliases.py"
+
+#: Type parameters of aliases that are not the same as in Python 3.8, keyed by the name of the alias and the number of
+#: its type parameters. The names and variance follow typeshed.
+PARAMETER_OVERRIDES: Dict[Tuple[str, int], List[str]] = {
+    ("ContextManager", 2): ["+T_co", "+ExitT_co"],
+    ("AsyncContextManager", 2): ["+T_co", "+ExitT_co"],
+}
+
+HEADER = '''\
+# This file is generated by scripts/dump_type_vars.py. Do not edit it manually.
+"""
+The special generic aliases of the :mod:`typing` module for every supported minor version of Python.
+"""
+
+from typing import Dict, Tuple
+'''
+
+
+def dump() -> Dict[str, Any]:
+    """
+    Returns the special generic aliases of the `typing` module of the current version of Python.
+    """
+
+    aliases = {}
+    # NOTE(NiklasRosenstein): Some aliases are created lazily by `typing.__getattr__()` since Python 3.13, so we
+    #       can't rely on `vars(typing)`.
+    for name in sorted(set(typing.__all__) | set(vars(typing))):
+        value = getattr(typing, name)
+        origin = getattr(value, "__origin__", None)
+        if isinstance(value, type) or not isinstance(origin, type):
+            continue
+        parameters = [str(x) for x in getattr(value, "__parameters__", None) or ()]
+        aliases[name] = {
+            "origin": [origin.__module__, origin.__qualname__],
+            "nparams": getattr(value, "_nparams", len(parameters)),
+            "parameters": parameters,
+        }
+    return {"version": list(sys.version_info[:2]), "aliases": aliases}
+
+
+def dump_with(version: str) -> Dict[str, Any]:
+    env = {**os.environ, "PYENV_VERSION": version}
+    output = subprocess.check_output(["pyenv", "exec", "python", __file__, "--dump"], env=env)
+    result: Dict[str, Any] = json.loads(output)
+    assert ".".join(map(str, result["version"])) == version, (version, result["version"])
+    return result
+
+
+def _repr(value: Any) -> str:
+    """
+    Like `repr()`, but formats strings with double quotes like Black does.
+    """
+
+    if isinstance(value, str):
+        return json.dumps(value)
+    if isinstance(value, tuple):
+        items = ", ".join(map(_repr, value))
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    return repr(value)
+
+
+def generate() -> str:
+    dumps = [dump_with(version) for version in VERSIONS]
+    baseline = dumps[0]["aliases"]
+
+    parameters: Dict[Tuple[str, int], List[str]] = {}
+    for data in dumps:
+        for name, alias in data["aliases"].items():
+            key = (name, alias["nparams"])
+            if alias["parameters"]:
+                parameters[key] = alias["parameters"]
+            elif key in PARAMETER_OVERRIDES:
+                parameters[key] = PARAMETER_OVERRIDES[key]
+            elif name in baseline and len(baseline[name]["parameters"]) in (0, alias["nparams"]):
+                # Aliases without type variables in Python 3.8, such as `Callable`, are variadic.
+                parameters[key] = baseline[name]["parameters"]
+            else:
+                raise RuntimeError(f"unknown type parameters of typing.{name} in Python {data['version']}")
+
+    lines = [HEADER]
+    lines.append("#: Maps a minor version of Python to the special generic aliases of the `typing` module in that")
+    lines.append("#: version. Each alias is mapped to the module and qualified name of its origin.")
+    lines.append("SPECIAL_ALIASES: Dict[Tuple[int, int], Dict[str, Tuple[str, str]]] = {")
+    for data in dumps:
+        lines.append(f"    {tuple(data['version'])!r}: {{")
+        for name, alias in data["aliases"].items():
+            lines.append(f"        {_repr(name)}: {_repr(tuple(alias['origin']))},")
+        lines.append("    },")
+    lines.append("}")
+    lines.append("")
+    lines.append("#: Maps the name and number of type parameters of a special generic alias to the string")
+    lines.append("#: representations of its type parameters, see :func:`typeapi.utils.get_type_var_from_string_repr`.")
+    lines.append("SPECIAL_ALIAS_PARAMETERS: Dict[Tuple[str, int], Tuple[str, ...]] = {")
+    for key, value in sorted(parameters.items()):
+        lines.append(f"    {_repr(key)}: {_repr(tuple(value))},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dump", action="store_true", help="print the aliases of the current Python version")
+    args = parser.parse_args()
 
-print()
-print("_SPECIAL_ALIAS_TYPEVARS = {")
+    if args.dump:
+        print(json.dumps(dump()))
+    else:
+        OUTPUT.write_text(generate())
+        print(f"Wrote {OUTPUT}")
 
-for key, value in vars(typing).items():
-    params = getattr(value, "__parameters__", None)
-    if params:
-        print(f"  {key!r}: [{', '.join(repr(str(x)) for x in params)}],")
 
-print("}")
+if __name__ == "__main__":
+    main()
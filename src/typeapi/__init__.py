@@ -1,26 +1,59 @@
 __version__ = "2.2.1"
 
-from .typehint import (
-    AnnotatedTypeHint,
-    ClassTypeHint,
-    ForwardRefTypeHint,
-    LiteralTypeHint,
-    TupleTypeHint,
-    TypeHint,
-    TypeVarTypeHint,
-    UnionTypeHint,
-)
-from .utils import TypedDictProtocol, get_annotations, is_typed_dict, type_repr
+# NOTE(NiklasRosenstein): The public API is imported lazily on first access through the module-level `__getattr__()`
+#       (PEP 562), so that `import typeapi` does not import `typing`, `typing_extensions` or any of our own modules
+#       until a feature is used. See `_LAZY_IMPORTS` for where each name is defined.
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .assignability import is_assignable
+    from .checker import compile_checker
+    from .dispatch import TypeHintDispatcher
+    from .fields import get_fields
+    from .instrumentation import enable_stats, reset_stats, stats
+    from .signature import get_signature_hints
+    from .typehint import (
+        AnnotatedTypeHint,
+        ClassTypeHint,
+        ClassVarTypeHint,
+        ForwardRefTypeHint,
+        LiteralTypeHint,
+        ProtocolTypeHint,
+        TupleTypeHint,
+        TypeAliasTypeHint,
+        TypedDictTypeHint,
+        TypeHint,
+        TypeVarTypeHint,
+        UnionTypeHint,
+    )
+    from .utils import TypedDictProtocol, get_annotations, is_typed_dict, type_repr
 
 __all__ = [
+    # .assignability
+    "is_assignable",
+    # .checker
+    "compile_checker",
+    # .dispatch
+    "TypeHintDispatcher",
+    # .fields
+    "get_fields",
+    # .instrumentation
+    "enable_stats",
+    "reset_stats",
+    "stats",
+    # .signature
+    "get_signature_hints",
     # .typehint
     "AnnotatedTypeHint",
     "ClassTypeHint",
     "ClassVarTypeHint",
     "ForwardRefTypeHint",
     "LiteralTypeHint",
+    "ProtocolTypeHint",
     "TupleTypeHint",
     "TypeAliasTypeHint",
+    "TypedDictTypeHint",
     "TypeHint",
     "TypeVarTypeHint",
     "UnionTypeHint",
@@ -30,3 +63,47 @@ __all__ = [
     "type_repr",
     "TypedDictProtocol",
 ]
+
+_LAZY_IMPORTS = {
+    "is_assignable": "assignability",
+    "compile_checker": "checker",
+    "TypeHintDispatcher": "dispatch",
+    "get_fields": "fields",
+    "enable_stats": "instrumentation",
+    "reset_stats": "instrumentation",
+    "stats": "instrumentation",
+    "get_signature_hints": "signature",
+    "AnnotatedTypeHint": "typehint",
+    "ClassTypeHint": "typehint",
+    "ClassVarTypeHint": "typehint",
+    "ForwardRefTypeHint": "typehint",
+    "LiteralTypeHint": "typehint",
+    "ProtocolTypeHint": "typehint",
+    "TupleTypeHint": "typehint",
+    "TypeAliasTypeHint": "typehint",
+    "TypedDictTypeHint": "typehint",
+    "TypeHint": "typehint",
+    "TypeVarTypeHint": "typehint",
+    "UnionTypeHint": "typehint",
+    "get_annotations": "utils",
+    "is_typed_dict": "utils",
+    "type_repr": "utils",
+    "TypedDictProtocol": "utils",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    # Cache the value in the module namespace so that `__getattr__()` is not called again for this name.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "list[str]":
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,312 @@
+# This file is generated by scripts/dump_type_vars.py. Do not edit it manually.
+"""
+The special generic aliases of the :mod:`typing` module for every supported minor version of Python.
+"""
+
+from typing import Dict, Tuple
+
+#: Maps a minor version of Python to the special generic aliases of the `typing` module in that
+#: version. Each alias is mapped to the module and qualified name of its origin.
+SPECIAL_ALIASES: Dict[Tuple[int, int], Dict[str, Tuple[str, str]]] = {
+    (3, 8): {
+        "AbstractSet": ("collections.abc", "Set"),
+        "AsyncContextManager": ("contextlib", "AbstractAsyncContextManager"),
+        "AsyncGenerator": ("collections.abc", "AsyncGenerator"),
+        "AsyncIterable": ("collections.abc", "AsyncIterable"),
+        "AsyncIterator": ("collections.abc", "AsyncIterator"),
+        "Awaitable": ("collections.abc", "Awaitable"),
+        "ByteString": ("collections.abc", "ByteString"),
+        "Callable": ("collections.abc", "Callable"),
+        "ChainMap": ("collections", "ChainMap"),
+        "Collection": ("collections.abc", "Collection"),
+        "Container": ("collections.abc", "Container"),
+        "ContextManager": ("contextlib", "AbstractContextManager"),
+        "Coroutine": ("collections.abc", "Coroutine"),
+        "Counter": ("collections", "Counter"),
+        "DefaultDict": ("collections", "defaultdict"),
+        "Deque": ("collections", "deque"),
+        "Dict": ("builtins", "dict"),
+        "FrozenSet": ("builtins", "frozenset"),
+        "Generator": ("collections.abc", "Generator"),
+        "Hashable": ("collections.abc", "Hashable"),
+        "ItemsView": ("collections.abc", "ItemsView"),
+        "Iterable": ("collections.abc", "Iterable"),
+        "Iterator": ("collections.abc", "Iterator"),
+        "KeysView": ("collections.abc", "KeysView"),
+        "List": ("builtins", "list"),
+        "Mapping": ("collections.abc", "Mapping"),
+        "MappingView": ("collections.abc", "MappingView"),
+        "Match": ("re", "Match"),
+        "MutableMapping": ("collections.abc", "MutableMapping"),
+        "MutableSequence": ("collections.abc", "MutableSequence"),
+        "MutableSet": ("collections.abc", "MutableSet"),
+        "OrderedDict": ("collections", "OrderedDict"),
+        "Pattern": ("re", "Pattern"),
+        "Reversible": ("collections.abc", "Reversible"),
+        "Sequence": ("collections.abc", "Sequence"),
+        "Set": ("builtins", "set"),
+        "Sized": ("collections.abc", "Sized"),
+        "Tuple": ("builtins", "tuple"),
+        "Type": ("builtins", "type"),
+        "ValuesView": ("collections.abc", "ValuesView"),
+    },
+    (3, 9): {
+        "AbstractSet": ("collections.abc", "Set"),
+        "AsyncContextManager": ("contextlib", "AbstractAsyncContextManager"),
+        "AsyncGenerator": ("collections.abc", "AsyncGenerator"),
+        "AsyncIterable": ("collections.abc", "AsyncIterable"),
+        "AsyncIterator": ("collections.abc", "AsyncIterator"),
+        "Awaitable": ("collections.abc", "Awaitable"),
+        "ByteString": ("collections.abc", "ByteString"),
+        "Callable": ("collections.abc", "Callable"),
+        "ChainMap": ("collections", "ChainMap"),
+        "Collection": ("collections.abc", "Collection"),
+        "Container": ("collections.abc", "Container"),
+        "ContextManager": ("contextlib", "AbstractContextManager"),
+        "Coroutine": ("collections.abc", "Coroutine"),
+        "Counter": ("collections", "Counter"),
+        "DefaultDict": ("collections", "defaultdict"),
+        "Deque": ("collections", "deque"),
+        "Dict": ("builtins", "dict"),
+        "FrozenSet": ("builtins", "frozenset"),
+        "Generator": ("collections.abc", "Generator"),
+        "Hashable": ("collections.abc", "Hashable"),
+        "ItemsView": ("collections.abc", "ItemsView"),
+        "Iterable": ("collections.abc", "Iterable"),
+        "Iterator": ("collections.abc", "Iterator"),
+        "KeysView": ("collections.abc", "KeysView"),
+        "List": ("builtins", "list"),
+        "Mapping": ("collections.abc", "Mapping"),
+        "MappingView": ("collections.abc", "MappingView"),
+        "Match": ("re", "Match"),
+        "MutableMapping": ("collections.abc", "MutableMapping"),
+        "MutableSequence": ("collections.abc", "MutableSequence"),
+        "MutableSet": ("collections.abc", "MutableSet"),
+        "OrderedDict": ("collections", "OrderedDict"),
+        "Pattern": ("re", "Pattern"),
+        "Reversible": ("collections.abc", "Reversible"),
+        "Sequence": ("collections.abc", "Sequence"),
+        "Set": ("builtins", "set"),
+        "Sized": ("collections.abc", "Sized"),
+        "Tuple": ("builtins", "tuple"),
+        "Type": ("builtins", "type"),
+        "ValuesView": ("collections.abc", "ValuesView"),
+    },
+    (3, 10): {
+        "AbstractSet": ("collections.abc", "Set"),
+        "AsyncContextManager": ("contextlib", "AbstractAsyncContextManager"),
+        "AsyncGenerator": ("collections.abc", "AsyncGenerator"),
+        "AsyncIterable": ("collections.abc", "AsyncIterable"),
+        "AsyncIterator": ("collections.abc", "AsyncIterator"),
+        "Awaitable": ("collections.abc", "Awaitable"),
+        "ByteString": ("collections.abc", "ByteString"),
+        "Callable": ("collections.abc", "Callable"),
+        "ChainMap": ("collections", "ChainMap"),
+        "Collection": ("collections.abc", "Collection"),
+        "Container": ("collections.abc", "Container"),
+        "ContextManager": ("contextlib", "AbstractContextManager"),
+        "Coroutine": ("collections.abc", "Coroutine"),
+        "Counter": ("collections", "Counter"),
+        "DefaultDict": ("collections", "defaultdict"),
+        "Deque": ("collections", "deque"),
+        "Dict": ("builtins", "dict"),
+        "FrozenSet": ("builtins", "frozenset"),
+        "Generator": ("collections.abc", "Generator"),
+        "Hashable": ("collections.abc", "Hashable"),
+        "ItemsView": ("collections.abc", "ItemsView"),
+        "Iterable": ("collections.abc", "Iterable"),
+        "Iterator": ("collections.abc", "Iterator"),
+        "KeysView": ("collections.abc", "KeysView"),
+        "List": ("builtins", "list"),
+        "Mapping": ("collections.abc", "Mapping"),
+        "MappingView": ("collections.abc", "MappingView"),
+        "Match": ("re", "Match"),
+        "MutableMapping": ("collections.abc", "MutableMapping"),
+        "MutableSequence": ("collections.abc", "MutableSequence"),
+        "MutableSet": ("collections.abc", "MutableSet"),
+        "OrderedDict": ("collections", "OrderedDict"),
+        "Pattern": ("re", "Pattern"),
+        "Reversible": ("collections.abc", "Reversible"),
+        "Sequence": ("collections.abc", "Sequence"),
+        "Set": ("builtins", "set"),
+        "Sized": ("collections.abc", "Sized"),
+        "Tuple": ("builtins", "tuple"),
+        "Type": ("builtins", "type"),
+        "ValuesView": ("collections.abc", "ValuesView"),
+    },
+    (3, 11): {
+        "AbstractSet": ("collections.abc", "Set"),
+        "AsyncContextManager": ("contextlib", "AbstractAsyncContextManager"),
+        "AsyncGenerator": ("collections.abc", "AsyncGenerator"),
+        "AsyncIterable": ("collections.abc", "AsyncIterable"),
+        "AsyncIterator": ("collections.abc", "AsyncIterator"),
+        "Awaitable": ("collections.abc", "Awaitable"),
+        "ByteString": ("collections.abc", "ByteString"),
+        "Callable": ("collections.abc", "Callable"),
+        "ChainMap": ("collections", "ChainMap"),
+        "Collection": ("collections.abc", "Collection"),
+        "Container": ("collections.abc", "Container"),
+        "ContextManager": ("contextlib", "AbstractContextManager"),
+        "Coroutine": ("collections.abc", "Coroutine"),
+        "Counter": ("collections", "Counter"),
+        "DefaultDict": ("collections", "defaultdict"),
+        "Deque": ("collections", "deque"),
+        "Dict": ("builtins", "dict"),
+        "FrozenSet": ("builtins", "frozenset"),
+        "Generator": ("collections.abc", "Generator"),
+        "Hashable": ("collections.abc", "Hashable"),
+        "ItemsView": ("collections.abc", "ItemsView"),
+        "Iterable": ("collections.abc", "Iterable"),
+        "Iterator": ("collections.abc", "Iterator"),
+        "KeysView": ("collections.abc", "KeysView"),
+        "List": ("builtins", "list"),
+        "Mapping": ("collections.abc", "Mapping"),
+        "MappingView": ("collections.abc", "MappingView"),
+        "Match": ("re", "Match"),
+        "MutableMapping": ("collections.abc", "MutableMapping"),
+        "MutableSequence": ("collections.abc", "MutableSequence"),
+        "MutableSet": ("collections.abc", "MutableSet"),
+        "OrderedDict": ("collections", "OrderedDict"),
+        "Pattern": ("re", "Pattern"),
+        "Reversible": ("collections.abc", "Reversible"),
+        "Sequence": ("collections.abc", "Sequence"),
+        "Set": ("builtins", "set"),
+        "Sized": ("collections.abc", "Sized"),
+        "Tuple": ("builtins", "tuple"),
+        "Type": ("builtins", "type"),
+        "ValuesView": ("collections.abc", "ValuesView"),
+    },
+    (3, 12): {
+        "AbstractSet": ("collections.abc", "Set"),
+        "AsyncContextManager": ("contextlib", "AbstractAsyncContextManager"),
+        "AsyncGenerator": ("collections.abc", "AsyncGenerator"),
+        "AsyncIterable": ("collections.abc", "AsyncIterable"),
+        "AsyncIterator": ("collections.abc", "AsyncIterator"),
+        "Awaitable": ("collections.abc", "Awaitable"),
+        "ByteString": ("collections.abc", "ByteString"),
+        "Callable": ("collections.abc", "Callable"),
+        "ChainMap": ("collections", "ChainMap"),
+        "Collection": ("collections.abc", "Collection"),
+        "Container": ("collections.abc", "Container"),
+        "ContextManager": ("contextlib", "AbstractContextManager"),
+        "Coroutine": ("collections.abc", "Coroutine"),
+        "Counter": ("collections", "Counter"),
+        "DefaultDict": ("collections", "defaultdict"),
+        "Deque": ("collections", "deque"),
+        "Dict": ("builtins", "dict"),
+        "FrozenSet": ("builtins", "frozenset"),
+        "Generator": ("collections.abc", "Generator"),
+        "Hashable": ("collections.abc", "Hashable"),
+        "ItemsView": ("collections.abc", "ItemsView"),
+        "Iterable": ("collections.abc", "Iterable"),
+        "Iterator": ("collections.abc", "Iterator"),
+        "KeysView": ("collections.abc", "KeysView"),
+        "List": ("builtins", "list"),
+        "Mapping": ("collections.abc", "Mapping"),
+        "MappingView": ("collections.abc", "MappingView"),
+        "Match": ("re", "Match"),
+        "MutableMapping": ("collections.abc", "MutableMapping"),
+        "MutableSequence": ("collections.abc", "MutableSequence"),
+        "MutableSet": ("collections.abc", "MutableSet"),
+        "OrderedDict": ("collections", "OrderedDict"),
+        "Pattern": ("re", "Pattern"),
+        "Reversible": ("collections.abc", "Reversible"),
+        "Sequence": ("collections.abc", "Sequence"),
+        "Set": ("builtins", "set"),
+        "Sized": ("collections.abc", "Sized"),
+        "Tuple": ("builtins", "tuple"),
+        "Type": ("builtins", "type"),
+        "ValuesView": ("collections.abc", "ValuesView"),
+    },
+    (3, 13): {
+        "AbstractSet": ("collections.abc", "Set"),
+        "AsyncContextManager": ("contextlib", "AbstractAsyncContextManager"),
+        "AsyncGenerator": ("collections.abc", "AsyncGenerator"),
+        "AsyncIterable": ("collections.abc", "AsyncIterable"),
+        "AsyncIterator": ("collections.abc", "AsyncIterator"),
+        "Awaitable": ("collections.abc", "Awaitable"),
+        "ByteString": ("collections.abc", "ByteString"),
+        "Callable": ("collections.abc", "Callable"),
+        "ChainMap": ("collections", "ChainMap"),
+        "Collection": ("collections.abc", "Collection"),
+        "Container": ("collections.abc", "Container"),
+        "ContextManager": ("contextlib", "AbstractContextManager"),
+        "Coroutine": ("collections.abc", "Coroutine"),
+        "Counter": ("collections", "Counter"),
+        "DefaultDict": ("collections", "defaultdict"),
+        "Deque": ("collections", "deque"),
+        "Dict": ("builtins", "dict"),
+        "FrozenSet": ("builtins", "frozenset"),
+        "Generator": ("collections.abc", "Generator"),
+        "Hashable": ("collections.abc", "Hashable"),
+        "ItemsView": ("collections.abc", "ItemsView"),
+        "Iterable": ("collections.abc", "Iterable"),
+        "Iterator": ("collections.abc", "Iterator"),
+        "KeysView": ("collections.abc", "KeysView"),
+        "List": ("builtins", "list"),
+        "Mapping": ("collections.abc", "Mapping"),
+        "MappingView": ("collections.abc", "MappingView"),
+        "Match": ("re", "Match"),
+        "MutableMapping": ("collections.abc", "MutableMapping"),
+        "MutableSequence": ("collections.abc", "MutableSequence"),
+        "MutableSet": ("collections.abc", "MutableSet"),
+        "OrderedDict": ("collections", "OrderedDict"),
+        "Pattern": ("re", "Pattern"),
+        "Reversible": ("collections.abc", "Reversible"),
+        "Sequence": ("collections.abc", "Sequence"),
+        "Set": ("builtins", "set"),
+        "Sized": ("collections.abc", "Sized"),
+        "Tuple": ("builtins", "tuple"),
+        "Type": ("builtins", "type"),
+        "ValuesView": ("collections.abc", "ValuesView"),
+    },
+}
+
+#: Maps the name and number of type parameters of a special generic alias to the string
+#: representations of its type parameters, see :func:`typeapi.utils.get_type_var_from_string_repr`.
+SPECIAL_ALIAS_PARAMETERS: Dict[Tuple[str, int], Tuple[str, ...]] = {
+    ("AbstractSet", 1): ("+T_co",),
+    ("AsyncContextManager", 1): ("+T_co",),
+    ("AsyncContextManager", 2): ("+T_co", "+ExitT_co"),
+    ("AsyncGenerator", 2): ("+T_co", "-T_contra"),
+    ("AsyncIterable", 1): ("+T_co",),
+    ("AsyncIterator", 1): ("+T_co",),
+    ("Awaitable", 1): ("+T_co",),
+    ("ByteString", 0): (),
+    ("Callable", 0): (),
+    ("Callable", 2): (),
+    ("ChainMap", 2): ("~KT", "~VT"),
+    ("Collection", 1): ("+T_co",),
+    ("Container", 1): ("+T_co",),
+    ("ContextManager", 1): ("+T_co",),
+    ("ContextManager", 2): ("+T_co", "+ExitT_co"),
+    ("Coroutine", 3): ("+T_co", "-T_contra", "+V_co"),
+    ("Counter", 1): ("~T",),
+    ("DefaultDict", 2): ("~KT", "~VT"),
+    ("Deque", 1): ("~T",),
+    ("Dict", 2): ("~KT", "~VT"),
+    ("FrozenSet", 1): ("+T_co",),
+    ("Generator", 3): ("+T_co", "-T_contra", "+V_co"),
+    ("Hashable", 0): (),
+    ("ItemsView", 2): ("~KT", "+VT_co"),
+    ("Iterable", 1): ("+T_co",),
+    ("Iterator", 1): ("+T_co",),
+    ("KeysView", 1): ("~KT",),
+    ("List", 1): ("~T",),
+    ("Mapping", 2): ("~KT", "+VT_co"),
+    ("MappingView", 1): ("+T_co",),
+    ("Match", 1): ("~AnyStr",),
+    ("MutableMapping", 2): ("~KT", "~VT"),
+    ("MutableSequence", 1): ("~T",),
+    ("MutableSet", 1): ("~T",),
+    ("OrderedDict", 2): ("~KT", "~VT"),
+    ("Pattern", 1): ("~AnyStr",),
+    ("Reversible", 1): ("+T_co",),
+    ("Sequence", 1): ("+T_co",),
+    ("Set", 1): ("~T",),
+    ("Sized", 0): (),
+    ("Tuple", -1): (),
+    ("Tuple", 0): (),
+    ("Type", 1): ("+CT_co",),
+    ("ValuesView", 1): ("+VT_co",),
+}
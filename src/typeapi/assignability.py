@@ -0,0 +1,311 @@
+"""
+Structural assignability checks between type hints.
+
+:func:`is_assignable` answers whether a value of one type hint can be assigned to a variable annotated with another,
+without requiring a value to check. Results are memoized by the identity of the two low-level type hints, so
+comparing the same pair of annotations again is a dictionary lookup.
+"""
+
+import collections
+import collections.abc
+import math
+import threading
+from typing import Any, Dict, Mapping, Tuple
+
+from typing_extensions import Literal
+
+from . import instrumentation
+from .cache import LRUCache
+from .transform import resolve_forward_refs
+from .typehint import (
+    AnnotatedTypeHint,
+    ClassTypeHint,
+    LiteralTypeHint,
+    ProtocolTypeHint,
+    TupleTypeHint,
+    TypedDictTypeHint,
+    TypeHint,
+    TypeVarTypeHint,
+    UnionTypeHint,
+)
+from .utils import get_subscriptable_type_hint_from_origin
+
+__all__ = ["is_assignable", "is_subtype"]
+
+NoneType = type(None)
+
+#: Maps the identities of a `(target, source)` pair of low-level type hints to the two hints and the result. The
+#: hints are kept alive by the cache entry, so their identities cannot be reused while the entry exists.
+_CACHE: "LRUCache[Tuple[int, int], Tuple[Any, Any, bool]]" = LRUCache(4096, "assignability")
+
+#: The checks that are in progress in the current thread, see :func:`_is_assignable`.
+_local = threading.local()
+_CALLABLE: Any = collections.abc.Callable
+
+#: Built-in generics whose type arguments are invariant. The type parameters of built-in generics are not available
+#: at runtime, so arguments of all other built-in generics are treated as covariant.
+_INVARIANT_ORIGINS: Dict[Any, None] = dict.fromkeys(
+    [
+        list,
+        dict,
+        set,
+        collections.deque,
+        collections.defaultdict,
+        collections.OrderedDict,
+        collections.Counter,
+        collections.ChainMap,
+        collections.abc.MutableSequence,
+        collections.abc.MutableSet,
+        collections.abc.MutableMapping,
+    ]
+)
+
+#: The item types of non-generic built-in sequences, which are only virtual subclasses of `Sequence`.
+_ITEM_TYPES: Dict[type, type] = {str: str, bytes: int, bytearray: int, memoryview: int, range: int}
+
+#: Implicit promotions of numeric types as specified by PEP 484.
+_PROMOTIONS: Dict[Any, Tuple[type, ...]] = {float: (int,), complex: (int, float)}
+
+
+def _resolve(hint: Any) -> TypeHint:
+    result = resolve_forward_refs(hint if isinstance(hint, TypeHint) else TypeHint(hint))
+    while isinstance(result, AnnotatedTypeHint):
+        result = TypeHint(result.type)
+    return result
+
+
+def is_assignable(target: Any, source: Any) -> bool:
+    """
+    Returns `True` if a value of type *source* can be assigned to a variable annotated with *target*.
+
+    The check covers `Any` (which is compatible in both directions), classes and their parameterized base classes
+    (found with :meth:`ClassTypeHint.recurse_bases`), unions, literals, tuples, type variables (through their bound
+    or constraints), `Callable` signatures, `Annotated` (whose metadata is ignored) and the promotion of `int` to
+    `float` and `complex`. The type arguments of user-defined generics are compared according to the variance of
+    their type variables. Built-in generics do not expose their type variables at runtime; their arguments are
+    compared positionally, mutable containers invariantly and all others covariantly. `Protocol` targets are checked
+    structurally with :meth:`ProtocolTypeHint.is_implemented_by` (without comparing signatures), and `TypedDict`
+    types are compared by their fields as specified by PEP 589 and PEP 705.
+
+        >>> from typing import List, Optional, Sequence
+        >>> is_assignable(Sequence[Optional[int]], List[int])
+        True
+        >>> is_assignable(List[Optional[int]], List[int])
+        False
+
+    :param target: The type hint of the variable that is assigned to.
+    :param source: The type hint of the value that is assigned.
+    """
+
+    return _is_assignable(_resolve(target), _resolve(source))
+
+
+def is_subtype(left: Any, right: Any) -> bool:
+    """
+    Returns `True` if *left* is a subtype of *right*. This is equivalent to `is_assignable(right, left)`.
+    """
+
+    return is_assignable(right, left)
+
+
+def _is_assignable(target: TypeHint, source: TypeHint) -> bool:
+    key = (id(target.hint), id(source.hint))
+    entry = _CACHE.get(key)
+    if entry is not None and entry[0] is target.hint and entry[1] is source.hint:
+        if instrumentation.enabled:
+            instrumentation.increment("cache.assignability.hits")
+        return entry[2]
+    if instrumentation.enabled:
+        instrumentation.increment("cache.assignability.misses")
+
+    # NOTE(NiklasRosenstein): Recursive types (e.g. a `TypedDict` with a field `children: List["Node"]`) lead back to
+    #       a check that is already in progress. We assume that it succeeds, which is sound because the check fails
+    #       if anything else fails. A result that relies on the assumption of an enclosing check is not cached, because
+    #       the enclosing check may still fail.
+    try:
+        in_progress: Dict[Tuple[int, int], int] = _local.in_progress
+    except AttributeError:
+        in_progress = _local.in_progress = {}
+        _local.assumed = math.inf
+    depth = in_progress.get(key)
+    if depth is not None:
+        _local.assumed = min(_local.assumed, depth)
+        return True
+
+    depth = in_progress[key] = len(in_progress)
+    outer_assumed, _local.assumed = _local.assumed, math.inf
+    try:
+        result = _compute(target, source)
+    finally:
+        del in_progress[key]
+        assumed, _local.assumed = _local.assumed, outer_assumed
+    if assumed < depth:
+        _local.assumed = min(outer_assumed, assumed)
+    else:
+        _CACHE[key] = (target.hint, source.hint, result)
+    return result
+
+
+def _check(target: Any, source: Any) -> bool:
+    return _is_assignable(_resolve(target), _resolve(source))
+
+
+def _compute(target: TypeHint, source: TypeHint) -> bool:
+    if target.hint is source.hint or target.hint is Any or target.hint is object or source.hint is Any:
+        return True
+
+    # The source must be compatible in all of its possible forms.
+    if isinstance(source, UnionTypeHint):
+        return all(_check(target, x) for x in source.args)
+    if isinstance(source, TypeVarTypeHint):
+        if isinstance(target, TypeVarTypeHint) and target.hint == source.hint:
+            return True
+        if source.constraints:
+            return all(_check(target, x) for x in source.constraints)
+        return _check(target, object if source.bound is None else source.bound)
+    if isinstance(source, LiteralTypeHint) and len(source.flat_values) > 1:
+        return all(_check(target, Literal[x]) for x in source.flat_values)
+
+    # The target must accept the source in at least one of its forms.
+    if isinstance(target, UnionTypeHint):
+        return any(_check(x, source) for x in target.args)
+    if isinstance(target, TypeVarTypeHint):
+        if target.constraints:
+            return any(_check(x, source) for x in target.constraints)
+        return target.bound is None or _check(target.bound, source)
+
+    if isinstance(source, LiteralTypeHint):
+        if isinstance(target, LiteralTypeHint):
+            return all(target.contains(x) for x in source.flat_values)
+        return all(_check(target, type(x)) for x in source.flat_values)
+    if isinstance(target, LiteralTypeHint):
+        return source.hint is NoneType and target.contains(None)
+
+    # NOTE(NiklasRosenstein): `issubclass()` raises a `TypeError` for `TypedDict` classes and most protocols.
+    if isinstance(target, TypedDictTypeHint):
+        return isinstance(source, TypedDictTypeHint) and _is_assignable_to_typed_dict(target, source)
+    if isinstance(source, TypedDictTypeHint):
+        # A `TypedDict` is compatible with `Mapping[str, object]`, but not with `Dict` (see PEP 589).
+        return isinstance(target, ClassTypeHint) and _check(target, Mapping[str, object])
+    if isinstance(target, ProtocolTypeHint):
+        return isinstance(source, ClassTypeHint) and _implements_protocol(target, source)
+
+    if isinstance(target, TupleTypeHint):
+        return _is_assignable_to_tuple(target, source)
+    if isinstance(target, ClassTypeHint) and isinstance(source, ClassTypeHint):
+        return _is_assignable_to_class(target, source)
+
+    return target == source
+
+
+def _is_assignable_to_tuple(target: TupleTypeHint, source: TypeHint) -> bool:
+    if not isinstance(source, ClassTypeHint) or not issubclass(source.type, tuple):
+        return False
+    if not isinstance(source, TupleTypeHint):
+        # A plain tuple or a named tuple has items of unknown types.
+        return True
+    if target.repeated:
+        return all(_check(target.args[0], x) for x in source.args)
+    if source.repeated or len(target.args) != len(source.args):
+        return False
+    return all(_check(x, y) for x, y in zip(target.args, source.args))
+
+
+def _is_assignable_to_class(target: ClassTypeHint, source: ClassTypeHint) -> bool:
+    if not issubclass(source.type, target.type):
+        return source.type in _PROMOTIONS.get(target.type, ())
+    if not target.args:
+        return True
+
+    if target.type is _CALLABLE:
+        if source.type is not _CALLABLE:
+            return True
+        if not _check(target.args[-1], source.args[-1]):
+            return False
+        if target.args[0] is ... or source.args[0] is ...:
+            return True
+        # Parameters are contravariant.
+        return len(target.args) == len(source.args) and all(
+            _check(y, x) for x, y in zip(target.args[:-1], source.args[:-1])
+        )
+
+    if isinstance(source, TupleTypeHint):
+        # A tuple is a sequence of the union of its item types.
+        items = source.args if source.args else (Any,)
+        return all(_check(target.args[0], x) for x in items)
+
+    # Find the parameterization of the target's type in the source's base classes. The type arguments of a subclass
+    # do not correspond to those of the target by position (e.g. `class IntPair(Pair[int, T])`).
+    args: Tuple[Any, ...] = source.args if source.type is target.type else ()
+    if not args:
+        bases = list(source.recurse_bases())
+        base = next((x for x in bases if x.type is target.type), None)
+        if base is not None:
+            args = base.args
+        elif source.args:
+            # The bases of builtin collections are not known, but their type parameters correspond to those of the
+            # abstract base classes that they implement (e.g. `List[int]` and `Sequence[int]`).
+            args = source.args
+        elif source.type in _ITEM_TYPES:
+            args = (_ITEM_TYPES[source.type],)
+        else:
+            # The source is only a virtual subclass of the target (e.g. registered with an abstract base class).
+            # Unless it is itself an unparameterized generic, its type arguments are unknown.
+            return any(_is_generic(x.type) for x in bases)
+    if not args:
+        # The source is an unparameterized generic, i.e. its type arguments are `Any`.
+        return True
+
+    parameters = TypeHint(target.type).parameters
+    for index, (target_arg, source_arg) in enumerate(zip(target.args, args)):
+        if index < len(parameters):
+            covariant = parameters[index].__covariant__
+            contravariant = parameters[index].__contravariant__
+        else:
+            covariant = target.type not in _INVARIANT_ORIGINS
+            contravariant = False
+        if contravariant:
+            ok = _check(source_arg, target_arg)
+        elif covariant:
+            ok = _check(target_arg, source_arg)
+        else:
+            ok = _check(target_arg, source_arg) and _check(source_arg, target_arg)
+        if not ok:
+            return False
+    return True
+
+
+def _is_generic(cls: type) -> bool:
+    return cls is not object and (
+        hasattr(cls, "__class_getitem__") or get_subscriptable_type_hint_from_origin(cls) is not cls
+    )
+
+
+def _is_assignable_to_typed_dict(target: TypedDictTypeHint, source: TypedDictTypeHint) -> bool:
+    for name, field in target.fields.items():
+        other = source.fields.get(name)
+        if other is None:
+            return False
+        # NOTE(NiklasRosenstein): Forward references nested in the field type hints are evaluated in the scope of the
+        #       `TypedDict` that declares them.
+        target_hint, source_hint = TypeHint(field.hint, target.type), TypeHint(other.hint, source.type)
+        if field.readonly:
+            # Read-only fields are covariant, and a required key satisfies a key that is not required.
+            if (field.required and not other.required) or not _check(target_hint, source_hint):
+                return False
+        elif field.required != other.required or other.readonly:
+            return False
+        elif not (_check(target_hint, source_hint) and _check(source_hint, target_hint)):
+            return False
+    return True
+
+
+def _implements_protocol(target: ProtocolTypeHint, source: ClassTypeHint) -> bool:
+    if isinstance(source, ProtocolTypeHint):
+        return target.members <= source.members
+    verdict = target._get_verdict(source.type, False)
+    if verdict is None:
+        return False
+    # Members that the class does not have are fine if they are declared, e.g. attributes set in the constructor.
+    declared = {name for base in source.type.__mro__ for name in vars(base).get("__annotations__", {})}
+    return verdict <= declared
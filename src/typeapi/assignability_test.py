@@ -0,0 +1,198 @@
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import pytest
+from typing_extensions import Annotated, Literal, NotRequired, Protocol, ReadOnly, TypedDict
+
+from typeapi.assignability import _CACHE, is_assignable, is_subtype
+from typeapi.typehint import TypeHint
+
+T = TypeVar("T")
+U = TypeVar("U")
+T_co = TypeVar("T_co", covariant=True)
+T_contra = TypeVar("T_contra", contravariant=True)
+Number = TypeVar("Number", int, float)
+Bounded = TypeVar("Bounded", bound=Sequence[int])
+
+
+class Animal:
+    pass
+
+
+class Dog(Animal):
+    pass
+
+
+class Box(Generic[T]):
+    pass
+
+
+class Reader(Generic[T_co]):
+    pass
+
+
+class Writer(Generic[T_contra]):
+    pass
+
+
+class IntReader(Reader[int]):
+    pass
+
+
+class Pair(Generic[T, U]):
+    pass
+
+
+class IntPair(Pair[int, T]):
+    pass
+
+
+class Named(Protocol):
+    name: str
+
+    def greet(self) -> str: ...
+
+
+class Person:
+    name: str
+
+    def greet(self) -> str:
+        return self.name
+
+
+class Movie(TypedDict):
+    title: str
+    year: NotRequired[int]
+
+
+class Sequel(Movie):
+    prequel: Movie
+
+
+class ReadOnlyMovie(TypedDict):
+    title: ReadOnly[object]
+
+
+class Tree(TypedDict):
+    tags: List["Animal"]
+    children: List["Tree"]
+
+
+class OtherTree(TypedDict):
+    tags: List["Animal"]
+    children: List["OtherTree"]
+
+
+class DogTree(TypedDict):
+    tags: List["Dog"]
+    children: List["DogTree"]
+
+
+@pytest.mark.parametrize(
+    "target,source,expected",
+    [
+        (Any, int, True),
+        (int, Any, True),
+        (object, Optional[str], True),
+        (Animal, Dog, True),
+        (Dog, Animal, False),
+        (Annotated[Animal, "x"], Annotated[Dog, "y"], True),
+        (Optional[int], None, True),
+        (Optional[int], Union[int, str], False),
+        (Union[int, str, None], Optional[str], True),
+        (int, bool, True),
+        (Literal[1, 2], Literal[1], True),
+        (Literal[1, 2], Literal[True], False),
+        (Literal[1], int, False),
+        (Optional[Literal["a"]], None, True),
+        (str, Literal["a", "b"], True),
+        (int, Literal[1, "a"], False),
+        (Tuple[int, ...], Tuple[bool, int], True),
+        (Tuple[int, str], Tuple[int, str], True),
+        (Tuple[int, str], Tuple[int, ...], False),
+        (Tuple[int, str], Tuple[int], False),
+        (Tuple[int, ...], tuple, True),
+        (Sequence[int], Tuple[int, bool], True),
+        (Sequence[int], Tuple[int, str], False),
+        (Sequence[Animal], List[Dog], True),
+        (List[Animal], List[Dog], False),
+        (Mapping[str, Animal], Dict[str, Dog], True),
+        (Dict[str, Animal], Dict[str, Animal], True),
+        (Type[Animal], Type[Dog], True),
+        (Box[Animal], Box[Dog], False),
+        (Box[Animal], Box[Animal], True),
+        (Reader[Animal], Reader[Dog], True),
+        (Reader[Dog], Reader[Animal], False),
+        (Writer[Dog], Writer[Animal], True),
+        (Writer[Animal], Writer[Dog], False),
+        (Reader[int], IntReader, True),
+        (Reader[str], IntReader, False),
+        (Pair[int, str], IntPair[str], True),
+        (Pair[int, str], IntPair[int], False),
+        (Pair[str, str], IntPair[str], False),
+        (Number, int, True),
+        (Number, str, False),
+        (float, Number, True),
+        (complex, int, True),
+        (int, float, False),
+        (int, Number, False),
+        (Sequence[int], Bounded, True),
+        (Bounded, List[int], True),
+        (Bounded, List[str], False),
+        (T, str, True),
+        (Callable[..., Animal], Callable[[int], Dog], True),
+        (Callable[[Dog], Any], Callable[[Animal], Any], True),
+        (Callable[[Animal], Any], Callable[[Dog], Any], False),
+        (Callable[[int], Any], Callable[[int, int], Any], False),
+        (Sequence[int], str, False),
+        (Sequence[str], str, True),
+        (Iterable[int], bytes, True),
+        (Sequence[int], list, True),
+        (Named, Person, True),
+        (Named, Animal, False),
+        (Movie, Sequel, True),
+        (Sequel, Movie, False),
+        (ReadOnlyMovie, Movie, True),
+        (Movie, ReadOnlyMovie, False),
+        (Movie, Dict[str, Any], False),
+        (Dict[str, Any], Movie, False),
+        (Mapping[str, object], Movie, True),
+        (Mapping[str, int], Movie, False),
+        (Tree, OtherTree, True),
+        (OtherTree, Tree, True),
+        (Tree, DogTree, False),
+    ],
+)
+def test__is_assignable(target: Any, source: Any, expected: bool) -> None:
+    assert is_assignable(target, source) == expected
+    assert is_subtype(source, target) == expected
+    assert TypeHint(target).is_assignable_from(source) == expected
+
+
+def test__is_assignable__forward_references() -> None:
+    module = sys.modules[__name__]
+    assert TypeHint(List["Animal"], module).is_assignable_from(TypeHint("List[Animal]", module))
+    assert TypeHint(Sequence["int | None"], module).is_assignable_from(List[Optional[int]])
+
+
+def test__is_assignable__is_memoized() -> None:
+    _CACHE.clear()
+    assert is_assignable(Sequence[Optional[Animal]], List[Optional[Dog]]) is True
+    size = len(_CACHE)
+    assert size > 0
+    assert is_assignable(Sequence[Optional[Animal]], List[Optional[Dog]]) is True
+    assert len(_CACHE) == size
@@ -0,0 +1,197 @@
+"""
+Benchmarks for `typeapi`. Run them with `python -m typeapi.bench`, see `python -m typeapi.bench --help`.
+
+A benchmark is registered with the :func:`benchmark` decorator on a setup function that prepares its inputs and
+returns the function to time, so that the setup is not included in the measurement. The scenarios that ship with
+`typeapi` are defined in :mod:`typeapi.bench.scenarios`.
+"""
+
+import fnmatch
+import platform
+import statistics
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkResult",
+    "Comparison",
+    "benchmark",
+    "compare_results",
+    "get_benchmarks",
+    "run_benchmark",
+    "run_benchmarks",
+]
+
+
+class Benchmark(NamedTuple):
+    """A registered benchmark."""
+
+    #: The name of the benchmark. Names are dotted paths that group benchmarks by the feature that they measure.
+    name: str
+
+    #: A function that prepares the inputs of the benchmark and returns the function to time.
+    setup: Callable[[], Callable[[], object]]
+
+
+class BenchmarkResult(NamedTuple):
+    """The timings of a benchmark."""
+
+    #: The name of the benchmark.
+    name: str
+
+    #: The number of calls that were timed in each repetition.
+    number: int
+
+    #: The time per call in seconds, for each repetition.
+    times: List[float]
+
+    @property
+    def best(self) -> float:
+        """The fastest time per call in seconds. This is the most stable measure to compare between runs."""
+
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        """The median time per call in seconds."""
+
+        return statistics.median(self.times)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"number": self.number, "times": self.times, "best": self.best, "median": self.median}
+
+
+class Comparison(NamedTuple):
+    """The comparison of a benchmark between two runs, see :func:`compare_results`."""
+
+    #: The name of the benchmark.
+    name: str
+
+    #: The best time per call in seconds in the baseline run.
+    baseline: float
+
+    #: The best time per call in seconds in the current run.
+    current: float
+
+    #: Whether the benchmark became slower by more than the threshold.
+    regression: bool
+
+    @property
+    def ratio(self) -> float:
+        """The current time relative to the baseline time."""
+
+        return self.current / self.baseline
+
+
+_BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Callable[[], Callable[[], object]]], Callable[[], Callable[[], object]]]:
+    """
+    Decorator to register a setup function as the benchmark *name*. The setup function is called once before the
+    benchmark is timed and must return the function to time.
+
+        @benchmark("example.sum")
+        def _():
+            values = list(range(100))
+            return lambda: sum(values)
+    """
+
+    def decorator(setup: Callable[[], Callable[[], object]]) -> Callable[[], Callable[[], object]]:
+        if name in _BENCHMARKS:
+            raise ValueError(f"benchmark {name!r} is already registered")
+        _BENCHMARKS[name] = Benchmark(name, setup)
+        return setup
+
+    return decorator
+
+
+def get_benchmarks(pattern: Optional[str] = None) -> List[Benchmark]:
+    """
+    Returns the registered benchmarks, sorted by name. The scenarios in :mod:`typeapi.bench.scenarios` are
+    registered on the first call.
+
+    :param pattern: A glob pattern (see :mod:`fnmatch`) to select benchmarks by name.
+    """
+
+    from . import scenarios  # noqa: F401
+
+    return [x for name, x in sorted(_BENCHMARKS.items()) if pattern is None or fnmatch.fnmatch(name, pattern)]
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int = 5, min_time: float = 0.2) -> BenchmarkResult:
+    """
+    Times a benchmark. The number of calls per repetition is chosen such that one repetition takes at least
+    *min_time* seconds.
+
+    :param repeat: The number of repetitions.
+    :param min_time: The minimum duration of a repetition in seconds.
+    """
+
+    timer = timeit.Timer(benchmark.setup())
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    times = [elapsed / number] + [x / number for x in timer.repeat(repeat - 1, number)]
+    return BenchmarkResult(benchmark.name, number, times)
+
+
+def run_benchmarks(
+    benchmarks: List[Benchmark],
+    repeat: int = 5,
+    min_time: float = 0.2,
+    callback: "Callable[[BenchmarkResult], None] | None" = None,
+) -> Dict[str, Any]:
+    """
+    Runs the given benchmarks and returns the results as a JSON-serializable report, which also describes the
+    environment that the benchmarks were run in.
+
+    :param callback: A function that is called with the result of each benchmark as soon as it is available.
+    """
+
+    from typeapi import __version__
+
+    results = {}
+    for x in benchmarks:
+        result = run_benchmark(x, repeat, min_time)
+        if callback is not None:
+            callback(result)
+        results[x.name] = result.to_json()
+
+    return {
+        "typeapi": __version__,
+        "python": platform.python_version(),
+        "implementation": sys.implementation.name,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: Mapping[str, Any], current: Mapping[str, Any], threshold: float = 0.1
+) -> List[Comparison]:
+    """
+    Compares two reports created by :func:`run_benchmarks`. Benchmarks that are only present in one of the reports
+    are ignored.
+
+        >>> def report(best):
+        ...     return {"results": {"a": {"best": best}}}
+        >>> compare_results(report(1.0), report(1.2))
+        [Comparison(name='a', baseline=1.0, current=1.2, regression=True)]
+
+    :param threshold: The relative slowdown above which a benchmark is flagged as a regression.
+    """
+
+    result = []
+    for name, current_result in sorted(current["results"].items()):
+        baseline_result = baseline["results"].get(name)
+        if baseline_result is None:
+            continue
+        a, b = baseline_result["best"], current_result["best"]
+        result.append(Comparison(name, a, b, b > a * (1 + threshold)))
+    return result
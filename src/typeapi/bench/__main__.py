@@ -0,0 +1,210 @@
+"""
+Command-line interface for the `typeapi` benchmarks.
+
+    $ python -m typeapi.bench run -o baseline.json
+    $ python -m typeapi.bench run -o current.json
+    $ python -m typeapi.bench compare baseline.json current.json
+    $ python -m typeapi.bench scale --sizes 10,100,1000
+    $ python -m typeapi.bench memory
+"""
+
+import argparse
+import fnmatch
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import BenchmarkResult, compare_results, get_benchmarks, run_benchmarks
+
+
+def _format_time(seconds: float) -> str:
+    for unit, factor in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _run(args: argparse.Namespace) -> int:
+    benchmarks = get_benchmarks(args.pattern)
+    if args.list:
+        for x in benchmarks:
+            print(x.name)
+        return 0
+
+    def _report(result: BenchmarkResult) -> None:
+        print(f"{result.name:<50} {_format_time(result.best):>12} {_format_time(result.median):>12}", file=sys.stderr)
+
+    print(f"{'benchmark':<50} {'best':>12} {'median':>12}", file=sys.stderr)
+    report = run_benchmarks(benchmarks, args.repeat, args.min_time, _report)
+    _write_json(report, args.output)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    with open(args.baseline) as fp:
+        baseline = json.load(fp)
+    with open(args.current) as fp:
+        current = json.load(fp)
+
+    comparisons = compare_results(baseline, current, args.threshold)
+    print(f"{'benchmark':<50} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for x in comparisons:
+        flag = "  REGRESSION" if x.regression else ""
+        print(f"{x.name:<50} {_format_time(x.baseline):>12} {_format_time(x.current):>12} {x.ratio:>8.2f}{flag}")
+
+    regressions = sum(x.regression for x in comparisons)
+    if regressions:
+        print(f"\n{regressions} benchmark(s) regressed by more than {args.threshold:.0%}.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _scale(args: argparse.Namespace) -> int:
+    from .scaling import run_scaling
+
+    def _report(models: int, operation: str, measurement: Dict[str, float]) -> None:
+        print(
+            f"{models:>8} {operation:<32} {_format_time(measurement['seconds']):>12} "
+            f"{_format_time(measurement['seconds_per_model']):>12} {measurement['peak_bytes'] / 2**20:>10.2f} MiB",
+            file=sys.stderr,
+        )
+
+    print(f"{'models':>8} {'operation':<32} {'time':>12} {'per model':>12} {'peak memory':>14}", file=sys.stderr)
+    report = run_scaling(args.sizes, args.classes, args.depth, _report)
+
+    print(file=sys.stderr)
+    for name, result in report["results"].items():
+        print(
+            f"{name:<32} time ~ n^{_format_exponent(result['time_exponent'])}, "
+            f"memory ~ n^{_format_exponent(result['memory_exponent'])}",
+            file=sys.stderr,
+        )
+
+    _write_json(report, args.output)
+    return 0
+
+
+def _memory(args: argparse.Namespace) -> int:
+    from .memory import MEMORY_OPERATIONS, profile_memory
+
+    report = {}
+    for name in MEMORY_OPERATIONS:
+        if args.pattern and not fnmatch.fnmatch(name, args.pattern):
+            continue
+        profile = profile_memory(name, args.count, args.top)
+        report[name] = profile.to_json()
+
+        per_thousand = 1000 / profile.hints / 2**10
+        print(
+            f"{name}: {profile.hints} hints, peak {profile.peak_bytes * per_thousand:.1f} KiB, "
+            f"retained {profile.retained_bytes * per_thousand:.1f} KiB per 1000 hints",
+            file=sys.stderr,
+        )
+        for line in profile.lines:
+            location = f"{line.filename}:{line.lineno}"
+            print(f"  {location:<32} {line.size / 2**10:>10.1f} KiB {line.blocks:>8} blocks", file=sys.stderr)
+
+    _write_json(report, args.output)
+    return 0
+
+
+def _format_exponent(value: "float | None") -> str:
+    return "?" if value is None else f"{value:.2f}"
+
+
+def _generate(args: argparse.Namespace) -> int:
+    from .codebase import generate_codebase
+
+    names = generate_codebase(args.directory, args.package, args.modules, args.classes, args.depth)
+    print(f"Generated {len(names)} modules in {args.directory / args.package}", file=sys.stderr)
+    return 0
+
+
+def _write_json(data: Any, output: "str | None") -> None:
+    if output:
+        with open(output, "w") as fp:
+            json.dump(data, fp, indent=2)
+    else:
+        json.dump(data, sys.stdout, indent=2)
+        print()
+
+
+def _parse_sizes(value: str) -> List[int]:
+    return [int(x) for x in value.split(",")]
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m typeapi.bench", description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="run the benchmarks and write the results as JSON")
+    run.add_argument("pattern", nargs="?", help="a glob pattern to select benchmarks by name")
+    run.add_argument("-o", "--output", help="the file to write the results to (default: stdout)")
+    run.add_argument("-r", "--repeat", type=int, default=5, help="the number of repetitions (default: %(default)s)")
+    run.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="the minimum duration of a repetition in seconds (default: %(default)s)",
+    )
+    run.add_argument("-l", "--list", action="store_true", help="list the benchmarks instead of running them")
+    run.set_defaults(func=_run)
+
+    compare = subparsers.add_parser(
+        "compare", help="compare two result files and exit with status 1 if a benchmark regressed"
+    )
+    compare.add_argument("baseline", help="the results to compare against")
+    compare.add_argument("current", help="the results to check for regressions")
+    compare.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="the relative slowdown that counts as a regression (default: %(default)s)",
+    )
+    compare.set_defaults(func=_compare)
+
+    scale = subparsers.add_parser(
+        "scale", help="measure how time and memory grow with the size of a synthetic codebase"
+    )
+    scale.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        default=[10, 100, 1000],
+        help="comma-separated numbers of modules of the codebases (default: 10,100,1000)",
+    )
+    scale.add_argument("--classes", type=int, default=10, help="the number of models per module (default: 10)")
+    scale.add_argument("--depth", type=int, default=5, help="the depth of the generic hierarchy (default: 5)")
+    scale.add_argument("-o", "--output", help="the file to write the results to (default: stdout)")
+    scale.set_defaults(func=_scale)
+
+    generate = subparsers.add_parser("generate", help="write a synthetic codebase to a directory")
+    generate.add_argument("directory", type=Path, help="the directory to write the package to")
+    generate.add_argument("--package", default="synthetic", help="the name of the package (default: synthetic)")
+    generate.add_argument("--modules", type=int, default=10, help="the number of modules (default: 10)")
+    generate.add_argument("--classes", type=int, default=10, help="the number of models per module (default: 10)")
+    generate.add_argument("--depth", type=int, default=5, help="the depth of the generic hierarchy (default: 5)")
+    generate.set_defaults(func=_generate)
+
+    memory = subparsers.add_parser(
+        "memory", help="report the peak and retained memory per operation, grouped by line of typeapi"
+    )
+    memory.add_argument("pattern", nargs="?", help="a glob pattern to select operations by name")
+    memory.add_argument(
+        "-n", "--count", type=int, default=1000, help="the number of type hints to resolve (default: %(default)s)"
+    )
+    memory.add_argument("--top", type=int, default=10, help="the number of lines to report (default: %(default)s)")
+    memory.add_argument("-o", "--output", help="the file to write the results to (default: stdout)")
+    memory.set_defaults(func=_memory)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = get_argument_parser().parse_args(argv)
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+import importlib
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+from pytest import MonkeyPatch, mark
+
+from typeapi.bench import Benchmark, compare_results, get_benchmarks, run_benchmarks
+from typeapi.bench.__main__ import main
+from typeapi.bench.codebase import generate_codebase
+from typeapi.bench.memory import MEMORY_OPERATIONS, profile_memory
+from typeapi.bench.scaling import OPERATIONS, run_scaling
+from typeapi.typehint import ClassTypeHint, TypeHint
+from typeapi.utils import get_annotations
+
+
+@mark.parametrize("benchmark", get_benchmarks(), ids=lambda x: x.name)
+def test__benchmark__runs(benchmark: Benchmark) -> None:
+    benchmark.setup()()
+
+
+def test__run_benchmarks__returns_report() -> None:
+    report = run_benchmarks(get_benchmarks("typehint.construct.class"), repeat=2, min_time=0.001)
+    result = report["results"]["typehint.construct.class"]
+    assert len(result["times"]) == 2
+    assert result["best"] == min(result["times"])
+    assert json.loads(json.dumps(report)) == report
+
+
+def test__compare_results__flags_regressions_above_threshold() -> None:
+    baseline = {"results": {"a": {"best": 1.0}, "b": {"best": 1.0}, "c": {"best": 1.0}}}
+    current = {"results": {"a": {"best": 1.05}, "b": {"best": 1.5}, "d": {"best": 1.0}}}
+    assert [(x.name, x.regression) for x in compare_results(baseline, current)] == [("a", False), ("b", True)]
+    assert [x.regression for x in compare_results(baseline, current, threshold=0.6)] == [False, False]
+
+
+def test__main__compare__exits_with_status_1_on_regression(tmp_path: Path) -> None:
+    (tmp_path / "baseline.json").write_text(json.dumps({"results": {"a": {"best": 1.0}}}))
+    (tmp_path / "current.json").write_text(json.dumps({"results": {"a": {"best": 2.0}}}))
+    assert main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "baseline.json")]) == 0
+    assert main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "current.json")]) == 1
+
+
+def test__generate_codebase__resolves_cross_module_annotations(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    generate_codebase(tmp_path, "typeapi_test_codebase", modules=2, classes=2)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    package = importlib.import_module("typeapi_test_codebase")
+    try:
+        annotations = get_annotations(package.module_1.Model0, include_bases=True)
+        assert annotations["peer"] == Optional[package.module_0.Model0]
+        assert annotations["parent"] == Optional[package.module_1.Model0]
+        assert annotations["value"] is package.module_1.T
+        hint = TypeHint(package.module_1.Model0)
+        assert isinstance(hint, ClassTypeHint)
+        assert [x.type.__name__ for x in hint.recurse_bases()][:3] == ["Model0", "Level4", "Level3"]
+    finally:
+        for name in [x for x in sys.modules if x.startswith("typeapi_test_codebase")]:
+            del sys.modules[name]
+
+
+def test__run_scaling__reports_each_operation_per_size() -> None:
+    report = run_scaling([1, 2], classes=2, depth=2)
+    for name in OPERATIONS:
+        result = report["results"][name]
+        assert [x["models"] for x in result["sizes"]] == [2, 4]
+        assert result["time_exponent"] is not None
+
+
+@mark.parametrize("name", MEMORY_OPERATIONS)
+def test__profile_memory__attributes_allocations_to_typeapi(name: str) -> None:
+    profile = profile_memory(name, count=20, top=3)
+    assert profile.hints > 0
+    assert profile.peak_bytes >= profile.retained_bytes > 0
+    assert 0 < len(profile.lines) <= 3
+    assert all(x.filename.endswith(".py") and not x.filename.startswith("bench") for x in profile.lines)
+    assert json.loads(json.dumps(profile.to_json())) == profile.to_json()
@@ -0,0 +1,82 @@
+"""
+Generates synthetic Python packages to measure how `typeapi` scales with the size of a codebase.
+"""
+
+from pathlib import Path
+from typing import List
+
+__all__ = ["generate_codebase"]
+
+
+def _generate_module(index: int, classes: int, depth: int, literals: int) -> str:
+    lines = [
+        "from __future__ import annotations",
+        "",
+        "from typing import Dict, Generic, List, Optional, TypeVar, Union",
+        "",
+        "from typing_extensions import Literal",
+        "",
+    ]
+    if index > 0:
+        lines += [f"from . import module_{index - 1}", ""]
+    lines += ['T = TypeVar("T")', "", ""]
+
+    # A deep hierarchy of generic classes that pass their type parameter on to their base class.
+    lines += ["class Level0(Generic[T]):", "    value: T", "    values: Dict[str, List[T]]", "", ""]
+    for level in range(1, depth):
+        lines += [f"class Level{level}(Level{level - 1}[T], Generic[T]):", f"    level_{level}: Optional[T]", "", ""]
+
+    status = ", ".join(f'"status_{x}"' for x in range(literals))
+    for number in range(classes):
+        peer = f"module_{index - 1}.Model{number}" if index > 0 else f"Model{number}"
+        payload = ", ".join(f"Model{x}" for x in range(min(classes, 8)))
+        lines += [
+            f"class Model{number}(Level{depth - 1}[int]):",
+            "    id: int",
+            "    name: str",
+            f"    parent: Optional[Model{number}]",
+            f"    children: List[Model{number}]",
+            f"    peer: Optional[{peer}]",
+            f"    status: Literal[{status}]",
+            f"    payload: Union[int, str, float, bytes, None, {payload}]",
+            "",
+            "",
+        ]
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def generate_codebase(
+    directory: Path,
+    package: str,
+    modules: int,
+    classes: int,
+    depth: int = 5,
+    literals: int = 20,
+) -> List[str]:
+    """
+    Writes a package with *modules* modules and *classes* model classes per module to *directory*. All annotations
+    are strings (the modules use `from __future__ import annotations`) and cover the cases that are expensive to
+    resolve:
+
+    * every model inherits from a hierarchy of *depth* generic classes,
+    * models refer to themselves (`parent: Optional[Model0]`) and to a model in the previous module,
+    * and they have a large `Literal` with *literals* values and a large `Union`.
+
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     generate_codebase(Path(directory), "synthetic", modules=2, classes=3)
+        ['synthetic.module_0', 'synthetic.module_1']
+
+    Returns the names of the generated modules. The package can be imported after adding *directory* to `sys.path`.
+    """
+
+    root = directory / package
+    root.mkdir(parents=True)
+    names = [f"module_{x}" for x in range(modules)]
+    (root / "__init__.py").write_text(
+        f'"""A synthetic package with {modules} modules and {classes} models per module."""\n\n'
+        f"from . import {', '.join(names)}\n"
+    )
+    for index, name in enumerate(names):
+        (root / f"{name}.py").write_text(_generate_module(index, classes, depth, literals))
+    return [f"{package}.{x}" for x in names]
@@ -0,0 +1,174 @@
+"""
+Measures the memory that `typeapi` allocates per operation with :mod:`tracemalloc`.
+
+For each operation, :func:`profile_memory` resolves a number of type hints (1000 by default) and reports the peak
+memory during the operation and the memory that is still allocated afterwards. The retained memory includes the
+resolved type hints themselves (they are kept alive until the measurement is taken) and whatever the operation
+added to the caches of `typeapi`. Allocations are attributed to the innermost line of `typeapi` in their traceback,
+so that allocations in the standard library (e.g. in :mod:`typing`) count towards the line in `typeapi` that caused
+them.
+"""
+
+import gc
+import os
+import tracemalloc
+import types
+from typing import Any, Callable, Dict, Generic, List, NamedTuple, Optional, Tuple, TypeVar
+
+from typing_extensions import Literal
+
+from typeapi.typehint import ClassTypeHint, TypeHint
+from typeapi.utils import get_annotations
+
+__all__ = ["LineAllocation", "MemoryProfile", "MEMORY_OPERATIONS", "profile_memory"]
+
+T = TypeVar("T")
+
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_BENCH_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+class LineAllocation(NamedTuple):
+    """The memory that is retained by allocations from one line of `typeapi`."""
+
+    #: The source file, relative to the `typeapi` package.
+    filename: str
+
+    #: The line number.
+    lineno: int
+
+    #: The number of bytes that are retained.
+    size: int
+
+    #: The number of memory blocks that are retained.
+    blocks: int
+
+
+class MemoryProfile(NamedTuple):
+    """The result of :func:`profile_memory`."""
+
+    #: The name of the operation.
+    name: str
+
+    #: The number of type hints that were resolved.
+    hints: int
+
+    #: The peak of the traced memory during the operation, in bytes.
+    peak_bytes: int
+
+    #: The memory that was still allocated after the operation, in bytes.
+    retained_bytes: int
+
+    #: The lines of `typeapi` that retain the most memory, in descending order.
+    lines: List[LineAllocation]
+
+    def to_json(self) -> Dict[str, Any]:
+        per_thousand = 1000 / self.hints
+        return {
+            "hints": self.hints,
+            "peak_bytes": self.peak_bytes,
+            "retained_bytes": self.retained_bytes,
+            "peak_bytes_per_1000_hints": round(self.peak_bytes * per_thousand),
+            "retained_bytes_per_1000_hints": round(self.retained_bytes * per_thousand),
+            "lines": [x._asdict() for x in self.lines],
+        }
+
+
+def _setup_construct(count: int) -> Callable[[], List[object]]:
+    hints = [Dict[str, Tuple[int, ...]], Optional[List[int]], Callable[[int], str], T]
+    return lambda: [TypeHint(hints[i % len(hints)]) for i in range(count)]
+
+
+def _setup_evaluate(count: int) -> Callable[[], List[object]]:
+    # Distinct expressions, so that the evaluation does not only hit caches.
+    expressions = [f"Dict[str, Tuple[int, Literal[{i}]]]" for i in range(count)]
+    context = {"Dict": Dict, "Tuple": Tuple, "Literal": Literal}
+    return lambda: [TypeHint(x).evaluate(context) for x in expressions]
+
+
+def _setup_annotations(count: int) -> Callable[[], List[object]]:
+    fields = 10
+    classes = [
+        type(f"Model{i}", (), {"__annotations__": {f"field_{j}": "Optional[List[int]]" for j in range(fields)}})
+        for i in range(max(1, count // fields))
+    ]
+    for cls in classes:
+        cls.__module__ = __name__
+    return lambda: [hint for cls in classes for hint in get_annotations(cls).values()]
+
+
+def _setup_recurse_bases(count: int) -> Callable[[], List[object]]:
+    depth = 10
+    generic: Any = Generic
+    base: Any = types.new_class("Base0", (generic[T],))
+    for index in range(1, depth - 1):
+        base = types.new_class(f"Base{index}", (base[T], generic[T]))
+    leaves = [types.new_class(f"Leaf{i}", (base[int],)) for i in range(max(1, count // depth))]
+
+    def _run() -> List[object]:
+        result: List[object] = []
+        for leaf in leaves:
+            hint = TypeHint(leaf)
+            assert isinstance(hint, ClassTypeHint)
+            result.extend(hint.recurse_bases())
+        return result
+
+    return _run
+
+
+#: The operations that :func:`profile_memory` can measure. Each function is called with the number of type hints
+#: to resolve and returns the function that resolves them.
+MEMORY_OPERATIONS: Dict[str, Callable[[int], Callable[[], List[object]]]] = {
+    "construct": _setup_construct,
+    "evaluate": _setup_evaluate,
+    "get_annotations": _setup_annotations,
+    "recurse_bases": _setup_recurse_bases,
+}
+
+
+def _attribute(traceback: tracemalloc.Traceback) -> Optional[Tuple[str, int]]:
+    # NOTE(NiklasRosenstein): The frames of a traceback are ordered from the oldest to the most recent frame.
+    for frame in reversed(traceback):
+        filename = os.path.abspath(frame.filename)
+        if filename.startswith(_PACKAGE_DIRECTORY) and not filename.startswith(_BENCH_DIRECTORY):
+            return os.path.relpath(filename, _PACKAGE_DIRECTORY), frame.lineno
+    return None
+
+
+def profile_memory(name: str, count: int = 1000, top: int = 10, frames: int = 32) -> MemoryProfile:
+    """
+    Measures the memory of the operation *name* in :data:`MEMORY_OPERATIONS` for resolving *count* type hints.
+
+    :param top: The number of lines of `typeapi` to report.
+    :param frames: The number of frames to record per allocation. Allocations whose recorded frames do not include
+        a line of `typeapi` are only included in the totals.
+    """
+
+    operation = MEMORY_OPERATIONS[name](count)
+    gc.collect()
+
+    tracemalloc.start(frames)
+    try:
+        before = tracemalloc.take_snapshot()
+        result = operation()
+        retained, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    lines: Dict[Tuple[str, int], List[int]] = {}
+    for diff in after.compare_to(before, "traceback"):
+        key = _attribute(diff.traceback)
+        if key is not None and diff.size_diff > 0:
+            entry = lines.setdefault(key, [0, 0])
+            entry[0] += diff.size_diff
+            entry[1] += diff.count_diff
+
+    allocations = sorted(
+        (LineAllocation(filename, lineno, size, blocks) for (filename, lineno), (size, blocks) in lines.items()),
+        key=lambda x: x.size,
+        reverse=True,
+    )
+    hints = len(result)
+    del result
+    return MemoryProfile(name, hints, peak, retained, allocations[:top])
@@ -0,0 +1,144 @@
+"""
+Measures how the time and memory that `typeapi` needs grow with the size of a codebase, using synthetic packages
+created by :func:`typeapi.bench.codebase.generate_codebase`.
+"""
+
+import gc
+import importlib
+import math
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+from typeapi.future.fake import _COMPILED
+from typeapi.typehint import ClassTypeHint, TypeHint
+from typeapi.utils import get_annotations
+
+from .codebase import generate_codebase
+
+__all__ = ["OPERATIONS", "run_scaling"]
+
+
+def _recurse_bases(cls: type) -> object:
+    hint = TypeHint(cls)
+    assert isinstance(hint, ClassTypeHint)
+    return list(hint.recurse_bases())
+
+
+#: The operations that are applied to every model class of the synthetic codebase.
+OPERATIONS: Dict[str, Callable[[type], object]] = {
+    "get_annotations": get_annotations,
+    "get_annotations.include_bases": lambda cls: get_annotations(cls, include_bases=True),
+    "recurse_bases": _recurse_bases,
+}
+
+
+def _measure(operation: Callable[[type], object], models: List[type]) -> Dict[str, float]:
+    # NOTE(NiklasRosenstein): The compiled expressions are shared between codebases of different sizes, so we clear
+    #       them to measure each size from the same state. The first call of an operation does one-time work that does
+    #       not depend on the size of the codebase, such as importing modules lazily and compiling the annotations of
+    #       the bases that all models share. We do it before tracing, otherwise it dominates the memory of the small
+    #       sizes and the exponent is meaningless.
+    _COMPILED.clear()
+    operation(models[0])
+    gc.collect()
+
+    # NOTE(NiklasRosenstein): Tracing allocations slows down the operation, so we measure the memory in a separate
+    #       pass. It runs before the timed pass, so that the retained memory (what is still allocated after the pass)
+    #       includes what the operation adds to caches per model.
+    tracemalloc.start()
+    try:
+        for model in models:
+            operation(model)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    start = time.perf_counter()
+    for model in models:
+        operation(model)
+    seconds = time.perf_counter() - start
+
+    return {
+        "seconds": seconds,
+        "seconds_per_model": seconds / len(models),
+        "peak_bytes": peak,
+        "retained_bytes": retained,
+    }
+
+
+def _exponent(sizes: Sequence[int], values: Sequence[float]) -> "float | None":
+    """
+    Returns the exponent *k* of the best fit of `value = c * size ** k` (1 for linear, 2 for quadratic growth).
+    """
+
+    points = [(math.log(x), math.log(y)) for x, y in zip(sizes, values) if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def run_scaling(
+    sizes: Sequence[int],
+    classes: int = 10,
+    depth: int = 5,
+    callback: "Callable[[int, str, Dict[str, float]], None] | None" = None,
+) -> Dict[str, Any]:
+    """
+    Generates a synthetic codebase for each number of modules in *sizes* and applies each of the :data:`OPERATIONS`
+    to all of its model classes. Returns a JSON-serializable report with the time, the peak memory and the retained
+    memory of each operation per size, and the exponents of the growth of the time and peak memory with the number
+    of models.
+
+    :param sizes: The numbers of modules of the codebases.
+    :param classes: The number of model classes per module.
+    :param depth: The depth of the generic class hierarchy that the models inherit from.
+    :param callback: A function that is called with the number of models, the name of the operation and its
+        measurements as soon as they are available.
+    """
+
+    results: Dict[str, List[Dict[str, float]]] = {name: [] for name in OPERATIONS}
+    models_per_size = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        try:
+            for modules in sizes:
+                package = f"typeapi_synthetic_{modules}"
+                names = generate_codebase(Path(directory), package, modules, classes, depth)
+                importlib.invalidate_caches()
+                importlib.import_module(package)
+                models = [getattr(sys.modules[name], f"Model{x}") for name in names for x in range(classes)]
+                models_per_size.append(len(models))
+
+                for name, operation in OPERATIONS.items():
+                    measurement = {"models": len(models), **_measure(operation, models)}
+                    results[name].append(measurement)
+                    if callback is not None:
+                        callback(len(models), name, measurement)
+
+                for name in [package, *names]:
+                    del sys.modules[name]
+        finally:
+            sys.path.remove(directory)
+
+    return {
+        "classes": classes,
+        "depth": depth,
+        "results": {
+            name: {
+                "sizes": measurements,
+                "time_exponent": _exponent(models_per_size, [x["seconds"] for x in measurements]),
+                "memory_exponent": _exponent(models_per_size, [x["peak_bytes"] for x in measurements]),
+            }
+            for name, measurements in results.items()
+        },
+    }
@@ -0,0 +1,131 @@
+"""
+The benchmark scenarios that ship with `typeapi`.
+"""
+
+import types
+import typing
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar, Union
+
+from typing_extensions import Annotated, Literal
+
+from typeapi.future.fake import FakeProvider
+from typeapi.typehint import ClassTypeHint, TypeHint
+from typeapi.utils import get_annotations
+
+from . import benchmark
+
+K = TypeVar("K")
+T = TypeVar("T")
+V = TypeVar("V")
+
+#: The names that string references are evaluated with.
+CONTEXT: Dict[str, Any] = {**vars(typing), "Model": type("Model", (), {})}
+
+#: String references of increasing complexity.
+EXPRESSIONS = {
+    "name": "int",
+    "generic": "List[int]",
+    "nested": "Dict[str, List[Optional[Tuple[int, Model]]]]",
+    "union": "Union[int, str, bytes, float, None, List[Model], Dict[str, Model]]",
+    "pipe": "int | str | List[Model] | None",
+}
+
+#: Type hints of every category that `TypeHint` distinguishes.
+HINTS = {
+    "class": int,
+    "generic": Dict[str, List[int]],
+    "union": Union[int, str, None],
+    "literal": Literal["a", "b", "c"],
+    "annotated": Annotated[int, "metadata"],
+    "typevar": T,
+    "forwardref": "List[int]",
+    "tuple": Tuple[int, str],
+}
+
+#: Generic type hints to parameterize.
+SHALLOW_GENERIC = List[T]
+NESTED_GENERIC = Dict[K, List[Tuple[K, Optional[V]]]]
+
+
+def make_generic_hierarchy(depth: int) -> Any:
+    """
+    Returns a class that is *depth* levels deep in a hierarchy of generic classes, each of which passes its own type
+    parameters on to its base class, e.g. `class C1(Generic[K, V])`, `class C2(C1[K, V], Generic[K, V])`, etc.
+    """
+
+    generic: Any = Generic
+    cls: Any = types.new_class("C0", (generic[K, V],))
+    for index in range(1, depth):
+        cls = types.new_class(f"C{index}", (cls[K, V], generic[K, V]))
+    return cls
+
+
+def make_annotated_hierarchy(depth: int, fields: int) -> type:
+    """
+    Returns a class that is *depth* levels deep in a hierarchy of classes with *fields* string annotations each.
+    """
+
+    cls: type = object
+    for index in range(depth):
+        annotations = {f"field_{index}_{i}": EXPRESSIONS["nested"] for i in range(fields)}
+        cls = type(f"A{index}", (cls,), {"__annotations__": annotations, "__module__": __name__})
+    return cls
+
+
+Model = CONTEXT["Model"]
+
+
+for _category, _hint in HINTS.items():
+
+    @benchmark(f"typehint.construct.{_category}")
+    def _(hint: Any = _hint) -> Callable[[], object]:
+        return lambda: TypeHint(hint)
+
+
+for _name, _expr in EXPRESSIONS.items():
+
+    @benchmark(f"typehint.evaluate.{_name}")
+    def _(expr: str = _expr) -> Callable[[], object]:
+        return lambda: TypeHint(expr).evaluate(CONTEXT)
+
+    @benchmark(f"fake_provider.{_name}")
+    def _(expr: str = _expr) -> Callable[[], object]:
+        return lambda: FakeProvider(CONTEXT).execute(expr).evaluate()
+
+    if _name != "pipe":
+
+        @benchmark(f"native_eval.{_name}")
+        def _(expr: str = _expr) -> Callable[[], object]:
+            code = compile(expr, "<string>", "eval")
+            return lambda: eval(code, CONTEXT)
+
+
+@benchmark("typehint.parameterize.shallow")
+def _() -> Callable[[], object]:
+    hint = TypeHint(SHALLOW_GENERIC)
+    return lambda: hint.parameterize({T: int})
+
+
+@benchmark("typehint.parameterize.nested")
+def _() -> Callable[[], object]:
+    hint = TypeHint(NESTED_GENERIC)
+    return lambda: hint.parameterize({K: str, V: int})
+
+
+for _depth in (5, 20):
+
+    @benchmark(f"typehint.recurse_bases.depth_{_depth}")
+    def _(depth: int = _depth) -> Callable[[], object]:
+        hint = TypeHint(make_generic_hierarchy(depth)[str, int])
+        assert isinstance(hint, ClassTypeHint)
+        return lambda: list(hint.recurse_bases())
+
+    @benchmark(f"get_annotations.depth_{_depth}")
+    def _(depth: int = _depth) -> Callable[[], object]:
+        cls = make_annotated_hierarchy(depth, 10)
+        return lambda: get_annotations(cls)
+
+    @benchmark(f"get_annotations.include_bases.depth_{_depth}")
+    def _(depth: int = _depth) -> Callable[[], object]:
+        cls = make_annotated_hierarchy(depth, 10)
+        return lambda: get_annotations(cls, include_bases=True)
@@ -0,0 +1,86 @@
+"""
+Bounded caches used throughout :mod:`typeapi`.
+"""
+
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar, Union, overload
+
+from . import instrumentation
+
+__all__ = ["LRUCache"]
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+D = TypeVar("D")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A mapping with a maximum size that evicts the least recently used entry when it grows beyond that size. If the
+    cache has a *name*, evictions are counted in the `cache.<name>.evictions` statistic (see
+    :mod:`typeapi.instrumentation`).
+
+        >>> cache = LRUCache(2)
+        >>> cache["a"] = 1
+        >>> cache["b"] = 2
+        >>> cache.get("a")
+        1
+        >>> cache["c"] = 3
+        >>> "b" in cache
+        False
+    """
+
+    def __init__(self, maxsize: int, name: "str | None" = None) -> None:
+        assert maxsize > 0, maxsize
+        self.maxsize = maxsize
+        self.name = name
+        self._data: "OrderedDict[K, V]" = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"LRUCache(maxsize={self.maxsize}, size={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    @overload
+    def get(self, key: K) -> Optional[V]: ...
+
+    @overload
+    def get(self, key: K, default: D) -> Union[V, D]: ...
+
+    def get(self, key: K, default: "D | None" = None) -> "V | D | None":
+        """
+        Returns the value for *key* and marks it as recently used, or returns *default*.
+        """
+
+        try:
+            value = self._data[key]
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            if self.name is not None and instrumentation.enabled:
+                instrumentation.increment(f"cache.{self.name}.evictions")
+
+    def pop(self, key: K) -> Optional[V]:
+        """
+        Removes *key* from the cache and returns its value, if it was present.
+        """
+
+        return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+
+        self._data.clear()
@@ -0,0 +1,429 @@
+"""
+Compile type hints into specialized runtime type checking functions.
+
+Interpreting a type hint tree for every value that is validated is slow. :func:`compile_checker` instead generates
+the source code of a Python function that checks values against one specific type hint in straight-line code,
+compiles it once and caches the result.
+"""
+
+import array
+import collections.abc
+import itertools
+import linecache
+import sys
+import weakref
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from . import instrumentation
+from .cache import LRUCache
+from .dependencies import DependencyStamp, record, track_dependencies
+from .transform import resolve_forward_refs
+from .typehint import (
+    AnnotatedTypeHint,
+    ClassTypeHint,
+    ClassVarTypeHint,
+    ForwardRefTypeHint,
+    LiteralTypeHint,
+    TupleTypeHint,
+    TypedDictTypeHint,
+    TypeHint,
+    TypeVarTypeHint,
+    UnionTypeHint,
+)
+from .utils import type_repr
+
+__all__ = ["Checker", "compile_checker", "get_checker_source"]
+
+#: A compiled checker function returns `True` if a value matches the type hint it was compiled for.
+Checker = Callable[[Any], bool]
+
+NoneType = type(None)
+_CACHE: "LRUCache[Any, Tuple[Checker, DependencyStamp]]" = LRUCache(1024, "checker")
+_FILENAME_COUNTER = itertools.count()
+_MISSING = object()
+_CALLABLE: Any = collections.abc.Callable
+_BUFFER_TYPES = (array.array, memoryview)
+_ARRAY_TYPECODES = {**dict.fromkeys("bBhHiIlLqQ", int), **dict.fromkeys("fd", float), "u": str, "w": str}
+_MEMORYVIEW_FORMATS = {**dict.fromkeys("bBhHiIlLqQnNP", int), **dict.fromkeys("efd", float), "?": bool, "c": bytes}
+
+
+def _buffer_item_type(value: Any) -> "type | None":
+    """
+    Returns the type of all items of *value* if it is a one-dimensional buffer whose items all have the same type,
+    i.e. an `array.array`, a `memoryview` or a NumPy array that does not hold Python objects. The type is derived from
+    the buffer's type code, format or dtype in constant time. Returns `None` for any other value.
+    """
+
+    if isinstance(value, array.array):
+        return _ARRAY_TYPECODES.get(value.typecode)
+    if isinstance(value, memoryview):
+        return _MEMORYVIEW_FORMATS.get(value.format.lstrip("@=<>!")) if value.ndim == 1 else None
+
+    # NOTE(NiklasRosenstein): If NumPy has not been imported yet, the value cannot be a NumPy array.
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(value, numpy.ndarray) and value.ndim == 1 and value.dtype.kind != "O":
+        return value.dtype.type  # type: ignore[no-any-return]
+    return None
+
+
+class _CheckerCompiler:
+    """
+    Generates the source code for checking values against a type hint. Every type hint that requires more than a
+    single expression to be checked (e.g. because the items of a collection need to be checked) is compiled into
+    a separate function, which is generated only once per distinct low-level type hint object.
+    """
+
+    def __init__(self) -> None:
+        self.namespace: Dict[str, Any] = {"_MISSING": _MISSING, "_buffer_item_type": _buffer_item_type}
+        self.lines: List[str] = []
+        self.functions: Dict[int, str] = {}
+        self._keep_alive: List[Any] = []
+
+    def constant(self, value: Any) -> str:
+        """
+        Make *value* available to the generated code and return the name under which it can be accessed.
+        """
+
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def function(self, hint: TypeHint) -> str:
+        """
+        Returns the name of a generated function that checks a value against *hint*.
+        """
+
+        key = id(hint.hint)
+        if key in self.functions:
+            return self.functions[key]
+        name = f"_check_{len(self.functions)}"
+        self.functions[key] = name
+        self._keep_alive.append(hint.hint)
+        body = self.body(hint)
+        self.lines.append(f"def {name}(value):")
+        self.lines.extend("    " + line for line in body)
+        self.lines.append("")
+        return name
+
+    def needs_function(self, hint: TypeHint) -> bool:
+        """
+        Returns `True` if checking *hint* requires a separate function rather than a single expression.
+        """
+
+        if isinstance(hint, LiteralTypeHint):
+            return True
+        if isinstance(hint, TupleTypeHint):
+            return hint.repeated
+        if isinstance(hint, ClassTypeHint):
+            if isinstance(hint, TypedDictTypeHint):
+                return True
+            if len(hint.args) == 2 and issubclass(hint.type, collections.abc.Mapping):
+                return True
+            if len(hint.args) == 1 and issubclass(hint.type, collections.abc.Collection):
+                return True
+        return False
+
+    def instance_type(self, hint: TypeHint) -> "type | None":
+        """
+        Returns the type to pass to `isinstance()` if that is all that is needed to check *hint*.
+        """
+
+        if not isinstance(hint, ClassTypeHint) or isinstance(hint, TupleTypeHint) or self.needs_function(hint):
+            return None
+        if hint.type is object or (hint.args and hint.type in (type, _CALLABLE)):
+            return None
+        return hint.type
+
+    def body(self, hint: TypeHint) -> List[str]:
+        """
+        Returns the lines of a function body that checks the `value` variable against *hint*.
+        """
+
+        if not self.needs_function(hint):
+            return [f"return {self.expr(hint, 'value')}"]
+
+        if isinstance(hint, LiteralTypeHint):
+            keys, unhashable = hint._get_index()
+            return [
+                "try:",
+                f"    return (type(value), value) in {self.constant(keys)}",
+                "except TypeError:",
+                f"    return {self.constant(hint.contains) + '(value)' if unhashable else 'False'}",
+            ]
+
+        if isinstance(hint, TupleTypeHint):
+            return self.collection(tuple, hint[0])
+
+        assert isinstance(hint, ClassTypeHint), hint
+        if isinstance(hint, TypedDictTypeHint):
+            return self.typed_dict(hint)
+        if len(hint.args) == 2:
+            return self.mapping(hint.type, hint[0], hint[1])
+        return self.collection(hint.type, hint[0])
+
+    def element_types(self, hint: TypeHint) -> "Tuple[type, ...] | None":
+        """
+        Returns the types that an item must be an instance of to match *hint*, if checking the type of the item is
+        all that is needed to check *hint*.
+        """
+
+        if isinstance(hint, AnnotatedTypeHint):
+            return self.element_types(TypeHint(hint.type))
+        types = []
+        for member in hint if isinstance(hint, UnionTypeHint) else [hint]:
+            instance_type = self.instance_type(member)
+            if instance_type is None:
+                return None
+            types.append(instance_type)
+        return tuple(types)
+
+    def collection(self, container: Any, item: TypeHint) -> List[str]:
+        """
+        Returns the lines of a function body that checks if `value` is an instance of *container* and that all of its
+        items match *item*.
+
+        If it suffices to check the type of the items, the check is performed once per distinct item type instead
+        of once per item. For one-dimensional buffers (see :func:`_buffer_item_type`), the item type is derived from
+        the buffer's format without looking at the items at all.
+        """
+
+        lines = [f"if not isinstance(value, {self.constant(container)}):", "    return False"]
+        if issubclass(memoryview, container) or container.__module__ == "collections.abc":
+            # NOTE(NiklasRosenstein): Iterating a multi-dimensional `memoryview` raises `NotImplementedError`, and its
+            #       items would be sub-views rather than items of the buffer's format anyway.
+            lines.append("if isinstance(value, memoryview) and value.ndim != 1:")
+            lines.append("    return False")
+        types = self.element_types(item)
+
+        if types is None:
+            condition = self.expr(item, "item")
+            if condition != "True":
+                lines.append("for item in value:")
+                lines.append(f"    if not {condition}:")
+                lines.append("        return False")
+        else:
+            types_name = self.constant(types)
+            if any(issubclass(x, container) for x in _BUFFER_TYPES) or container.__module__ == "collections.abc":
+                lines.append("item_type = _buffer_item_type(value)")
+                lines.append("if item_type is not None:")
+                lines.append(f"    return issubclass(item_type, {types_name})")
+            lines.append("for item_type in set(map(type, value)):")
+            lines.append(f"    if not issubclass(item_type, {types_name}):")
+            lines.append("        return False")
+
+        lines.append("return True")
+        return lines
+
+    def mapping(self, container: Any, key: TypeHint, item: TypeHint) -> List[str]:
+        """
+        Returns the lines of a function body that checks if `value` is an instance of the mapping type *container*
+        and that all of its keys and values match *key* and *item*, respectively.
+        """
+
+        lines = [f"if not isinstance(value, {self.constant(container)}):", "    return False"]
+        reductions = []
+        for hint, iterable in ((key, "value"), (item, "value.values()")):
+            types = self.element_types(hint)
+            if types is not None:
+                reductions.append((types, iterable))
+            elif self.expr(hint, "item") != "True":
+                break
+        else:
+            for types, iterable in reductions:
+                lines.append(f"for item_type in set(map(type, {iterable})):")
+                lines.append(f"    if not issubclass(item_type, {self.constant(types)}):")
+                lines.append("        return False")
+            lines.append("return True")
+            return lines
+
+        conditions = [x for x in (self.expr(key, "key"), self.expr(item, "item")) if x != "True"]
+        lines.append("for key, item in value.items():")
+        lines.append(f"    if not ({' and '.join(conditions)}):")
+        lines.append("        return False")
+        lines.append("return True")
+        return lines
+
+    def typed_dict(self, hint: TypedDictTypeHint) -> List[str]:
+        """
+        Returns the lines of a function body that checks if `value` is a dictionary that matches *hint*.
+        """
+
+        lines = ["if not isinstance(value, dict):", "    return False"]
+        if hint.required_keys:
+            lines.append(f"if not {self.constant(hint.required_keys)}.issubset(value):")
+            lines.append("    return False")
+        for key, field in hint.fields.items():
+            condition = self.expr(resolve_forward_refs(TypeHint(field.hint, hint.type)), "item")
+            if condition == "True":
+                continue
+            if field.required:
+                lines.append(f"item = value[{key!r}]")
+                lines.append(f"if not ({condition}):")
+            else:
+                lines.append(f"item = value.get({key!r}, _MISSING)")
+                lines.append(f"if item is not _MISSING and not ({condition}):")
+            lines.append("    return False")
+        lines.append("return True")
+        return lines
+
+    def expr(self, hint: TypeHint, var: str) -> str:
+        """
+        Returns a Python expression that checks the variable *var* against *hint*.
+        """
+
+        if isinstance(hint, AnnotatedTypeHint):
+            return self.expr(TypeHint(hint.type), var)
+
+        if isinstance(hint, ClassVarTypeHint):
+            return self.expr(hint[0], var) if hint.args else "True"
+
+        if isinstance(hint, TypeVarTypeHint):
+            if hint.bound is not None:
+                return self.expr(TypeHint(hint.bound), var)
+            if hint.constraints:
+                return self.expr(TypeHint(Union[hint.constraints]), var)
+            return "True"
+
+        if isinstance(hint, UnionTypeHint):
+            return self.union(hint, var)
+
+        if self.needs_function(hint):
+            return f"{self.function(hint)}({var})"
+
+        if isinstance(hint, TupleTypeHint):
+            conditions = [f"isinstance({var}, tuple)", f"len({var}) == {len(hint)}"]
+            conditions += [self.expr(item, f"{var}[{idx}]") for idx, item in enumerate(hint)]
+            return "(" + " and ".join(x for x in conditions if x != "True") + ")"
+
+        if isinstance(hint, ClassTypeHint):
+            if hint.type is object:
+                return "True"
+            if hint.type is NoneType:
+                return f"{var} is None"
+            if hint.args and hint.type is type:
+                return self.subclass(hint[0], var)
+            if hint.args and hint.type is _CALLABLE:
+                return f"callable({var})"
+            return f"isinstance({var}, {self.constant(hint.type)})"
+
+        if isinstance(hint, ForwardRefTypeHint):
+            raise TypeError(f"cannot compile a checker for an unresolved forward reference: {hint}")
+
+        raise TypeError(f"cannot compile a checker for type hint {hint}")
+
+    def union(self, hint: UnionTypeHint, var: str) -> str:
+        """
+        Returns an expression that checks *var* against the members of a union. All members that can be checked
+        with `isinstance()` are combined into a single call.
+        """
+
+        classes: List[type] = []
+        conditions: List[str] = []
+        for member in hint:
+            instance_type = self.instance_type(member)
+            if instance_type is not None:
+                classes.append(instance_type)
+                continue
+            condition = self.expr(member, var)
+            if condition == "True":
+                return "True"
+            conditions.append(condition)
+        if classes:
+            conditions.insert(0, f"isinstance({var}, {self.constant(tuple(classes))})")
+        if len(conditions) == 1:
+            return conditions[0]
+        return "(" + " or ".join(conditions) + ")"
+
+    def subclass(self, hint: TypeHint, var: str) -> str:
+        """
+        Returns an expression that checks if *var* is a subclass of the type(s) described by *hint*, as in `Type[X]`.
+        """
+
+        members = list(hint) if isinstance(hint, UnionTypeHint) else [hint]
+        classes = []
+        for member in members:
+            if not isinstance(member, ClassTypeHint) or member.type is object:
+                return f"isinstance({var}, type)"
+            classes.append(member.type)
+        return f"(isinstance({var}, type) and issubclass({var}, {self.constant(tuple(classes))}))"
+
+
+def _generate(hint: TypeHint) -> Tuple[str, Dict[str, Any], str]:
+    compiler = _CheckerCompiler()
+    name = compiler.function(hint)
+    return "\n".join(compiler.lines), compiler.namespace, name
+
+
+def get_checker_source(hint: Any, source: "Any | None" = None) -> str:
+    """
+    Returns the source code that :func:`compile_checker` generates for *hint*. Useful for debugging.
+
+        >>> from typing import List, Optional
+        >>> print(get_checker_source(List[Optional[int]]))
+        def _check_0(value):
+            if not isinstance(value, _c2):
+                return False
+            for item_type in set(map(type, value)):
+                if not issubclass(item_type, _c3):
+                    return False
+            return True
+        <BLANKLINE>
+    """
+
+    return _generate(resolve_forward_refs(TypeHint(hint, source)))[0]
+
+
+def compile_checker(hint: Any, source: "Any | None" = None) -> Checker:
+    """
+    Compile a function that returns `True` if a value matches the given type hint. The generated code is specialized
+    for the type hint, making it much faster than walking the type hint tree for every value.
+
+    The following type hints are supported: classes (checked with `isinstance()`), `Any`, `None`, `Union`,
+    `Literal` (values are compared by type and value, so `True` does not match `Literal[1]`), `Annotated` (the
+    metadata is ignored), `Tuple`, `Type`, `Callable` (only checked with `callable()`), `TypedDict`, type variables
+    (checked against their bound or constraints) and parameterized collections and mappings, whose items are checked
+    as well. Other parameterized generics are only checked with `isinstance()` against their origin type.
+
+    Compiled checkers are cached per type hint.
+
+        >>> from typing import Dict, List, Union
+        >>> check = compile_checker(Dict[str, List[Union[int, str]]])
+        >>> check({"a": [1, "b"]})
+        True
+        >>> check({"a": [1.0]})
+        False
+
+    :param hint: The type hint to compile a checker for.
+    :param source: The source of the type hint, used to evaluate forward references (see :attr:`TypeHint.source`).
+    :raise TypeError: If the type hint, or a type hint nested in it, is not supported.
+    """
+
+    key: "Tuple[Any, Any] | None" = (hint, source)
+    try:
+        cached = _CACHE.get(key)
+    except TypeError:
+        key = None
+    else:
+        if cached is not None and cached[1].is_valid():
+            if instrumentation.enabled:
+                instrumentation.increment("cache.checker.hits")
+            record(cached[1].names)
+            return cached[0]
+
+    if instrumentation.enabled:
+        instrumentation.increment("cache.checker.misses")
+    with instrumentation.timed("checker.compile"):
+        with track_dependencies() as names:
+            type_hint = resolve_forward_refs(TypeHint(hint, source))
+            code, namespace, name = _generate(type_hint)
+        filename = f"<typeapi checker {next(_FILENAME_COUNTER)} for {type_repr(type_hint.hint)}>"
+        linecache.cache[filename] = (len(code), None, code.splitlines(True), filename)
+        exec(compile(code, filename, "exec"), namespace)
+        checker: Checker = namespace[name]
+        # NOTE(NiklasRosenstein): The source is kept in `linecache` for tracebacks only as long as the checker is
+        #       alive, i.e. until it is evicted from the cache (or replaced because its dependencies changed).
+        weakref.finalize(checker, linecache.cache.pop, filename, None)
+
+    if key is not None:
+        _CACHE[key] = (checker, DependencyStamp(names))
+    return checker
@@ -0,0 +1,192 @@
+import array
+import collections.abc
+import enum
+import sys
+import typing
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import pytest
+from typing_extensions import Annotated, Literal, NotRequired, TypedDict
+
+from typeapi.checker import compile_checker, get_checker_source
+from typeapi.typehint import TypeHint
+
+T = TypeVar("T")
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Box(Generic[T]):
+    pass
+
+
+class Movie(TypedDict):
+    title: str
+    year: NotRequired[int]
+    tags: List[str]
+
+
+class TypingMovie(typing.TypedDict):
+    title: str
+    year: int
+
+
+class Category(TypedDict):
+    name: str
+    children: List["Category"]
+
+
+@pytest.mark.parametrize(
+    argnames=["hint", "valid", "invalid"],
+    argvalues=[
+        (int, [0, True], ["0", None, 1.0]),
+        (TypingMovie, [{"title": "", "year": 1}], [{"title": ""}, {"title": "", "year": "1"}]),
+        (Any, [0, None, object()], []),
+        (None, [None], [0, False]),
+        (Optional[str], ["", None], [0]),
+        (Union[int, str, None], [0, "a", None], [1.0]),
+        (List[int], [[], [1, 2]], [[1, "2"], (1,), None]),
+        (Sequence[int], [[1], (1,), range(3)], [["1"], {1}]),
+        (Set[str], [set(), {"a"}], [{1}, ["a"]]),
+        (FrozenSet[int], [frozenset([1])], [{1}]),
+        (Deque[int], [collections.deque([1])], [[1]]),
+        (Dict[str, int], [{}, {"a": 1}], [{"a": "1"}, {1: 1}, []]),
+        (Mapping[str, List[int]], [{"a": [1]}], [{"a": ["1"]}]),
+        (Tuple[int, str], [(1, "a")], [(1,), (1, 2), [1, "a"]]),
+        (Tuple[int, ...], [(), (1, 2, 3)], [(1, "2"), [1]]),
+        (Tuple[()], [()], [(1,)]),
+        (Literal[1, "a"], [1, "a"], [True, 2, "b", [1]]),
+        (Literal[Color.RED], [Color.RED], [Color.GREEN, "red"]),
+        (Annotated[int, "meta"], [1], ["1"]),
+        (Type[int], [int, bool], [1, str]),
+        (Type[Any], [int, str], [1]),
+        (Callable[[int], str], [len, lambda x: x], [1]),
+        (Iterable[int], [[1], ["not checked"]], [1]),
+        (Box[int], [Box()], [1]),
+        (TypeVar("B", bound=int), [1], ["1"]),
+        (TypeVar("C", int, str), [1, "1"], [1.0]),
+        (Movie, [{"title": "a", "tags": []}, {"title": "a", "year": 1, "tags": ["b"]}], [{"title": "a"}, []]),
+        (Category, [{"name": "a", "children": [{"name": "b", "children": []}]}], [{"name": "a", "children": [1]}]),
+    ],
+)
+def test__compile_checker(hint: Any, valid: List[Any], invalid: List[Any]) -> None:
+    check = compile_checker(hint)
+    for value in valid:
+        assert check(value), (value, get_checker_source(hint))
+    for value in invalid:
+        assert not check(value), (value, get_checker_source(hint))
+
+
+def test__compile_checker__caches_checkers() -> None:
+    assert compile_checker(List[int]) is compile_checker(List[int])
+    assert compile_checker(Dict[str, Any]) is not compile_checker(Dict[str, int])
+
+
+def test__compile_checker__evaluates_forward_references() -> None:
+    check = compile_checker("List[Color] | None", sys.modules[__name__])
+    assert check([Color.RED])
+    assert check(None)
+    assert not check(["red"])
+
+    with pytest.raises(RuntimeError):
+        compile_checker(List["Color"])
+
+
+def test__compile_checker__accepts_TypeHint() -> None:
+    check = compile_checker(TypeHint(Dict[str, int]))
+    assert check({"a": 1})
+    assert not check({"a": "b"})
+
+
+def test__compile_checker__unsupported() -> None:
+    from typing_extensions import TypeAlias
+
+    with pytest.raises(TypeError):
+        compile_checker(TypeAlias)
+
+
+def test__get_checker_source__shares_functions() -> None:
+    source = get_checker_source(Tuple[List[int], List[int]])
+    assert source.count("def ") == 2
+
+
+@pytest.mark.parametrize(
+    argnames=["hint", "valid", "invalid"],
+    argvalues=[
+        (Collection[int], [array.array("i", [1, 2]), memoryview(b"ab")], [array.array("d", [1.0])]),
+        (Collection[float], [array.array("d", [1.0]), memoryview(array.array("f", [1.0]))], [memoryview(b"a")]),
+        (Collection[str], [array.array("u", "ab")], [array.array("b", [1])]),
+        (Collection[Union[int, str]], [array.array("u", "ab"), array.array("q", [1])], [array.array("d", [1.0])]),
+        (Collection[bytes], [memoryview(b"ab").cast("c")], [memoryview(b"ab")]),
+        (Collection[bool], [memoryview(b"\x00\x01").cast("?")], [memoryview(b"\x00")]),
+        (Collection[int], [memoryview(b"abcd").cast("B", shape=[2, 2]).cast("B")], []),
+        (Collection[int], [], [memoryview(b"abcd").cast("B", shape=[2, 2])]),
+        (Collection[Literal[1]], [], [memoryview(b"abcd").cast("B", shape=[2, 2])]),
+    ],
+)
+def test__compile_checker__buffers(hint: Any, valid: List[Any], invalid: List[Any]) -> None:
+    check = compile_checker(hint)
+    for value in valid:
+        assert check(value), value
+        assert all(compile_checker(TypeHint(hint)[0])(x) for x in value)
+    for value in invalid:
+        assert not check(value), value
+
+
+def test__compile_checker__numpy() -> None:
+    numpy = pytest.importorskip("numpy")
+    check_floats = compile_checker(Collection[float])
+    check_ints = compile_checker(Collection[int])
+    assert check_floats(numpy.array([1.0, 2.0]))
+    assert not check_ints(numpy.array([1.0, 2.0]))
+    assert not check_ints(numpy.array([1, 2]))  # NumPy integers are not Python integers
+    assert check_ints(numpy.array([1, 2], dtype=object))
+    assert not check_ints(numpy.array(["1"], dtype=object))
+
+
+def test__compile_checker__reduces_item_types() -> None:
+    source = get_checker_source(Tuple[Union[int, str], ...])
+    assert "set(map(type, value))" in source
+    assert "_buffer_item_type" not in source
+    assert "_buffer_item_type" in get_checker_source(Collection[int])
+
+    check = compile_checker(Dict[str, Union[int, None]])
+    assert check({"a": 1, "b": None})
+    assert not check({"a": 1, "b": "c"})
+    assert not check({1: 1})
+
+
+def test__compile_checker__removes_source_from_linecache_when_checker_is_dropped() -> None:
+    import gc
+    import linecache
+
+    from typeapi.checker import _CACHE
+
+    check = compile_checker(List[Tuple[int, str]])
+    filename = check.__code__.co_filename
+    assert filename in linecache.cache
+    _CACHE.clear()
+    del check
+    gc.collect()
+    assert filename not in linecache.cache
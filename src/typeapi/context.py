@@ -0,0 +1,180 @@
+"""
+The scopes in which forward references are evaluated.
+"""
+
+import builtins
+import functools
+import sys
+import weakref
+from collections import ChainMap
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, Iterator, List, Mapping, Tuple
+
+from . import dependencies, instrumentation
+
+__all__ = ["EvaluationContext", "get_evaluation_context"]
+
+_MISSING = object()
+
+#: Caches the context of classes and modules, see :func:`get_evaluation_context`.
+_CONTEXTS: "weakref.WeakKeyDictionary[Any, EvaluationContext]" = weakref.WeakKeyDictionary()
+
+
+class EvaluationContext(Mapping[str, Any]):
+    """
+    A read-only view of a sequence of scopes in which forward references are evaluated. A name is looked up in each
+    scope in order, and finally in the :mod:`builtins`. Unlike a :class:`collections.ChainMap`, nested contexts and
+    chain maps are flattened into a single tuple of scopes when the context is created, and a lookup does not raise
+    and catch a `KeyError` for every scope that does not contain the name.
+
+        >>> import typing
+        >>> context = EvaluationContext({"x": 1}, vars(typing))
+        >>> context["x"], context["List"], context["int"]
+        (1, typing.List, <class 'int'>)
+
+    The scopes are not copied, so names that are added to them later are visible in the context. Names are looked up
+    in scopes other than plain dictionaries with their `__getitem__()`, so that e.g. the `__missing__()` method of a
+    dictionary subclass is respected.
+
+    :param scopes: The mappings to look up names in, in order.
+    :param builtins: Whether to fall back to the :mod:`builtins` for names that are not found in any scope.
+    """
+
+    __slots__ = ("scopes", "builtins", "_lookup", "_getters", "__weakref__")
+
+    def __init__(self, *scopes: Mapping[str, Any], builtins: bool = True) -> None:
+        flattened: List[Mapping[str, Any]] = []
+        for scope in scopes:
+            if isinstance(scope, EvaluationContext):
+                flattened.extend(scope.scopes)
+            elif type(scope) is ChainMap:
+                flattened.extend(scope.maps)
+            else:
+                flattened.append(scope)
+
+        #: The scopes that names are looked up in, without the builtins.
+        self.scopes: Tuple[Mapping[str, Any], ...] = tuple(flattened)
+
+        #: Whether names that are not found in any scope are looked up in the builtins.
+        self.builtins = builtins
+
+        self._lookup = self.scopes + ((_BUILTINS,) if builtins else ())
+        self._getters: Tuple[Callable[[Any, Any], Any], ...] = tuple(
+            scope.get if type(scope) in _PLAIN_MAPPINGS else functools.partial(_get_item, scope)
+            for scope in self._lookup
+        )
+
+    def __repr__(self) -> str:
+        return f"EvaluationContext(scopes={len(self.scopes)}, builtins={self.builtins})"
+
+    def __getitem__(self, key: str) -> Any:
+        for get in self._getters:
+            value = get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return any(get(key, _MISSING) is not _MISSING for get in self._getters)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys(key for scope in self._lookup for key in scope))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    @property
+    def version(self) -> int:
+        """
+        A stamp that changes when :func:`typeapi.dependencies.invalidate` is called. Together with the identity of the
+        context, it can be used as a cache key for results that are derived from the names in the context. Changes to
+        the scopes are not detected, because a name can be added and another removed without changing their size;
+        use :func:`typeapi.dependencies.invalidate` for that.
+
+            >>> from typeapi.dependencies import invalidate
+            >>> context = EvaluationContext({})
+            >>> version = context.version
+            >>> invalidate("x")
+            >>> context.version == version
+            False
+        """
+
+        return dependencies._epoch
+
+
+class _WeakNamespace(Mapping[str, Any]):
+    """
+    A read-only view of the namespace of a class or module that only keeps a weak reference to it, so that the
+    context that is cached for a class does not keep it alive. The namespace is empty once the object is collected.
+    """
+
+    __slots__ = ("_ref",)
+
+    def __init__(self, obj: "type | ModuleType") -> None:
+        self._ref = weakref.ref(obj)
+
+    def __repr__(self) -> str:
+        return f"_WeakNamespace({self._ref()!r})"
+
+    def _vars(self) -> Mapping[str, Any]:
+        obj = self._ref()
+        return {} if obj is None else vars(obj)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._vars()[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._vars().get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._vars())
+
+    def __len__(self) -> int:
+        return len(self._vars())
+
+
+_BUILTINS: Mapping[str, Any] = vars(builtins)
+
+#: The types of scopes whose `get()` method is equivalent to their `__getitem__()`.
+_PLAIN_MAPPINGS = (dict, MappingProxyType, _WeakNamespace)
+
+
+def _get_item(scope: Mapping[str, Any], key: str, default: Any) -> Any:
+    try:
+        return scope[key]
+    except KeyError:
+        return default
+
+
+def get_evaluation_context(source: "type | ModuleType") -> EvaluationContext:
+    """
+    Returns the context in which forward references in the annotations of a class or module are evaluated. The
+    context of a class is composed of the class scope and the scope of the module that contains the class (looked up
+    in `sys.modules` when the context is first created). The context is created once per class or module.
+
+        >>> class A:
+        ...     pass
+        >>> get_evaluation_context(A) is get_evaluation_context(A)
+        True
+    """
+
+    try:
+        context = _CONTEXTS[source]
+    except KeyError:
+        pass
+    else:
+        if instrumentation.enabled:
+            instrumentation.increment("cache.evaluation_context.hits")
+        return context
+
+    if instrumentation.enabled:
+        instrumentation.increment("cache.evaluation_context.misses")
+
+    if isinstance(source, ModuleType):
+        context = EvaluationContext(vars(source))
+    else:
+        # NOTE(NiklasRosenstein): The namespace of a class and usually also that of its module reference the class,
+        #       so we must not keep them alive from the cache, which is keyed by the class.
+        context = EvaluationContext(_WeakNamespace(source), _WeakNamespace(sys.modules[source.__module__]))
+    _CONTEXTS[source] = context
+    return context
@@ -0,0 +1,90 @@
+from collections import ChainMap
+from typing import List
+
+from pytest import raises
+
+from typeapi.context import EvaluationContext, get_evaluation_context
+from typeapi.typehint import TypeHint
+
+
+class Model:
+    Alias = int
+    children: "List[Model]"
+
+
+def test__EvaluationContext__looks_up_names_in_flattened_scopes_and_builtins() -> None:
+    inner = EvaluationContext({"a": 1}, ChainMap({"b": 2}, {"a": 0, "c": 3}))
+    context = EvaluationContext({"c": 4}, inner)
+    assert len(context.scopes) == 4
+    assert (context["a"], context["b"], context["c"], context["str"]) == (1, 2, 4, str)
+    assert "str" in context and "missing" not in context
+    with raises(KeyError):
+        context["missing"]
+
+
+def test__EvaluationContext__without_builtins() -> None:
+    context = EvaluationContext({"a": 1}, builtins=False)
+    assert "int" not in context
+    assert list(context) == ["a"]
+    with raises(KeyError):
+        TypeHint("int").evaluate(context)
+
+
+def test__TypeHint__get_context__reuses_the_context_of_a_class() -> None:
+    context = TypeHint("Alias", Model).get_context()
+    assert context is get_evaluation_context(Model)
+    assert context["Alias"] is int
+    assert context["List"] is List
+    assert TypeHint("Alias", Model).evaluate() == TypeHint(int)
+
+
+class LazyScope(dict):  # type: ignore[type-arg]
+    def __missing__(self, key: str) -> type:
+        if key == "Foo":
+            return type("Foo", (), {})
+        raise KeyError(key)
+
+
+def test__EvaluationContext__uses_getitem_of_dict_subclasses() -> None:
+    context = EvaluationContext(LazyScope())
+    assert context["Foo"].__name__ == "Foo"
+    assert "Foo" in context
+    assert "Bar" not in context
+
+
+def test__TypeHint__evaluate__uses_getitem_of_dict_subclasses() -> None:
+    hint = TypeHint("list[Foo]").evaluate(LazyScope())
+    assert hint.args[0].__name__ == "Foo"
+    with raises(KeyError):
+        TypeHint("list[Bar]").evaluate(LazyScope())
+
+
+def test__get_evaluation_context__does_not_keep_the_class_alive() -> None:
+    import gc
+    import weakref
+
+    cls = type("Temporary", (), {"__module__": __name__, "Alias": int})
+    assert TypeHint("List[Alias]", cls).evaluate() == TypeHint(List[int])
+    ref = weakref.ref(cls)
+    del cls
+    gc.collect()
+    assert ref() is None
+
+
+def test__get_evaluation_context__does_not_keep_the_class_alive_through_its_module() -> None:
+    import gc
+    import sys
+    import types
+    import weakref
+
+    module = types.ModuleType("typeapi_test_context_temporary")
+    sys.modules[module.__name__] = module
+    try:
+        exec("from typing import List\nclass Temporary:\n    Alias = int\n", vars(module))
+        assert TypeHint("List[Alias]", module.Temporary).evaluate() == TypeHint(List[int])
+        ref = weakref.ref(module.Temporary)
+    finally:
+        del sys.modules[module.__name__]
+    del module
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,103 @@
+"""
+Track which names the evaluation of forward references depends on.
+
+Caches in :mod:`typeapi` whose entries are computed by evaluating forward references record the names that were
+looked up in the evaluation context, such as the names of the classes that a string annotation refers to. When the
+object behind a name changes, for example because a module was reloaded or a class was patched in a test, calling
+:func:`invalidate` with that name invalidates only the cache entries that depend on it.
+
+    >>> import importlib, typeapi.dependencies
+    >>> module = importlib.reload(module)  # doctest: +SKIP
+    >>> typeapi.dependencies.invalidate(*vars(module))  # doctest: +SKIP
+"""
+
+import contextlib
+import threading
+from typing import Dict, Iterable, Iterator, List, Set
+
+__all__ = ["DependencyStamp", "invalidate", "record", "track_dependencies"]
+
+_local = threading.local()
+
+#: The number of times that each name was invalidated.
+_generations: Dict[str, int] = {}
+
+#: The number of times that :func:`invalidate` was called. Used to validate stamps in constant time if no names were
+#: invalidated since the stamp was last validated.
+_epoch = 0
+
+
+def _get_stack() -> List[Set[str]]:
+    try:
+        return _local.stack  # type: ignore[no-any-return]
+    except AttributeError:
+        _local.stack = []
+        return _local.stack  # type: ignore[no-any-return]
+
+
+@contextlib.contextmanager
+def track_dependencies() -> Iterator[Set[str]]:
+    """
+    A context manager that collects the names that are recorded with :func:`record` in the current thread while the
+    context manager is active. Contexts can be nested; names are added to all active contexts.
+    """
+
+    names: Set[str] = set()
+    stack = _get_stack()
+    stack.append(names)
+    try:
+        yield names
+    finally:
+        # NOTE(NiklasRosenstein): Sets compare by value, so `list.remove()` could remove an equal set of an enclosing
+        #       context instead.
+        del stack[next(i for i in reversed(range(len(stack))) if stack[i] is names)]
+
+
+def record(names: Iterable[str]) -> None:
+    """
+    Records that the current computation depends on *names*. This is called for every name that is looked up in the
+    evaluation of a forward reference.
+    """
+
+    for collected in _get_stack():
+        collected.update(names)
+
+
+def invalidate(*names: str) -> None:
+    """
+    Invalidates all cache entries that depend on any of the given *names*.
+    """
+
+    global _epoch
+    for name in names:
+        _generations[name] = _generations.get(name, 0) + 1
+    _epoch += 1
+
+
+class DependencyStamp:
+    """
+    Captures the state of a set of names at the time that a cache entry was computed. The stamp becomes invalid when
+    any of the names is passed to :func:`invalidate`.
+    """
+
+    __slots__ = ("names", "generations", "epoch")
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names = tuple(names)
+        self.generations = tuple(_generations.get(x, 0) for x in self.names)
+        self.epoch = _epoch
+
+    def __repr__(self) -> str:
+        return f"DependencyStamp(names={self.names!r}, valid={self.is_valid()})"
+
+    def is_valid(self) -> bool:
+        """
+        Returns `True` if none of the names were invalidated since the stamp was created.
+        """
+
+        if self.epoch == _epoch:
+            return True
+        if any(_generations.get(x, 0) != y for x, y in zip(self.names, self.generations)):
+            return False
+        self.epoch = _epoch
+        return True
@@ -0,0 +1,73 @@
+import dataclasses
+import sys
+from typing import Any
+
+from pytest import MonkeyPatch
+
+from typeapi.checker import compile_checker
+from typeapi.dependencies import DependencyStamp, invalidate, record, track_dependencies
+from typeapi.fields import get_fields
+from typeapi.typehint import TypeHint
+
+
+class Target:
+    pass
+
+
+@dataclasses.dataclass
+class Holder:
+    target: "Target"
+
+
+@dataclasses.dataclass
+class Unrelated:
+    value: "int"
+
+
+def test__track_dependencies__records_names_of_evaluated_forward_references() -> None:
+    with track_dependencies() as outer:
+        with track_dependencies() as inner:
+            TypeHint("Target", sys.modules[__name__]).evaluate()
+        record(["other"])
+    assert inner == {"Target"}
+    assert outer == {"Target", "other"}
+
+
+def test__DependencyStamp__is_invalidated_by_its_names_only() -> None:
+    stamp = DependencyStamp(["a", "b"])
+    assert stamp.is_valid()
+    invalidate("c")
+    assert stamp.is_valid()
+    invalidate("b")
+    assert not stamp.is_valid()
+
+
+def test__get_fields__is_recomputed_after_invalidate(monkeypatch: MonkeyPatch) -> None:
+    fields = get_fields(Holder)
+    unrelated = get_fields(Unrelated)
+    assert fields[0].hint == TypeHint(Target)
+
+    class NewTarget:
+        pass
+
+    monkeypatch.setattr(sys.modules[__name__], "Target", NewTarget)
+    assert get_fields(Holder) is fields
+
+    invalidate("Target")
+    assert get_fields(Holder)[0].hint == TypeHint(NewTarget)
+    assert get_fields(Unrelated) is unrelated
+
+
+def test__compile_checker__is_recompiled_after_invalidate(monkeypatch: MonkeyPatch) -> None:
+    module: Any = sys.modules[__name__]
+    checker = compile_checker("Target", module)
+    assert checker(Target())
+
+    class NewTarget:
+        pass
+
+    monkeypatch.setattr(module, "Target", NewTarget)
+    assert compile_checker("Target", module) is checker
+
+    invalidate("Target")
+    assert compile_checker("Target", module)(NewTarget())
@@ -0,0 +1,227 @@
+"""
+Dispatch on type hints instead of the types of values.
+
+:func:`functools.singledispatch` selects an implementation by the class of its first argument and does not
+understand parameterized generics, unions or literals. :class:`TypeHintDispatcher` selects a handler for a type hint
+instead, e.g. to pick the (de)serializer for the annotation of a field.
+"""
+
+import typing
+from typing import Any, Callable, Dict, Generic, List, Tuple, TypeVar, Union, overload
+
+import typing_extensions
+
+from . import instrumentation
+from .typehint import (
+    AnnotatedTypeHint,
+    ClassTypeHint,
+    LiteralTypeHint,
+    ProtocolTypeHint,
+    TypedDictTypeHint,
+    TypeHint,
+    TypeVarTypeHint,
+    UnionTypeHint,
+    _is_protocol,
+)
+from .utils import is_typed_dict
+
+__all__ = ["TypeHintDispatcher"]
+
+R = TypeVar("R")
+Handler = Callable[..., R]
+
+#: The special forms that can be registered to handle all type hints of their kind. `typing_extensions` may provide
+#: its own implementations of the special forms on older versions of Python.
+_SPECIAL_FORMS: Dict[Any, type] = {
+    Union: UnionTypeHint,
+    typing_extensions.Literal: LiteralTypeHint,
+    typing_extensions.Annotated: AnnotatedTypeHint,
+}
+if hasattr(typing, "Literal"):
+    _SPECIAL_FORMS[typing.Literal] = LiteralTypeHint
+if hasattr(typing, "Annotated"):
+    _SPECIAL_FORMS[typing.Annotated] = AnnotatedTypeHint
+
+
+class TypeHintDispatcher(Generic[R]):
+    """
+    A registry of handlers for type hints. Handlers can be registered for classes, parameterized generics (e.g.
+    `List[int]`), unions, literals and `Annotated` hints, as well as for `Union`, `Literal` and `Annotated` themselves
+    to handle all type hints of that kind. :meth:`dispatch` selects the handler for a type hint as follows:
+
+    1. A handler registered for exactly the same type hint.
+    2. For `Annotated` hints, a handler for `Annotated`, otherwise the handler for the wrapped type.
+    3. For unions and literals, a handler for `Union` or `Literal`, respectively. Literals whose values all have the
+       same type further fall back to the handler for that type, all other unions and literals to the handler for
+       `object`.
+    4. For type variables, the handler for their bound, or `object` if they have none.
+    5. For classes, the first base class in the order of :meth:`ClassTypeHint.recurse_bases` for which a handler is
+       registered, either in the same parameterization or unparameterized. Abstract base classes that the class is
+       registered with, such as :class:`collections.abc.Sequence` for `list`, are considered after the real base
+       classes. Their type arguments are compared positionally. A `TypedDict` falls back to the handlers of `dict`,
+       a protocol to the handler for `object`.
+    6. The *default* handler.
+
+        >>> from typing import List, Sequence
+        >>> encode = TypeHintDispatcher()
+        >>> @encode.register(Sequence)
+        ... def _(hint, value):
+        ...     return [encode(hint[0], x) for x in value] if hint.args else list(value)
+        >>> @encode.register(List[bool])
+        ... def _(hint, value):
+        ...     return [int(x) for x in value]
+        >>> @encode.register(object)
+        ... def _(hint, value):
+        ...     return value
+        >>> encode(List[int], [1, 2]), encode(List[bool], [True, False])
+        ([1, 2], [1, 0])
+
+    Handlers are called with the :class:`TypeHint` that was dispatched on, followed by any further arguments. The
+    resolution for every distinct type hint is cached until the next handler is registered.
+
+    :param default: The handler that is used if no other handler matches a type hint.
+    """
+
+    def __init__(self, default: "Handler[R] | None" = None) -> None:
+        self._default = default
+        self._handlers: Dict[Any, Handler[R]] = {}
+        self._special: Dict[type, Handler[R]] = {}
+        self._by_type: Dict[type, Dict[Tuple[Any, ...], Handler[R]]] = {}
+        self._cache: Dict[Any, "Handler[R] | None"] = {}
+
+    def __repr__(self) -> str:
+        return f"TypeHintDispatcher(handlers={len(self._handlers) + len(self._special)})"
+
+    @overload
+    def register(self, hint: Any) -> Callable[[Handler[R]], Handler[R]]: ...
+
+    @overload
+    def register(self, hint: Any, func: Handler[R]) -> Handler[R]: ...
+
+    def register(
+        self, hint: Any, func: "Handler[R] | None" = None
+    ) -> "Handler[R] | Callable[[Handler[R]], Handler[R]]":
+        """
+        Register *func* as the handler for *hint*. If *func* is not specified, returns a decorator.
+
+        :raise TypeError: If *hint* is not hashable.
+        """
+
+        if func is None:
+            return lambda func: self.register(hint, func)
+
+        try:
+            kind = _SPECIAL_FORMS.get(hint)
+        except TypeError:
+            kind = None
+        if kind is not None:
+            self._special[kind] = func
+        else:
+            type_hint = hint if isinstance(hint, TypeHint) else TypeHint(hint)
+            try:
+                self._handlers[type_hint.hint] = func
+            except TypeError:
+                raise TypeError(f"cannot register handler for unhashable type hint {type_hint}")
+            if isinstance(type_hint, ClassTypeHint):
+                self._by_type.setdefault(type_hint.type, {})[type_hint.args] = func
+
+        self._cache.clear()
+        return func
+
+    def dispatch(self, hint: Any) -> Handler[R]:
+        """
+        Returns the handler for *hint*.
+
+        :raise TypeError: If no handler matches *hint* and the dispatcher has no default handler.
+        """
+
+        type_hint = hint if isinstance(hint, TypeHint) else TypeHint(hint)
+        try:
+            handler = self._cache[type_hint.hint]
+        except KeyError:
+            if instrumentation.enabled:
+                instrumentation.increment("cache.dispatch.misses")
+            handler = self._cache[type_hint.hint] = self._resolve(type_hint)
+        except TypeError:
+            handler = self._resolve(type_hint)
+        else:
+            if instrumentation.enabled:
+                instrumentation.increment("cache.dispatch.hits")
+
+        if handler is None:
+            handler = self._default
+        if handler is None:
+            raise TypeError(f"no handler registered for {type_hint}")
+        return handler
+
+    def __call__(self, hint: Any, *args: Any, **kwargs: Any) -> R:
+        """
+        Calls the handler for *hint* with the :class:`TypeHint` for *hint* and the remaining arguments.
+        """
+
+        type_hint = hint if isinstance(hint, TypeHint) else TypeHint(hint)
+        return self.dispatch(type_hint)(type_hint, *args, **kwargs)
+
+    def _resolve(self, hint: TypeHint) -> "Handler[R] | None":
+        try:
+            return self._handlers[hint.hint]
+        except (KeyError, TypeError):
+            pass
+
+        special = self._special.get(type(hint))
+        if special is not None:
+            return special
+
+        if isinstance(hint, AnnotatedTypeHint):
+            return self._resolve(TypeHint(hint.type))
+        if isinstance(hint, LiteralTypeHint):
+            types = {type(x) for x in hint.flat_values}
+            if len(types) == 1:
+                return self._resolve(TypeHint(types.pop()))
+        if isinstance(hint, (UnionTypeHint, LiteralTypeHint)):
+            return self._resolve(TypeHint(object))
+        if isinstance(hint, TypeVarTypeHint):
+            return self._resolve(TypeHint(object if hint.bound is None else hint.bound))
+        if isinstance(hint, ClassTypeHint):
+            for type_, args in self._linearize(hint):
+                handlers = self._by_type.get(type_)
+                if handlers is not None:
+                    handler = handlers.get(args) or handlers.get(())
+                    if handler is not None:
+                        return handler
+        return None
+
+    def _linearize(self, hint: ClassTypeHint) -> List[Tuple[type, Tuple[Any, ...]]]:
+        """
+        Returns the base classes of *hint* that are relevant for the dispatch, as pairs of the class and its type
+        arguments, in the order in which they are considered.
+        """
+
+        # NOTE(NiklasRosenstein): The bases of a `TypedDict` or a protocol are not real base classes, and
+        #       `recurse_bases()` can not parameterize them. They fall back to their runtime base class instead.
+        if isinstance(hint, TypedDictTypeHint):
+            return [(hint.type, hint.args), *self._linearize(ClassTypeHint(dict))]
+        if isinstance(hint, ProtocolTypeHint):
+            return [(hint.type, hint.args), (object, ())]
+
+        result = [(base.type, base.args) for base in hint.recurse_bases() if base.type is not object]
+        bases = {type_ for type_, _ in result}
+
+        # Classes can be registered with abstract base classes without inheriting from them. Like in the MRO that
+        # `functools.singledispatch` computes, they come before `object` and the most derived ones come first.
+        virtual = [x for x in self._by_type if x not in bases and x is not object and _is_virtual_base(hint.type, x)]
+        virtual.sort(key=lambda x: len(x.__mro__), reverse=True)
+        result += [(x, hint.args) for x in virtual]
+        result.append((object, ()))
+        return result
+
+
+def _is_virtual_base(cls: type, base: type) -> bool:
+    # NOTE(NiklasRosenstein): `TypedDict` classes and protocols that are not `runtime_checkable` (or that have data
+    #       members) raise a `TypeError` in `issubclass()`. They are matched structurally, never as a virtual base.
+    if is_typed_dict(base) or _is_protocol(base):
+        return False
+    try:
+        return issubclass(cls, base)
+    except TypeError:
+        return False
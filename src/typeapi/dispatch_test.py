@@ -0,0 +1,136 @@
+import collections.abc
+from typing import Any, Dict, Generic, List, Mapping, Optional, Sequence, TypeVar, Union
+
+import pytest
+from typing_extensions import Annotated, Literal, Protocol, TypedDict
+
+from typeapi.dispatch import TypeHintDispatcher
+from typeapi.typehint import TypeHint
+
+T = TypeVar("T")
+B = TypeVar("B", bound=int)
+
+
+class Box(Generic[T]):
+    pass
+
+
+class IntBox(Box[int]):
+    pass
+
+
+class Point:
+    pass
+
+
+def _name(name: str) -> Any:
+    return lambda hint: name
+
+
+@pytest.fixture
+def dispatcher() -> TypeHintDispatcher[str]:
+    dispatcher: TypeHintDispatcher[str] = TypeHintDispatcher(_name("default"))
+    dispatcher.register(object, _name("object"))
+    dispatcher.register(int, _name("int"))
+    dispatcher.register(List[int], _name("List[int]"))
+    dispatcher.register(Sequence, _name("Sequence"))
+    dispatcher.register(Sequence[str], _name("Sequence[str]"))
+    dispatcher.register(Mapping, _name("Mapping"))
+    dispatcher.register(Box, _name("Box"))
+    dispatcher.register(Box[int], _name("Box[int]"))
+    dispatcher.register(Union, _name("Union"))
+    dispatcher.register(Optional[int], _name("Optional[int]"))
+    dispatcher.register(Literal["a"], _name("Literal['a']"))
+    dispatcher.register(Annotated[int, "meta"], _name("Annotated[int, 'meta']"))
+    return dispatcher
+
+
+@pytest.mark.parametrize(
+    "hint,expected",
+    [
+        (int, "int"),
+        (bool, "int"),
+        (Point, "object"),
+        (List[int], "List[int]"),
+        (List[str], "Sequence[str]"),
+        (List[float], "Sequence"),
+        (list, "Sequence"),
+        (Dict[str, int], "Mapping"),
+        (collections.abc.Sequence, "Sequence"),
+        (Box[str], "Box"),
+        (Box[int], "Box[int]"),
+        (IntBox, "Box[int]"),
+        (Optional[int], "Optional[int]"),
+        (Union[int, str], "Union"),
+        (Literal["a"], "Literal['a']"),
+        (Literal["a", "b"], "Sequence"),
+        (Literal[1.0, 2.0], "object"),
+        (Literal[1, "a"], "object"),
+        (Literal[1, 2], "int"),
+        (Annotated[int, "meta"], "Annotated[int, 'meta']"),
+        (Annotated[bool, "meta"], "int"),
+        (Annotated[List[int], "meta"], "List[int]"),
+        (B, "int"),
+        (T, "object"),
+    ],
+)
+def test__TypeHintDispatcher__dispatch(dispatcher: TypeHintDispatcher[str], hint: Any, expected: str) -> None:
+    assert dispatcher(hint) == expected
+
+
+def test__TypeHintDispatcher__special_forms(dispatcher: TypeHintDispatcher[str]) -> None:
+    dispatcher.register(Literal, _name("Literal"))
+    dispatcher.register(Annotated, _name("Annotated"))
+    assert dispatcher(Literal["a"]) == "Literal['a']"
+    assert dispatcher(Literal[1, 2]) == "Literal"
+    assert dispatcher(Annotated[int, "meta"]) == "Annotated[int, 'meta']"
+    assert dispatcher(Annotated[int, "other"]) == "Annotated"
+
+
+def test__TypeHintDispatcher__default() -> None:
+    dispatcher: TypeHintDispatcher[str] = TypeHintDispatcher()
+    dispatcher.register(int, _name("int"))
+    assert dispatcher.dispatch(TypeHint(bool))(TypeHint(bool)) == "int"
+    with pytest.raises(TypeError):
+        dispatcher.dispatch(str)
+
+
+def test__TypeHintDispatcher__register_invalidates_cache(dispatcher: TypeHintDispatcher[str]) -> None:
+    assert dispatcher(bool) == "int"
+    dispatcher.register(bool, _name("bool"))
+    assert dispatcher(bool) == "bool"
+
+
+class Movie(TypedDict):
+    title: str
+
+
+class HasName(Protocol):
+    name: str
+
+
+def test__TypeHintDispatcher__typed_dicts_and_protocols_do_not_break_dispatch_on_classes() -> None:
+    dispatcher: TypeHintDispatcher[str] = TypeHintDispatcher(_name("default"))
+    dispatcher.register(Movie, _name("Movie"))
+    dispatcher.register(HasName, _name("HasName"))
+    dispatcher.register(int, _name("int"))
+    dispatcher.register(Sequence, _name("Sequence"))
+    assert dispatcher(Movie) == "Movie"
+    assert dispatcher(HasName) == "HasName"
+    assert dispatcher(bool) == "int"
+    assert dispatcher(str) == "Sequence"
+    assert dispatcher(Point) == "default"
+
+
+def test__TypeHintDispatcher__typed_dicts_and_protocols_fall_back_to_their_runtime_base(
+    dispatcher: TypeHintDispatcher[str],
+) -> None:
+    assert dispatcher(Movie) == "Mapping"
+    assert dispatcher(HasName) == "object"
+
+
+def test__TypeHintDispatcher__unions_fall_back_to_object() -> None:
+    dispatcher: TypeHintDispatcher[str] = TypeHintDispatcher()
+    dispatcher.register(object, _name("object"))
+    assert dispatcher(Union[int, str]) == "object"
+    assert dispatcher(Literal[1, "a"]) == "object"
@@ -0,0 +1,177 @@
+"""
+Extract the fields of dataclasses, named tuples and `attrs` classes.
+"""
+
+import dataclasses
+import sys
+from typing import Any, Dict, NamedTuple, Tuple
+
+from . import instrumentation
+from .context import get_evaluation_context
+from .dependencies import DependencyStamp, record, track_dependencies
+from .transform import resolve_forward_refs
+from .typehint import ClassVarTypeHint, TypeHint
+from .utils import get_annotations
+
+__all__ = ["Field", "MISSING", "get_fields"]
+
+#: The value of :attr:`Field.default` and :attr:`Field.default_factory` if the field has no default.
+MISSING: Any = dataclasses.MISSING
+
+# NOTE(NiklasRosenstein): The fields are cached on the class itself instead of in a `WeakKeyDictionary`, because
+#       the fields reference the class (e.g. as the source of their hints or through a recursive annotation), which
+#       would keep the class alive forever.
+_CACHE_ATTRIBUTE = "__typeapi_fields__"
+
+
+class Field(NamedTuple):
+    """Describes a field of a dataclass, named tuple or `attrs` class."""
+
+    #: The name of the field.
+    name: str
+
+    #: The type hint of the field, without a `ClassVar` or `InitVar` wrapper.
+    hint: TypeHint
+
+    #: The default value of the field, or :data:`MISSING`.
+    default: Any = MISSING
+
+    #: A function that returns the default value of the field, or :data:`MISSING`.
+    default_factory: Any = MISSING
+
+    #: Whether the field is annotated as `ClassVar`. Such fields are not passed to the constructor.
+    class_var: bool = False
+
+    #: Whether the field is annotated as a dataclass `InitVar`. Such fields are only passed to the constructor.
+    init_var: bool = False
+
+    #: Whether the field can only be passed to the constructor as a keyword argument.
+    kw_only: bool = False
+
+
+def get_fields(cls: type) -> Tuple[Field, ...]:
+    """
+    Returns the fields of a dataclass, a named tuple or an `attrs` class in the order in which they are accepted by
+    the class's constructor. Fields of dataclasses that are annotated as `ClassVar` are included as well. The type
+    hints of the fields are taken from :func:`get_annotations` with base classes included, so forward references are
+    evaluated. The result is computed once per class.
+
+        >>> from dataclasses import dataclass, field
+        >>> from typing import List
+        >>> @dataclass
+        ... class Person:
+        ...     name: str
+        ...     tags: List[str] = field(default_factory=list)
+        >>> [(x.name, x.hint) for x in get_fields(Person)]
+        [('name', TypeHint(str)), ('tags', TypeHint(typing.List[str]))]
+        >>> get_fields(Person)[1].default_factory
+        <class 'list'>
+
+    :raise TypeError: If *cls* is not a dataclass, a named tuple or an `attrs` class.
+    """
+
+    cached: "Tuple[Tuple[Field, ...], DependencyStamp] | None" = vars(cls).get(_CACHE_ATTRIBUTE)
+    if cached is not None and cached[1].is_valid():
+        if instrumentation.enabled:
+            instrumentation.increment("cache.fields.hits")
+        record(cached[1].names)
+        return cached[0]
+
+    if instrumentation.enabled:
+        instrumentation.increment("cache.fields.misses")
+    with track_dependencies() as names:
+        if dataclasses.is_dataclass(cls):
+            fields = _get_dataclass_fields(cls)
+        elif issubclass(cls, tuple) and hasattr(cls, "_fields"):
+            fields = _get_named_tuple_fields(cls, _get_annotations_with_owner(cls))
+        elif hasattr(cls, "__attrs_attrs__"):
+            fields = _get_attrs_fields(cls, _get_annotations_with_owner(cls))
+        else:
+            raise TypeError(f"expected a dataclass, named tuple or attrs class, got {cls!r}")
+
+    try:
+        setattr(cls, _CACHE_ATTRIBUTE, (fields, DependencyStamp(names)))
+    except (AttributeError, TypeError):
+        pass
+    return fields
+
+
+def _get_annotations_with_owner(cls: type) -> Dict[str, Tuple[Any, type]]:
+    """
+    Returns the annotations of *cls* and its bases together with the class that declares them. Forward references
+    nested in an annotation must be evaluated in the scope of that class, which may live in another module.
+    """
+
+    result: Dict[str, Tuple[Any, type]] = {}
+    for owner in reversed(cls.__mro__):
+        if "__annotations__" in vars(owner):
+            result.update({name: (hint, owner) for name, hint in get_annotations(owner).items()})
+    return result
+
+
+def _get_dataclass_annotation(cls: type, name: str, default: Any) -> Tuple[Any, type]:
+    # NOTE(NiklasRosenstein): We can't use `get_annotations()`, because `InitVar[...]` is not a type hint and can't
+    #       be wrapped in a `TypeHint` when it is evaluated from a string (e.g. with `from __future__ import
+    #       annotations`). Instead, only the outermost expression is evaluated here, in the scope of the class that
+    #       declares the field, so that `InitVar` and `ClassVar` can be detected before a `TypeHint` is created.
+    from .future.fake import FakeProvider
+
+    owner = next((x for x in cls.__mro__ if name in vars(x).get("__annotations__", {})), None)
+    if owner is None:
+        return default, cls
+    annotation = vars(owner)["__annotations__"][name]
+    if isinstance(annotation, str):
+        annotation = FakeProvider(get_evaluation_context(owner)).execute(annotation).evaluate()
+    return annotation, owner
+
+
+def _get_dataclass_fields(cls: type) -> Tuple[Field, ...]:
+    result = []
+    for field in cls.__dataclass_fields__.values():  # type: ignore[attr-defined]
+        annotation, owner = _get_dataclass_annotation(cls, field.name, field.type)
+        init_var = isinstance(annotation, dataclasses.InitVar) or annotation is dataclasses.InitVar
+        if init_var:
+            annotation = getattr(annotation, "type", Any)
+        hint = TypeHint(annotation, owner)
+        class_var = isinstance(hint, ClassVarTypeHint)
+        if class_var:
+            hint = TypeHint(hint.args[0], owner) if hint.args else TypeHint(Any)
+        result.append(
+            Field(
+                field.name,
+                resolve_forward_refs(hint),
+                field.default,
+                field.default_factory,
+                class_var,
+                init_var,
+                getattr(field, "kw_only", False) is True,
+            )
+        )
+    return tuple(result)
+
+
+def _get_named_tuple_fields(cls: type, annotations: Dict[str, Tuple[Any, type]]) -> Tuple[Field, ...]:
+    defaults = getattr(cls, "_field_defaults", {})
+    return tuple(
+        Field(name, resolve_forward_refs(TypeHint(*annotations.get(name, (Any, cls)))), defaults.get(name, MISSING))
+        for name in cls._fields  # type: ignore[attr-defined]
+    )
+
+
+def _get_attrs_fields(cls: type, annotations: Dict[str, Tuple[Any, type]]) -> Tuple[Field, ...]:
+    # NOTE(NiklasRosenstein): If the class has `attrs` attributes, the `attr` module has been imported.
+    attr = sys.modules["attr"]
+
+    result = []
+    for attribute in cls.__attrs_attrs__:  # type: ignore[attr-defined]
+        default_hint = (Any if attribute.type is None else attribute.type, cls)
+        hint = TypeHint(*annotations.get(attribute.name, default_hint))
+        default, default_factory = attribute.default, MISSING
+        if isinstance(default, attr.Factory):
+            default, default_factory = MISSING, default.factory
+        elif default is attr.NOTHING:
+            default = MISSING
+        result.append(
+            Field(attribute.name, resolve_forward_refs(hint), default, default_factory, kw_only=attribute.kw_only)
+        )
+    return tuple(result)
@@ -0,0 +1,166 @@
+import dataclasses
+import sys
+import types
+from collections import namedtuple
+from typing import Any, ClassVar, Dict, List, NamedTuple, Optional
+
+import pytest
+
+from typeapi.fields import MISSING, Field, get_fields
+from typeapi.typehint import TypeHint
+
+
+@dataclasses.dataclass
+class Base:
+    id: int
+    parent: "Optional[Base]" = None
+
+
+@dataclasses.dataclass
+class Child(Base):
+    registry: ClassVar[Dict[str, "Child"]] = {}
+    tags: List[str] = dataclasses.field(default_factory=list)
+    secret: dataclasses.InitVar[str] = ""
+
+
+class Point(NamedTuple):
+    x: int
+    y: "float" = 0.0
+
+
+def test__get_fields__dataclass() -> None:
+    assert get_fields(Child) == (
+        Field("id", TypeHint(int)),
+        Field("parent", TypeHint(Optional[Base]), None),
+        Field("registry", TypeHint(Dict[str, Child]), {}, class_var=True),
+        Field("tags", TypeHint(List[str]), default_factory=list),
+        Field("secret", TypeHint(str), "", init_var=True),
+    )
+    assert get_fields(Child) is get_fields(Child)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="kw_only requires Python 3.10")
+def test__get_fields__dataclass_kw_only() -> None:
+    @dataclasses.dataclass(kw_only=True)  # type: ignore[call-overload,misc]
+    class Options:
+        verbose: bool = False
+
+    assert get_fields(Options) == (Field("verbose", TypeHint(bool), False, kw_only=True),)
+
+
+def test__get_fields__named_tuple() -> None:
+    assert get_fields(Point) == (Field("x", TypeHint(int)), Field("y", TypeHint(float), 0.0))
+    Pair = namedtuple("Pair", ["a", "b"], defaults=[1])
+    assert get_fields(Pair) == (Field("a", TypeHint(Any)), Field("b", TypeHint(Any), 1))
+
+
+def test__get_fields__attrs() -> None:
+    attr = pytest.importorskip("attr")
+
+    @attr.define
+    class Config:
+        name: str
+        values: List[int] = attr.field(factory=list)
+        debug: bool = attr.field(default=False, kw_only=True)
+
+    assert get_fields(Config) == (
+        Field("name", TypeHint(str)),
+        Field("values", TypeHint(List[int]), default_factory=list),
+        Field("debug", TypeHint(bool), False, kw_only=True),
+    )
+
+
+def test__get_fields__unsupported() -> None:
+    with pytest.raises(TypeError):
+        get_fields(int)
+    assert MISSING is dataclasses.MISSING
+
+
+_PEP563_SOURCE = """
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import InitVar
+from typing import ClassVar, List, Optional
+
+
+@dataclasses.dataclass
+class Node:
+    registry: ClassVar[List[Node]] = []
+    name: str = ""
+    parent: Optional[Node] = None
+    secret: InitVar[str] = ""
+    token: dataclasses.InitVar[Optional[int]] = None
+"""
+
+
+def test__get_fields__dataclass_with_postponed_annotations(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = types.ModuleType("typeapi_test_pep563")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    exec(compile(_PEP563_SOURCE, module.__name__, "exec"), vars(module))
+    Node: Any = module.Node
+
+    assert get_fields(Node) == (
+        Field("registry", TypeHint(List[Node]), [], class_var=True),
+        Field("name", TypeHint(str), ""),
+        Field("parent", TypeHint(Optional[Node]), None),
+        Field("secret", TypeHint(str), "", init_var=True),
+        Field("token", TypeHint(Optional[int]), None, init_var=True),
+    )
+
+
+_BASE_SOURCE = """
+import dataclasses
+from typing import List, NamedTuple
+
+
+class Local:
+    pass
+
+
+@dataclasses.dataclass
+class DataBase:
+    items: List["Local"]
+
+
+class TupleBase(NamedTuple):
+    items: List["Local"]
+"""
+
+
+def test__get_fields__evaluates_inherited_fields_in_the_scope_of_the_declaring_class(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = types.ModuleType("typeapi_test_fields_base")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    exec(compile(_BASE_SOURCE, module.__name__, "exec"), vars(module))
+
+    @dataclasses.dataclass
+    class Data(module.DataBase):  # type: ignore[name-defined,misc]
+        name: str = ""
+
+    class Tuple(module.TupleBase):  # type: ignore[name-defined,misc]
+        pass
+
+    Local: Any = module.Local
+    assert [x.hint for x in get_fields(Data)] == [TypeHint(List[Local]), TypeHint(str)]
+    assert [x.hint for x in get_fields(Tuple)] == [TypeHint(List[Local])]
+
+
+def test__get_fields__does_not_keep_the_class_alive() -> None:
+    import gc
+    import weakref
+
+    module = types.ModuleType("typeapi_test_fields_temporary")
+    sys.modules[module.__name__] = module
+    try:
+        source = "import dataclasses\n@dataclasses.dataclass\nclass Temporary:\n    parent: 'Temporary'\n"
+        exec(compile(source, module.__name__, "exec"), vars(module))
+        assert get_fields(module.Temporary) is get_fields(module.Temporary)
+        assert get_fields(module.Temporary)[0].hint == TypeHint(module.Temporary)
+        ref = weakref.ref(module.Temporary)
+    finally:
+        del sys.modules[module.__name__]
+    del module
+    gc.collect()
+    assert ref() is None
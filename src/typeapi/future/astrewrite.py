@@ -4,7 +4,6 @@ Rewrite a Python AST to make name lookups, writes and deletes delegate to a sing
 
 import ast
 import contextlib
-import dataclasses
 import typing as t
 from types import CodeType
 
@@ -24,25 +23,38 @@ def rewrite_expr(source: str, lookup_target: str) -> CodeType:
     return t.cast(CodeType, compile(expr, "<expr>", "eval"))  # type: ignore[redundant-cast]  # Redundant in 3.7+
 
 
-@dataclasses.dataclass
 class DynamicLookupRewriter(ast.NodeTransformer):
     # TODO(NiklasRosenstein): Handle more nodes that define local variables and := operator.
 
-    #: The variable name of the target object that name resolution should occur through.
-    #: All names in the AST, with a few exceptions, will be replaced by a getitem/setitem/delitem
-    #: expression on the variable name defined here.
-    lookup_target: str
+    # NOTE(NiklasRosenstein): This is not a dataclass, because importing :mod:`dataclasses` would add to the cost
+    #       of the first evaluation of a forward reference.
 
-    #: Names to not replace. The #lookup_target does not need to be added here explicitly.
-    pure_builtins: t.Collection[str] = dataclasses.field(default_factory=frozenset)
+    def __init__(
+        self,
+        lookup_target: str,
+        pure_builtins: "t.Collection[str] | None" = None,
+        ignore_prefix: "str | None" = None,
+    ) -> None:
+        #: The variable name of the target object that name resolution should occur through.
+        #: All names in the AST, with a few exceptions, will be replaced by a getitem/setitem/delitem
+        #: expression on the variable name defined here.
+        self.lookup_target = lookup_target
 
-    #: A prefix to compare variable names for which, if it matches, they will not be replaced
-    #: with a dynamic lookup, but instead the prefix will be trimmed.
-    ignore_prefix: "str | None" = None
+        #: Names to not replace. The #lookup_target does not need to be added here explicitly.
+        self.pure_builtins: t.Collection[str] = frozenset() if pure_builtins is None else pure_builtins
+
+        #: A prefix to compare variable names for which, if it matches, they will not be replaced
+        #: with a dynamic lookup, but instead the prefix will be trimmed.
+        self.ignore_prefix = ignore_prefix
 
-    def __post_init__(self) -> None:
         self._locals: t.List[t.Set[str]] = [set()]
 
+    def __repr__(self) -> str:
+        return (
+            f"DynamicLookupRewriter(lookup_target={self.lookup_target!r}, pure_builtins={self.pure_builtins!r}, "
+            f"ignore_prefix={self.ignore_prefix!r})"
+        )
+
     def _add_to_locals(self, varnames: t.Set[str]) -> None:
         assert self._locals, "no locals in current scope"
         self._locals[-1].update(varnames)
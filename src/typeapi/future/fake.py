@@ -3,12 +3,41 @@ Here we provide support to mock support of future type hint feature for older Py
 """
 
 import builtins
-from typing import Any, Optional, Tuple, Union
+from collections import ChainMap
+from types import CodeType
+from typing import Any, Optional, Set, Tuple, Union
 
 from typeapi.future.astrewrite import rewrite_expr
 
+from .. import instrumentation
+from ..cache import LRUCache
+from ..context import EvaluationContext
+from ..dependencies import record
 from ..utils import HasGetitem, get_subscriptable_type_hint_from_origin
 
+#: The compiled code of type-hint expressions, see #_compile_expr().
+_COMPILED: "LRUCache[str, CodeType]" = LRUCache(1024, "compile_expr")
+
+
+def _compile_expr(expr: str) -> CodeType:
+    """
+    Compiles a type-hint expression with #rewrite_expr(). Parsing and compiling an expression is expensive compared
+    to executing it, so the code is cached per expression.
+    """
+
+    code = _COMPILED.get(expr)
+    if code is not None:
+        if instrumentation.enabled:
+            instrumentation.increment("cache.compile_expr.hits")
+        return code
+
+    if instrumentation.enabled:
+        instrumentation.increment("cache.compile_expr.misses")
+    with instrumentation.timed("future.compile_expr"):
+        code = rewrite_expr(expr, "__dict__")
+    _COMPILED[expr] = code
+    return code
+
 
 class FakeHint:
     """
@@ -68,12 +97,22 @@ class FakeProvider:
     """
 
     def __init__(self, content: HasGetitem[str, Any]) -> None:
+        # NOTE(NiklasRosenstein): An `EvaluationContext` falls back to the builtins by itself. Other mappings are used
+        #       as they are, so that their `__getitem__()` (e.g. the `__missing__()` of a `dict` subclass) is used.
+        if type(content) in (dict, ChainMap):
+            content = EvaluationContext(content)  # type: ignore[arg-type]
         self.content = content
+        #: The names that were looked up through this provider.
+        self.names: Set[str] = set()
 
     def __getitem__(self, key: str) -> FakeHint:
+        self.names.add(key)
+        record((key,))
         try:
             value = self.content[key]
         except KeyError:
+            if isinstance(self.content, EvaluationContext):
+                raise
             value = vars(builtins)[key]
         return FakeHint(get_subscriptable_type_hint_from_origin(value))
 
@@ -83,8 +122,7 @@ class FakeProvider:
         #FakeHint.evaluate() to construct the actual Python `typing` type hint object.
         """
 
-        code = rewrite_expr(expr, "__dict__")
-        result = eval(code, {"__dict__": self})
+        result = eval(_compile_expr(expr), {"__dict__": self})
 
         # We don't wrap all expressions into FakeHint objects via rewrite_expr(), but only names. If the expressions
         # was a literal string for example, we need to turn that into a FakeHint.
@@ -0,0 +1,354 @@
+"""
+A hash-consed graph representation of type hints.
+
+Large schemas tend to repeat the same type hints (e.g. `Optional[datetime]` or `List[Money]`) thousands of times as
+separate `typing` objects. A :class:`TypeGraph` stores every structurally unique type hint exactly once and connects
+it to the nodes of its arguments, turning a forest of type hint trees into a directed acyclic graph. Computations
+over the graph can then be performed once per unique node with :meth:`TypeGraph.fold`.
+
+:meth:`TypeGraph.add_closure` additionally follows the annotations of classes to build the graph of all types that
+are transitively referenced by a type hint, including recursive models.
+"""
+
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Mapping, Sequence, Set, Tuple, TypeVar
+
+from .transform import resolve_forward_refs
+from .typehint import AnnotatedTypeHint, ClassTypeHint, LiteralTypeHint, TupleTypeHint, TypeHint
+from .utils import TYPING_MODULE_NAMES, get_annotations
+
+__all__ = ["TypeGraph", "TypeGraphNode"]
+
+R = TypeVar("R")
+_NO_MEMBERS: Mapping[str, int] = MappingProxyType({})
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Returns a hashable key that compares equal for equal values of the same type. Falls back to the identity of
+    the value if it is not hashable.
+    """
+
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    return (type(value), value)
+
+
+class TypeGraphNode:
+    """
+    A node in a :class:`TypeGraph` that represents a structurally unique type hint.
+    """
+
+    __slots__ = ("index", "hint", "children", "members", "recursive")
+
+    def __init__(self, index: int, hint: TypeHint, children: Tuple[int, ...]) -> None:
+        #: The index of the node in the graph.
+        self.index = index
+
+        #: The canonical type hint for this node.
+        self.hint = hint
+
+        #: The indices of the nodes for the arguments of :attr:`hint`.
+        self.children = children
+
+        #: The indices of the nodes for the annotations of the class represented by this node, by name. This is
+        #: only populated for class nodes that were reached through :meth:`TypeGraph.add_closure`.
+        self.members = _NO_MEMBERS
+
+        #: Whether the class represented by this node transitively refers back to itself through its
+        #: :attr:`members`. Only populated by :meth:`TypeGraph.add_closure`.
+        self.recursive = False
+
+    def __repr__(self) -> str:
+        return f"TypeGraphNode({self.index}, {self.hint}, children={self.children})"
+
+
+def _is_followed_class(hint: TypeHint) -> bool:
+    """
+    Returns `True` if :meth:`TypeGraph.add_closure` should follow the annotations of the class of *hint*.
+    """
+
+    if not isinstance(hint, ClassTypeHint) or isinstance(hint, TupleTypeHint):
+        return False
+    return hint.type.__module__ not in TYPING_MODULE_NAMES and hint.type.__module__ != "builtins"
+
+
+class TypeGraph:
+    """
+    A container that stores every structurally unique type hint once. Adding a type hint to the graph adds nodes for
+    all of its nested type hints as well, reusing existing nodes where possible.
+
+    Nodes are numbered in the order in which they are added, and the nodes of the arguments of a type hint are always
+    added before the node of the type hint itself. Iterating over the graph thus yields the nodes in topological
+    order, from the leaves to the roots.
+
+        >>> from typing import Dict, List, Optional
+        >>> graph = TypeGraph()
+        >>> a = graph.add(Dict[str, List[Optional[int]]])
+        >>> b = graph.add(List[Optional[int]])
+        >>> graph[a].children[1] == b
+        True
+        >>> len(graph)
+        6
+
+    Note that forward references are stored as they are and should be evaluated before the type hint is added.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: List[TypeGraphNode] = []
+        self._index: Dict[Hashable, int] = {}
+        # Maps the id() of the canonical low-level type hint of every node to its index. The ids stay valid because
+        # the nodes keep the canonical type hints alive.
+        self._by_id: Dict[int, int] = {}
+        # Pairs of (class node index, member name) through which a class refers back to a class that encloses it.
+        self._back_edges: Set[Tuple[int, str]] = set()
+        # Indices of class nodes whose members have been resolved by add_closure().
+        self._resolved: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[TypeGraphNode]:
+        return iter(self._nodes)
+
+    def __getitem__(self, index: int) -> TypeGraphNode:
+        return self._nodes[index]
+
+    def __repr__(self) -> str:
+        return f"TypeGraph(nodes={len(self)}, edges={self.edge_count})"
+
+    @property
+    def nodes(self) -> Sequence[TypeGraphNode]:
+        """
+        All nodes in the graph, in topological order.
+        """
+
+        return self._nodes
+
+    @property
+    def edge_count(self) -> int:
+        """
+        The number of edges from nodes to the nodes of their arguments.
+        """
+
+        return sum(len(node.children) for node in self._nodes)
+
+    def sizeof(self) -> int:
+        """
+        Returns the approximate number of bytes occupied by the graph's own data structures, i.e. the nodes, their
+        type hint wrappers and the indices. The low-level type hint objects are not included because they are usually
+        shared with (and kept alive by) the code that defines them.
+        """
+
+        size = sys.getsizeof(self._nodes) + sys.getsizeof(self._index) + sys.getsizeof(self._by_id)
+        size += sys.getsizeof(self._back_edges) + sys.getsizeof(self._resolved)
+        for node in self._nodes:
+            size += sys.getsizeof(node) + sys.getsizeof(node.children)
+            if node.members is not _NO_MEMBERS:
+                size += sys.getsizeof(node.members)
+            size += sys.getsizeof(node.hint) + sys.getsizeof(vars(node.hint))
+        return size
+
+    def _key(self, hint: TypeHint, children: Tuple[int, ...]) -> Hashable:
+        """
+        Returns the structural key for a type hint whose arguments have been added as the given *children*.
+        """
+
+        if isinstance(hint, LiteralTypeHint):
+            return (LiteralTypeHint, tuple(_freeze(x) for x in hint.values))
+        if isinstance(hint, AnnotatedTypeHint):
+            return (AnnotatedTypeHint, children, tuple(_freeze(x) for x in hint.metadata))
+        if isinstance(hint, TupleTypeHint):
+            return (TupleTypeHint, children, hint.repeated)
+        if hint.origin is not None and children:
+            # The positions of an `Ellipsis` distinguish e.g. `Callable[..., int]` from `Callable[[], int]`.
+            ellipses = tuple(i for i, x in enumerate(hint.args) if x is ...)
+            return (type(hint), _freeze(hint.origin), children, ellipses)
+        return (type(hint), _freeze(hint.hint))
+
+    def add(self, hint: Any) -> int:
+        """
+        Add a type hint and all of its nested type hints to the graph.
+
+        :param hint: A :class:`TypeHint` or a low-level type hint.
+        :return: The index of the node that represents *hint*.
+        """
+
+        root = hint if isinstance(hint, TypeHint) else TypeHint(hint)
+        if id(root.hint) in self._by_id:
+            return self._by_id[id(root.hint)]
+
+        # Maps the id() of the low-level type hints visited during this call to the object and its node index.
+        seen: Dict[int, Tuple[object, int]] = {}
+
+        # Every frame is a list of [wrapper, whether its arguments have been pushed].
+        stack: List[List[Any]] = [[root, False]]
+        while stack:
+            frame = stack[-1]
+            current: TypeHint = frame[0]
+            key = id(current.hint)
+
+            if key in seen:
+                stack.pop()
+                continue
+            if key in self._by_id:
+                seen[key] = (current.hint, self._by_id[key])
+                stack.pop()
+                continue
+
+            has_children = current.origin is not None and bool(current.args)
+            if has_children and not frame[1]:
+                frame[1] = True
+                for arg in reversed(current.args):
+                    # NOTE(NiklasRosenstein): The parameters of `Callable[..., T]` are an `Ellipsis`, which is not a
+                    #       type hint and has no node.
+                    if arg is not ... and id(arg) not in seen:
+                        stack.append([TypeHint(arg), False])
+                continue
+
+            children = tuple(seen[id(x)][1] for x in current.args if x is not ...) if has_children else ()
+            node_key = self._key(current, children)
+            index = self._index.get(node_key)
+            if index is None:
+                index = len(self._nodes)
+                self._nodes.append(TypeGraphNode(index, current, children))
+                self._index[node_key] = index
+                self._by_id[key] = index
+            seen[key] = (current.hint, index)
+            stack.pop()
+
+        return seen[id(root.hint)][1]
+
+    def add_closure(self, hint: Any, source: "Any | None" = None) -> int:
+        """
+        Add a type hint and all types that it transitively refers to. In addition to the arguments of type hints,
+        this follows the annotations of classes (see :func:`get_annotations`), which are made available through
+        :attr:`TypeGraphNode.members`. Forward references are evaluated in the context of the class whose annotation
+        they appear in, or in the context of *source* for the root type hint.
+
+        Every class is resolved only once per graph, even if it is referenced many times. Self-referential models
+        such as `class Node: children: List["Node"]` are represented with a cycle through the :attr:`members`; the
+        nodes on such a cycle are marked as :attr:`TypeGraphNode.recursive` and the members that close the cycle
+        can be detected with :meth:`is_back_edge`, allowing consumers to refer to the class lazily at that point.
+
+        :return: The index of the node that represents *hint*.
+        """
+
+        root = resolve_forward_refs(TypeHint(hint, source))
+        root_index = self.add(root)
+
+        reachable: Dict[int, Tuple[int, ...]] = {}
+        path: List[int] = []
+        on_path: Dict[int, int] = {}
+
+        # Every frame is a list of [class node index, (member name, class node index) pairs, position].
+        stack: List[List[Any]] = []
+        for index in self._reachable_classes(root_index, reachable):
+            if index not in self._resolved:
+                stack.append([index, None, 0])
+
+        while stack:
+            frame = stack[-1]
+            index = frame[0]
+
+            if frame[1] is None:
+                if index in self._resolved:
+                    stack.pop()
+                    continue
+                members = self._resolve_members(self._nodes[index].hint)
+                self._nodes[index].members = members
+                frame[1] = [
+                    (name, class_index)
+                    for name, member_index in members.items()
+                    for class_index in self._reachable_classes(member_index, reachable)
+                ]
+                on_path[index] = len(path)
+                path.append(index)
+
+            pairs: List[Tuple[str, int]] = frame[1]
+            while frame[2] < len(pairs):
+                name, class_index = pairs[frame[2]]
+                frame[2] += 1
+                if class_index in on_path:
+                    self._back_edges.add((index, name))
+                    for cycle_index in path[on_path[class_index] :]:  # noqa: E203
+                        self._nodes[cycle_index].recursive = True
+                elif class_index not in self._resolved:
+                    stack.append([class_index, None, 0])
+                    break
+            else:
+                del on_path[path.pop()]
+                self._resolved.add(index)
+                stack.pop()
+
+        return root_index
+
+    def _resolve_members(self, hint: TypeHint) -> Mapping[str, int]:
+        """
+        Add the annotations of the class of *hint* to the graph. If *hint* is a parameterized generic, the type
+        variables in the annotations are replaced accordingly.
+        """
+
+        assert isinstance(hint, ClassTypeHint), hint
+        parameter_map = hint.get_parameter_map()
+        members = {}
+        for name, annotation in get_annotations(hint.type, include_bases=True).items():
+            member = resolve_forward_refs(TypeHint(annotation, hint.type))
+            if parameter_map:
+                member = member.parameterize(parameter_map)
+            members[name] = self.add(member)
+        return members
+
+    def _reachable_classes(self, index: int, cache: Dict[int, Tuple[int, ...]]) -> Tuple[int, ...]:
+        """
+        Returns the indices of the class nodes whose annotations should be followed that are reachable from the
+        node at *index* through :attr:`TypeGraphNode.children`, including the node itself.
+        """
+
+        if index in cache:
+            return cache[index]
+        result: List[int] = []
+        seen: Set[int] = set()
+        stack = [index]
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            if _is_followed_class(self._nodes[current].hint):
+                result.append(current)
+            stack.extend(reversed(self._nodes[current].children))
+        cache[index] = tuple(result)
+        return cache[index]
+
+    def is_back_edge(self, index: int, member: str) -> bool:
+        """
+        Returns `True` if the *member* of the class node at *index* refers back to a class that was still being
+        resolved when the member was reached by :meth:`add_closure`, i.e. if following it closes a cycle.
+        """
+
+        return (index, member) in self._back_edges
+
+    def intern(self, hint: Any) -> TypeHint:
+        """
+        Returns the canonical :class:`TypeHint` for *hint*, adding it to the graph if necessary. Structurally equal
+        type hints always return the same object.
+        """
+
+        return self._nodes[self.add(hint)].hint
+
+    def fold(self, func: "Callable[[TypeGraphNode, Tuple[R, ...]], R]") -> List[R]:
+        """
+        Compute a value for every node in the graph, from the leaves to the roots. The *func* is called exactly
+        once per node with the node and the values computed for its children.
+
+        :return: A list of the computed values, indexed by node index.
+        """
+
+        results: List[R] = []
+        for node in self._nodes:
+            results.append(func(node, tuple(results[i] for i in node.children)))
+        return results
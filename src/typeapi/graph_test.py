@@ -0,0 +1,175 @@
+import sys
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from typing_extensions import Annotated, Literal
+
+from typeapi.graph import TypeGraph, TypeGraphNode
+from typeapi.typehint import TypeHint
+
+T = TypeVar("T")
+
+
+def test__TypeGraph__deduplicates_structurally_equal_hints() -> None:
+    graph = TypeGraph()
+    a = graph.add(List[Optional[int]])
+    b = graph.add(TypeHint(List[Optional[int]]))
+    c = graph.add(list[Optional[int]] if hasattr(list, "__class_getitem__") else List[Optional[int]])
+    assert a == b == c
+    assert len(graph) == 4
+    assert graph.edge_count == 3
+
+
+def test__TypeGraph__children_point_to_shared_nodes() -> None:
+    graph = TypeGraph()
+    root = graph.add(Dict[Optional[int], List[Optional[int]]])
+    optional = graph.add(Optional[int])
+    node = graph[root]
+    assert node.children[0] == optional
+    assert graph[node.children[1]].children == (optional,)
+
+
+def test__TypeGraph__nodes_are_in_topological_order() -> None:
+    graph = TypeGraph()
+    graph.add(Tuple[Dict[str, List[int]], List[int]])
+    for node in graph:
+        assert all(child < node.index for child in node.children)
+
+
+def test__TypeGraph__distinguishes_literals_annotations_and_tuples() -> None:
+    graph = TypeGraph()
+    assert graph.add(Literal[1]) != graph.add(Literal[True])
+    assert graph.add(Annotated[int, "a"]) != graph.add(Annotated[int, "b"])
+    assert graph.add(Annotated[int, []]) != graph.add(Annotated[int, []])
+    assert graph.add(Tuple[int]) != graph.add(Tuple[int, ...])
+    assert graph.add(List[T]) != graph.add(List[TypeVar("T")])  # type: ignore[misc,valid-type]
+
+
+def test__TypeGraph__callable_with_ellipsis() -> None:
+    graph = TypeGraph()
+    index = graph.add(Callable[..., int])
+    assert graph[index].children == (graph.add(int),)
+    assert graph.add(Callable[[], int]) != index
+    assert graph.add(Callable[[int], int]) != index
+
+
+def test__TypeGraph__intern() -> None:
+    graph = TypeGraph()
+    hint = graph.intern(Dict[str, int])
+    assert graph.intern(TypeHint(Dict[str, int])) is hint
+    assert hint.hint == Dict[str, int]
+
+
+def test__TypeGraph__fold_runs_once_per_node() -> None:
+    graph = TypeGraph()
+    root = graph.add(Dict[Optional[int], List[Optional[int]]])
+    calls: List[int] = []
+
+    def depth(node: TypeGraphNode, children: Tuple[int, ...]) -> int:
+        calls.append(node.index)
+        return 1 + max(children, default=0)
+
+    results = graph.fold(depth)
+    assert results[root] == 4
+    assert sorted(calls) == list(range(len(graph)))
+
+
+def test__TypeGraph__sizeof() -> None:
+    graph = TypeGraph()
+    empty = graph.sizeof()
+    hints: List[Any] = [Dict[str, List[int]]] * 100
+    for hint in hints:
+        graph.add(hint)
+    assert len(graph) == 4
+    assert empty < graph.sizeof()
+
+
+class Node:
+    value: int
+    children: List["Node"]
+    parent: "Optional[Node]"
+
+
+class Tree:
+    root: Node
+    nodes: Dict[str, Node]
+
+
+class Box(Generic[T]):
+    item: T
+    items: "List[T]"
+
+
+class Person:
+    name: str
+    employer: "Company"
+
+
+class Company:
+    employees: List[Person]
+    owner: Box[Person]
+
+
+def test__TypeGraph__add_closure__follows_annotations() -> None:
+    graph = TypeGraph()
+    root = graph.add_closure(Tree)
+    node = graph.add(Node)
+    assert graph[root].members == {"root": node, "nodes": graph.add(Dict[str, Node])}
+    assert graph[node].members == {
+        "value": graph.add(int),
+        "children": graph.add(List[Node]),
+        "parent": graph.add(Optional[Node]),
+    }
+    assert graph[graph.add(int)].members == {}
+
+
+class Handler:
+    callback: Callable[..., Node]
+
+
+def test__TypeGraph__add_closure__callable_with_ellipsis() -> None:
+    graph = TypeGraph()
+    root = graph.add_closure(Handler)
+    callback = graph.add(Callable[..., Node])
+    assert graph[root].members == {"callback": callback}
+    assert "children" in graph[graph.add(Node)].members
+
+
+def test__TypeGraph__add_closure__marks_cycles() -> None:
+    graph = TypeGraph()
+    root = graph.add_closure(Tree)
+    node = graph.add(Node)
+    assert not graph[root].recursive
+    assert graph[node].recursive
+    assert graph.is_back_edge(node, "children")
+    assert graph.is_back_edge(node, "parent")
+    assert not graph.is_back_edge(node, "value")
+    assert not graph.is_back_edge(root, "root")
+
+
+def test__TypeGraph__add_closure__mutual_recursion_and_generics() -> None:
+    graph = TypeGraph()
+    root = graph.add_closure("List[Person]", sys.modules[__name__])
+    assert graph[root].hint.hint == List[Person]
+    person = graph.add(Person)
+    company = graph.add(Company)
+    boxed = graph.add(Box[Person])
+    assert graph[person].recursive and graph[company].recursive
+    assert graph.is_back_edge(company, "employees")
+    assert graph[boxed].members == {"item": person, "items": graph.add(List[Person])}
+    assert graph.is_back_edge(boxed, "item")
+
+
+def test__TypeGraph__add_closure__resolves_every_class_once(monkeypatch: Any) -> None:
+    from typeapi.utils import get_annotations as original
+
+    calls: List[Any] = []
+
+    def get_annotations(obj: Any, include_bases: bool = False) -> Any:
+        calls.append(obj)
+        return original(obj, include_bases=include_bases)
+
+    monkeypatch.setattr("typeapi.graph.get_annotations", get_annotations)
+    graph = TypeGraph()
+    graph.add_closure(Tree)
+    graph.add_closure(List[Node])
+    assert sorted(calls, key=lambda x: x.__name__) == [Node, Tree]
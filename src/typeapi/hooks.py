@@ -0,0 +1,140 @@
+"""
+Callbacks that are notified about the evaluation of type hints, for example to log the annotations that are slow to
+evaluate.
+
+    >>> import sys
+    >>> from typeapi import TypeHint
+    >>> events = []
+    >>> callback = on_evaluate.register(events.append)
+    >>> TypeHint("int", sys.modules[__name__]).evaluate()
+    TypeHint(int)
+    >>> events[0].kind, events[0].expr, events[0].error
+    ('forward_ref', 'int', None)
+    >>> on_evaluate.unregister(callback)
+
+While no callback is registered, the instrumented code only checks whether the registry is empty.
+"""
+
+import threading
+import time
+from types import TracebackType
+from typing import Any, Callable, NamedTuple, Optional, Tuple, Type
+
+from .instrumentation import _NULL_TIMER, _NullTimer
+
+__all__ = ["EvaluateEvent", "EvaluateHooks", "on_evaluate"]
+
+
+class EvaluateEvent(NamedTuple):
+    """Describes one evaluation that is reported to the callbacks of :data:`on_evaluate`."""
+
+    #: Either `"forward_ref"` for the evaluation of a forward reference, or `"get_annotations"` for a call to
+    #: :func:`typeapi.utils.get_annotations`.
+    kind: str
+
+    #: The expression of the forward reference, or `None` for `"get_annotations"`.
+    expr: "str | None"
+
+    #: The object that the expression is evaluated for: the :attr:`~typeapi.typehint.TypeHint.source` of the forward
+    #: reference or the context that it is evaluated in if it has no source, or the object whose annotations are
+    #: retrieved.
+    source: Any
+
+    #: The time that the evaluation took, in seconds. The time of `"get_annotations"` includes the evaluation of the
+    #: forward references in the annotations.
+    seconds: float
+
+    #: The exception that the evaluation raised, or `None` if it succeeded.
+    error: "BaseException | None"
+
+
+class EvaluateHooks:
+    """
+    A registry of callbacks that receive an :class:`EvaluateEvent` for every evaluation that takes at least the
+    threshold that the callback was registered with. Exceptions raised by a callback propagate to the code that
+    performed the evaluation.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # NOTE(NiklasRosenstein): The tuple is replaced instead of modified, so that emitting an event does not need to
+        #       acquire the lock.
+        self._callbacks: Tuple[Tuple[Callable[[EvaluateEvent], None], float], ...] = ()
+
+    def __repr__(self) -> str:
+        return f"EvaluateHooks(callbacks={len(self._callbacks)})"
+
+    def __bool__(self) -> bool:
+        return bool(self._callbacks)
+
+    def register(
+        self, callback: Callable[[EvaluateEvent], None], threshold: float = 0.0
+    ) -> Callable[[EvaluateEvent], None]:
+        """
+        Registers *callback*. Returns the callback, so that this method can be used as a decorator.
+
+        :param threshold: The minimum duration of an evaluation in seconds for it to be reported to *callback*.
+        """
+
+        with self._lock:
+            self._callbacks += ((callback, threshold),)
+        return callback
+
+    def unregister(self, callback: Callable[[EvaluateEvent], None]) -> None:
+        """
+        Removes *callback* from the registry.
+
+        :raise ValueError: If *callback* is not registered.
+        """
+
+        with self._lock:
+            # NOTE(NiklasRosenstein): Bound methods are created on every attribute access, so we compare by equality.
+            index = next((i for i, (x, _) in enumerate(self._callbacks) if x == callback), None)
+            if index is None:
+                raise ValueError(f"{callback!r} is not registered")
+            self._callbacks = tuple(x for i, x in enumerate(self._callbacks) if i != index)
+
+    def emit(self, event: EvaluateEvent) -> None:
+        """
+        Passes *event* to the callbacks whose threshold it reaches.
+        """
+
+        for callback, threshold in self._callbacks:
+            if event.seconds >= threshold:
+                callback(event)
+
+    def timed(self, kind: str, expr: "str | None", source: Any) -> "_EvaluateTimer | _NullTimer":
+        """
+        Returns a context manager that emits an :class:`EvaluateEvent` for the code that it wraps, or one that does
+        nothing if no callbacks are registered.
+        """
+
+        if not self._callbacks:
+            return _NULL_TIMER
+        return _EvaluateTimer(self, kind, expr, source)
+
+
+class _EvaluateTimer:
+    def __init__(self, hooks: EvaluateHooks, kind: str, expr: "str | None", source: Any) -> None:
+        self.hooks = hooks
+        self.kind = kind
+        self.expr = expr
+        self.source = source
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        seconds = time.perf_counter() - self.start
+        self.hooks.emit(EvaluateEvent(self.kind, self.expr, self.source, seconds, exc_value))
+
+
+#: The callbacks that are notified about the evaluation of forward references and calls to
+#: :func:`typeapi.utils.get_annotations`.
+on_evaluate = EvaluateHooks()
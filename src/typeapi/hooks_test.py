@@ -0,0 +1,56 @@
+import sys
+from typing import Iterator, List
+
+from pytest import fixture, raises
+
+from typeapi.hooks import EvaluateEvent, on_evaluate
+from typeapi.typehint import TypeHint
+from typeapi.utils import get_annotations
+
+
+class Model:
+    values: "List[int]"
+
+
+@fixture
+def events() -> Iterator[List[EvaluateEvent]]:
+    events: List[EvaluateEvent] = []
+    on_evaluate.register(events.append)
+    try:
+        yield events
+    finally:
+        on_evaluate.unregister(events.append)
+
+
+def test__on_evaluate__reports_forward_refs_and_get_annotations(events: List[EvaluateEvent]) -> None:
+    assert get_annotations(Model) == {"values": List[int]}
+    assert [(x.kind, x.expr, x.error) for x in events] == [
+        ("forward_ref", "List[int]", None),
+        ("get_annotations", None, None),
+    ]
+    assert events[1].source is Model
+    assert events[1].seconds >= events[0].seconds > 0
+
+
+def test__on_evaluate__reports_errors(events: List[EvaluateEvent]) -> None:
+    with raises(KeyError):
+        TypeHint("Undefined", sys.modules[__name__]).evaluate()
+    assert len(events) == 1
+    assert events[0].source is sys.modules[__name__]
+    assert isinstance(events[0].error, KeyError)
+
+
+def test__on_evaluate__only_reports_evaluations_above_threshold() -> None:
+    slow: List[EvaluateEvent] = []
+    on_evaluate.register(slow.append, threshold=60.0)
+    try:
+        get_annotations(Model)
+    finally:
+        on_evaluate.unregister(slow.append)
+    assert slow == []
+
+
+def test__on_evaluate__unregister_raises_for_unknown_callback() -> None:
+    with raises(ValueError):
+        on_evaluate.unregister(print)
+    assert not on_evaluate
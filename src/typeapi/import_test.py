@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+from typing import List
+
+import typeapi
+
+#: The modules that `import typeapi` may import. Everything else must be imported lazily on first use.
+ALLOWED_IMPORTS = {"typeapi"}
+
+
+def _get_imported_modules(statement: str) -> List[str]:
+    """
+    Runs *statement* in a fresh interpreter with `-X importtime` and returns the names of the modules that were
+    imported by it, i.e. the modules that are nested in the import of `typeapi` in the import time report.
+    """
+
+    env = {**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(typeapi.__file__))}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    # Each line has the format "import time: <self us> | <cumulative us> | <indentation><module>", and the modules
+    # that are imported by another module are listed before it with a deeper indentation.
+    entries = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            name = line.split("|")[2]
+            entries.append((len(name) - len(name.lstrip()), name.strip()))
+
+    index = max(i for i, (_, name) in enumerate(entries) if name == "typeapi")
+    depth = entries[index][0]
+    modules = ["typeapi"]
+    for indentation, name in reversed(entries[:index]):
+        if indentation <= depth:
+            break
+        modules.append(name)
+    return modules
+
+
+def test__import_typeapi__does_not_import_other_modules() -> None:
+    assert set(_get_imported_modules("import typeapi")) <= ALLOWED_IMPORTS
+
+
+def test__import_typeapi__loads_public_names_on_first_access() -> None:
+    assert set(dir(typeapi)) >= set(typeapi.__all__)
+    for name in typeapi.__all__:
+        assert getattr(typeapi, name) is not None
+    assert typeapi.TypeHint(int) == typeapi.TypeHint(int)
+
+
+def test__evaluate__imports_only_ast_on_first_forward_reference() -> None:
+    statement = (
+        "import sys, typeapi.typehint; before = set(sys.modules); typeapi.typehint.TypeHint('int', {}).evaluate(); "
+        "print(' '.join(sorted(set(sys.modules) - before)))"
+    )
+    env = {**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(typeapi.__file__))}
+    result = subprocess.run(
+        [sys.executable, "-c", statement], env=env, stdout=subprocess.PIPE, universal_newlines=True, check=True
+    )
+    modules = {x for x in result.stdout.split() if x.split(".")[0] != "typeapi"}
+    assert modules <= {"ast", "_ast"}
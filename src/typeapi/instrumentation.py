@@ -0,0 +1,147 @@
+"""
+Opt-in counters and timings of the work that :mod:`typeapi` does at runtime, to find out where the time goes without
+running a profiler.
+
+Instrumentation is disabled by default. Enable it with :func:`enable_stats`, or by setting the `TYPEAPI_STATS`
+environment variable to `1` before :mod:`typeapi` is used. While it is disabled, instrumented code only checks the
+:data:`enabled` flag.
+
+    >>> import typeapi
+    >>> from typing import List
+    >>> typeapi.enable_stats()
+    >>> typeapi.TypeHint("List[int]", {"List": List}).evaluate()
+    TypeHint(typing.List[int])
+    >>> typeapi.stats()["evaluate.forward_ref"].calls
+    1
+    >>> typeapi.reset_stats()
+    >>> typeapi.enable_stats(False)
+
+The following statistics are collected:
+
+* `typehint.construct.<class>`: the construction of :class:`~typeapi.typehint.TypeHint` objects per subclass,
+* `evaluate.forward_ref`: the evaluation of forward references,
+* `future.compile_expr`: the parsing, rewriting and compilation of forward reference expressions (the result is
+  cached per expression, so this only counts the first evaluation of an expression),
+* `get_annotations`: the calls to :func:`~typeapi.utils.get_annotations`,
+* `checker.compile`: the compilation of checkers by :func:`~typeapi.checker.compile_checker`,
+* `cache.<name>.hits`, `cache.<name>.misses` and `cache.<name>.evictions`: the lookups in the caches of
+  :mod:`typeapi`. A cache entry that was invalidated through :mod:`typeapi.dependencies` counts as a miss.
+
+An operation that raises an exception is also counted in `<name>.errors`. The time of an operation includes the
+time of the operations that it performs, e.g. the time of `get_annotations` includes the time spent evaluating the
+forward references in the annotations.
+"""
+
+import os
+import threading
+import time
+from types import TracebackType
+from typing import Dict, NamedTuple, Optional, Type
+
+__all__ = ["Stat", "enable_stats", "enabled", "increment", "record_time", "reset_stats", "stats", "timed"]
+
+#: Whether statistics are collected. Instrumented code checks this flag before doing any other work.
+enabled = os.environ.get("TYPEAPI_STATS") == "1"
+
+_lock = threading.Lock()
+_counts: Dict[str, int] = {}
+_seconds: Dict[str, float] = {}
+
+
+class Stat(NamedTuple):
+    """The statistics of one kind of operation, as returned by :func:`stats`."""
+
+    #: The number of times that the operation was performed.
+    calls: int
+
+    #: The cumulative time that was spent in the operation, in seconds. This is `0.0` for operations that are only
+    #: counted, such as cache lookups.
+    seconds: float
+
+
+def enable_stats(enable: bool = True) -> None:
+    """
+    Enables or disables the collection of statistics. Statistics that were already collected are kept.
+    """
+
+    global enabled
+    enabled = enable
+
+
+def stats() -> Dict[str, Stat]:
+    """
+    Returns the statistics that were collected since the last call to :func:`reset_stats`, sorted by name.
+    """
+
+    with _lock:
+        return {name: Stat(_counts[name], _seconds.get(name, 0.0)) for name in sorted(_counts)}
+
+
+def reset_stats() -> None:
+    """
+    Discards all statistics that were collected so far.
+    """
+
+    with _lock:
+        _counts.clear()
+        _seconds.clear()
+
+
+def increment(name: str, count: int = 1) -> None:
+    """
+    Adds *count* to the counter *name*. Callers check :data:`enabled` first.
+    """
+
+    with _lock:
+        _counts[name] = _counts.get(name, 0) + count
+
+
+def record_time(name: str, seconds: float) -> None:
+    """
+    Counts one operation *name* that took *seconds*. Callers check :data:`enabled` first.
+    """
+
+    with _lock:
+        _counts[name] = _counts.get(name, 0) + 1
+        _seconds[name] = _seconds.get(name, 0.0) + seconds
+
+
+class _Timer:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        record_time(self.name, time.perf_counter() - self.start)
+        if exc_type is not None:
+            increment(f"{self.name}.errors")
+
+
+class _NullTimer:
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timed(name: str) -> "_Timer | _NullTimer":
+    """
+    Returns a context manager that records the time of the operation *name* if statistics are enabled. Use it for
+    operations that are expensive compared to entering a context manager; check :data:`enabled` directly otherwise.
+    """
+
+    if not enabled:
+        return _NULL_TIMER
+    return _Timer(name)
@@ -0,0 +1,96 @@
+import dataclasses
+import sys
+from typing import Dict, Iterator, List
+
+from pytest import fixture, raises
+
+from typeapi import instrumentation
+from typeapi.cache import LRUCache
+from typeapi.fields import get_fields
+from typeapi.typehint import ClassTypeHint, TypeHint
+from typeapi.utils import get_annotations
+
+
+@fixture(autouse=True)
+def _enable_stats() -> Iterator[None]:
+    instrumentation.reset_stats()
+    instrumentation.enable_stats()
+    try:
+        yield
+    finally:
+        instrumentation.enable_stats(False)
+        instrumentation.reset_stats()
+
+
+@dataclasses.dataclass
+class Model:
+    values: "List[int]"
+
+
+def test__stats__counts_type_hint_construction_by_subclass() -> None:
+    TypeHint(int)
+    TypeHint(int)
+    ClassTypeHint(str, None)
+    stat = instrumentation.stats()["typehint.construct.ClassTypeHint"]
+    assert stat.calls == 3
+    assert stat.seconds > 0
+
+
+def test__stats__counts_evaluations_and_their_errors() -> None:
+    TypeHint("List[int]", sys.modules[__name__]).evaluate()
+    with raises(KeyError):
+        TypeHint("Undefined", sys.modules[__name__]).evaluate()
+
+    stats = instrumentation.stats()
+    assert stats["evaluate.forward_ref"].calls == 2
+    assert stats["evaluate.forward_ref.errors"].calls == 1
+    assert stats["evaluate.forward_ref"].seconds > 0
+
+
+def test__stats__counts_get_annotations_and_cache_lookups() -> None:
+    get_annotations(Model)
+    get_fields(Model)
+    get_fields(Model)
+
+    stats = instrumentation.stats()
+    assert stats["get_annotations"].calls == 1
+    assert stats["cache.fields.misses"].calls == 1
+    assert stats["cache.fields.hits"].calls == 1
+
+
+def test__stats__counts_assignability_dispatch_and_compile_cache_lookups() -> None:
+    from typeapi.assignability import is_assignable
+    from typeapi.dispatch import TypeHintDispatcher
+    from typeapi.future.fake import _COMPILED
+
+    _COMPILED.clear()
+    for _ in range(2):
+        TypeHint("Dict[str, int]", {"Dict": Dict}).evaluate()
+        is_assignable(List[Model], List[Model])
+    dispatcher: TypeHintDispatcher[None] = TypeHintDispatcher(lambda hint: None)
+    dispatcher(Model)
+    dispatcher(Model)
+
+    stats = instrumentation.stats()
+    for name in ["compile_expr", "assignability", "dispatch"]:
+        assert stats[f"cache.{name}.misses"].calls >= 1, name
+        assert stats[f"cache.{name}.hits"].calls >= 1, name
+
+
+def test__stats__counts_lru_cache_evictions() -> None:
+    cache: "LRUCache[str, int]" = LRUCache(1, "test")
+    cache["a"] = 1
+    cache["b"] = 2
+    assert instrumentation.stats()["cache.test.evictions"].calls == 1
+
+
+def test__stats__are_not_collected_when_disabled() -> None:
+    instrumentation.enable_stats(False)
+    get_annotations(Model)
+    assert instrumentation.stats() == {}
+
+
+def test__reset_stats__discards_stats() -> None:
+    TypeHint(int)
+    instrumentation.reset_stats()
+    assert instrumentation.stats() == {}
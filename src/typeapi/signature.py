@@ -0,0 +1,127 @@
+"""
+Resolve the type hints of a function's signature.
+"""
+
+import functools
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Tuple
+
+from . import instrumentation
+from .cache import LRUCache
+from .dependencies import DependencyStamp, record, track_dependencies
+from .transform import resolve_forward_refs
+from .typehint import TypeHint
+
+__all__ = ["SignatureHints", "get_signature_hints"]
+
+
+class SignatureHints(NamedTuple):
+    """The type hints of a function's signature."""
+
+    #: The type hints of the annotated parameters, in the order of the parameters.
+    parameters: Mapping[str, TypeHint]
+
+    #: The type hint of the return value, or `None` if the return value is not annotated.
+    return_hint: "TypeHint | None"
+
+
+class _CacheEntry(NamedTuple):
+    globals: Dict[str, Any]
+    annotations: Dict[str, Any]
+    hints: Dict[int, Tuple[SignatureHints, DependencyStamp]]
+
+
+#: Maps the `__code__` and the identity of the `__globals__` of a function to its resolved type hints. The globals
+#: are kept alive by the entry, so their identity cannot be reused while the entry exists.
+_CACHE: "LRUCache[Tuple[Any, int], _CacheEntry]" = LRUCache(4096, "signature")
+
+
+def _unwrap(func: Any) -> Tuple[Any, int]:
+    """
+    Follows the chain of `functools.partial` objects, bound methods and wrappers created with
+    `functools.update_wrapper()` to the underlying function. Returns the function and the number of leading
+    positional parameters that are already bound.
+    """
+
+    original = func
+    # NOTE(NiklasRosenstein): The objects in the chain are kept alive by *original*, so their ids stay valid.
+    seen = {id(func)}
+    bound = 0
+    while True:
+        if isinstance(func, functools.partial):
+            bound += len(func.args)
+            func = func.func
+        elif hasattr(func, "__func__"):
+            # Bound methods, as well as `classmethod` and `staticmethod` objects.
+            if getattr(func, "__self__", None) is not None:
+                bound += 1
+            func = func.__func__
+        elif hasattr(func, "__wrapped__"):
+            func = func.__wrapped__
+        else:
+            return func, bound
+        if id(func) in seen:
+            raise ValueError(f"wrapper loop when unwrapping {original!r}")
+        seen.add(id(func))
+
+
+def _resolve(hint: Any, func: Any) -> TypeHint:
+    return resolve_forward_refs(TypeHint(hint, func.__globals__))
+
+
+def get_signature_hints(func: Callable[..., Any]) -> SignatureHints:
+    """
+    Returns the type hints of the parameters and the return value of *func*. String annotations and forward
+    references are evaluated in the globals of the function.
+
+    Wrappers created with `functools.update_wrapper()`, `functools.partial` objects and bound methods are unwrapped
+    to the underlying function; positional parameters that are bound by a partial or a bound method are omitted. The
+    result is cached by the `__code__` and `__globals__` of the underlying function, so functions that are unwrapped
+    to the same underlying function, such as the bound methods of different instances, share one cache entry.
+
+        >>> from typing import List
+        >>> class Service:
+        ...     def handle(self, names: "List[str]", limit: int = 10) -> bool: ...
+        >>> get_signature_hints(Service().handle)
+        SignatureHints(parameters=mappingproxy({'names': TypeHint(typing.List[str]), 'limit': TypeHint(int)}), \
+return_hint=TypeHint(bool))
+
+    :raise TypeError: If *func* is not a Python function after unwrapping.
+    :raise ValueError: If the chain of wrappers of *func* is cyclic.
+    """
+
+    function, bound = _unwrap(func)
+    code = getattr(function, "__code__", None)
+    if code is None:
+        raise TypeError(f"expected a Python function, got {func!r}")
+
+    key = (code, id(function.__globals__))
+    entry = _CACHE.get(key)
+    # NOTE(NiklasRosenstein): Functions that are created by executing the same `def` statement more than once, such
+    #       as closures, share their code and globals but each have their own annotations.
+    if entry is None or entry.annotations is not function.__annotations__:
+        entry = _CacheEntry(function.__globals__, function.__annotations__, {})
+        _CACHE[key] = entry
+
+    cached = entry.hints.get(bound)
+    if cached is not None and cached[1].is_valid():
+        if instrumentation.enabled:
+            instrumentation.increment("cache.signature.hits")
+        record(cached[1].names)
+        return cached[0]
+
+    if instrumentation.enabled:
+        instrumentation.increment("cache.signature.misses")
+
+    annotations = function.__annotations__
+    skip = set(code.co_varnames[: min(bound, code.co_argcount)])
+    with track_dependencies() as names:
+        parameters = {
+            name: _resolve(hint, function)
+            for name, hint in annotations.items()
+            if name != "return" and name not in skip
+        }
+        return_hint = _resolve(annotations["return"], function) if "return" in annotations else None
+    hints = SignatureHints(MappingProxyType(parameters), return_hint)
+    entry.hints[bound] = (hints, DependencyStamp(names))
+    return hints
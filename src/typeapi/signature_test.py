@@ -0,0 +1,99 @@
+import functools
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+import pytest
+
+from typeapi.signature import _CACHE, get_signature_hints
+from typeapi.typehint import TypeHint
+
+T = TypeVar("T")
+
+
+class Request:
+    pass
+
+
+def handler(request: "Request", user_id: int, *, verbose: "Optional[bool]" = None) -> "Dict[str, Any]":
+    return {}
+
+
+class Endpoint:
+    def get(self, request: Request, ids: List[int]) -> None:
+        pass
+
+    @classmethod
+    def create(cls, request: Request) -> "Endpoint":
+        return cls()
+
+    @staticmethod
+    def delete(request: Request) -> None:
+        pass
+
+
+def logged(func: Callable[..., T]) -> Callable[..., T]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def test__get_signature_hints__function() -> None:
+    hints = get_signature_hints(handler)
+    assert dict(hints.parameters) == {
+        "request": TypeHint(Request),
+        "user_id": TypeHint(int),
+        "verbose": TypeHint(Optional[bool]),
+    }
+    assert hints.return_hint == TypeHint(Dict[str, Any])
+
+
+def test__get_signature_hints__unwraps_partials_methods_and_wrappers() -> None:
+    assert list(get_signature_hints(functools.partial(handler, Request())).parameters) == ["user_id", "verbose"]
+    assert list(get_signature_hints(functools.partial(handler, verbose=True)).parameters) == [
+        "request",
+        "user_id",
+        "verbose",
+    ]
+    assert list(get_signature_hints(Endpoint().get).parameters) == ["request", "ids"]
+    assert list(get_signature_hints(Endpoint.get).parameters) == ["request", "ids"]
+    assert list(get_signature_hints(Endpoint.create).parameters) == ["request"]
+    assert get_signature_hints(Endpoint.create).return_hint == TypeHint(Endpoint)
+    assert list(get_signature_hints(Endpoint.delete).parameters) == ["request"]
+    assert get_signature_hints(logged(handler)) is get_signature_hints(handler)
+    assert get_signature_hints(logged(functools.partial(Endpoint().get, Request()))).parameters == {
+        "ids": TypeHint(List[int])
+    }
+
+
+def test__get_signature_hints__is_cached_by_code() -> None:
+    _CACHE.clear()
+    first = get_signature_hints(Endpoint().get)
+    assert get_signature_hints(Endpoint().get) is first
+    assert len(_CACHE) == 1
+
+
+def test__get_signature_hints__closures() -> None:
+    def make(type_: Any) -> Callable[..., None]:
+        def func(value: type_) -> None:  # type: ignore[valid-type]
+            pass
+
+        return func
+
+    assert get_signature_hints(make(int)).parameters == {"value": TypeHint(int)}
+    assert get_signature_hints(make(str)).parameters == {"value": TypeHint(str)}
+
+
+def test__get_signature_hints__not_a_function() -> None:
+    with pytest.raises(TypeError):
+        get_signature_hints(len)
+
+
+def test__get_signature_hints__wrapper_loop() -> None:
+    class Loop:
+        pass
+
+    loop = Loop()
+    loop.__wrapped__ = loop  # type: ignore[attr-defined]
+    with pytest.raises(ValueError):
+        get_signature_hints(loop)  # type: ignore[arg-type]
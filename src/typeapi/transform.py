@@ -0,0 +1,182 @@
+"""
+An iterative traversal engine for trees of type hints.
+
+Type hints such as a `Union[...]` with hundreds of members or deeply nested generics are expensive to process with
+naive recursion and may even exceed the interpreter's recursion limit. The helpers in this module walk a type hint
+using an explicit stack and process every distinct low-level type hint object only once, so the cost of a traversal
+is linear in the number of distinct nodes of the tree.
+"""
+
+from typing import Any, Dict, Iterator, List, Mapping, Set, Tuple
+
+from .typehint import ForwardRefTypeHint, TypeHint
+from .utils import HasGetitem
+
+__all__ = [
+    "EvaluateTransformer",
+    "ParameterizeTransformer",
+    "TypeHintTransformer",
+    "resolve_forward_refs",
+    "walk",
+]
+
+
+def _has_children(hint: TypeHint) -> bool:
+    return hint.origin is not None and bool(hint.args)
+
+
+def walk(hint: TypeHint) -> Iterator[TypeHint]:
+    """
+    Iterate over *hint* and all type hints nested in its arguments in depth-first pre-order. Every distinct
+    low-level type hint object is yielded only once, even if it appears at multiple places in the tree.
+
+        >>> from typing import Dict, List
+        >>> [x.hint for x in walk(TypeHint(Dict[str, List[str]]))]
+        [typing.Dict[str, typing.List[str]], <class 'str'>, typing.List[str]]
+    """
+
+    seen: Set[int] = set()
+    stack = [hint]
+    while stack:
+        current = stack.pop()
+        key = id(current.hint)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield current
+        if _has_children(current):
+            # NOTE(NiklasRosenstein): The parameters of `Callable[..., T]` are an `Ellipsis`, which is not a type hint.
+            stack.extend(TypeHint(x) for x in reversed(current.args) if x is not ...)
+
+
+def resolve_forward_refs(hint: TypeHint) -> TypeHint:
+    """
+    Evaluate the forward references in *hint* with :meth:`TypeHint.evaluate`, but only if it contains any. Unlike
+    calling :meth:`TypeHint.evaluate` directly, a type hint without forward references is returned as it is and does
+    not need a :attr:`TypeHint.source`.
+
+        >>> from typing import List
+        >>> resolve_forward_refs(TypeHint(List["int"], {})).hint
+        typing.List[int]
+    """
+
+    if any(isinstance(x, ForwardRefTypeHint) for x in walk(hint)):
+        return hint.evaluate()
+    return hint
+
+
+class TypeHintTransformer:
+    """
+    Base class for transformations of a type hint tree, such as the evaluation of forward references or the
+    substitution of type variables. The tree is traversed with an explicit stack; the result for every distinct
+    low-level type hint object is computed only once and reused wherever that object appears again.
+
+    Subclasses customize the transformation by overriding :meth:`enter` and :meth:`leave`. A transformer memoizes
+    its results only for the duration of a single :meth:`transform` call.
+    """
+
+    def enter(self, hint: TypeHint) -> Tuple[TypeHint, bool]:
+        """
+        Called when *hint* is reached in the traversal, before any of its arguments are visited.
+
+        :return: A tuple of the type hint that takes the place of *hint* and whether the traversal should descend
+            into the arguments of that type hint. If it does not descend, the returned type hint is used verbatim.
+        """
+
+        return hint, True
+
+    def leave(self, hint: TypeHint, args: Tuple[Any, ...]) -> TypeHint:
+        """
+        Called after all arguments of *hint* (as returned by :meth:`enter`) have been transformed.
+
+        :param args: The transformed low-level type hint arguments.
+        :return: The type hint that takes the place of *hint* in the result.
+        """
+
+        return hint._copy_with_args(args)
+
+    def transform(self, hint: TypeHint) -> TypeHint:
+        """
+        Apply the transformation to *hint* and all of its nested type hints.
+
+        :raise RecursionError: If the tree turns out to be self-referential, which can happen if the evaluation
+            of a forward reference yields a type hint that contains the same forward reference.
+        """
+
+        # Maps the id() of a low-level type hint to the object (to keep the id() valid) and its result.
+        memo: Dict[int, Tuple[object, TypeHint]] = {}
+        in_progress: Set[int] = set()
+
+        # Every frame is a list of [low-level hint, wrapper or None, entered hint or None].
+        stack: List[List[Any]] = [[hint.hint, hint, None]]
+        while stack:
+            frame = stack[-1]
+            obj, wrapper, entered = frame
+            key = id(obj)
+
+            if entered is None:
+                if key in memo:
+                    stack.pop()
+                    continue
+                entered, descend = self.enter(wrapper if wrapper is not None else TypeHint(obj))
+                if not descend or not _has_children(entered):
+                    memo[key] = (obj, entered)
+                    stack.pop()
+                    continue
+                frame[2] = entered
+                in_progress.add(key)
+                for arg in reversed(entered.args):
+                    if arg is ...:
+                        continue  # See the note in `walk()`; the `Ellipsis` is kept as it is.
+                    if id(arg) in in_progress:
+                        raise RecursionError(f"{hint} is self-referential through {TypeHint(arg)}")
+                    if id(arg) not in memo:
+                        stack.append([arg, None, None])
+
+            else:
+                args = tuple(x if x is ... else memo[id(x)][1].hint for x in entered.args)
+                memo[key] = (obj, self.leave(entered, args))
+                in_progress.discard(key)
+                stack.pop()
+
+        return memo[id(hint.hint)][1]
+
+
+class EvaluateTransformer(TypeHintTransformer):
+    """
+    Evaluates all forward references in a type hint tree in the given *context*. This is what
+    :meth:`TypeHint.evaluate` and :meth:`TypeHint.evaluate_partial` use under the hood.
+
+    :param partial: If enabled, forward references that refer to names that are not in the context are left in the
+        tree and the names are added to :attr:`missing`, instead of raising a :class:`KeyError`.
+    """
+
+    def __init__(self, context: HasGetitem[str, Any], partial: bool = False) -> None:
+        self.context = context
+        self.partial = partial
+        self.missing: Set[str] = set()
+
+    def enter(self, hint: TypeHint) -> Tuple[TypeHint, bool]:
+        try:
+            return hint._evaluate_node(self.context)
+        except KeyError as exc:
+            # NOTE(NiklasRosenstein): In partial mode, a forward reference that refers to a name that is not in the
+            #       context is kept as it is. The name is recorded so the evaluation can be resumed later.
+            if not self.partial or not isinstance(hint, ForwardRefTypeHint):
+                raise
+            # A `KeyError` raised by a custom mapping may not carry the name.
+            self.missing.add(exc.args[0] if exc.args else hint.expr)
+            return hint, False
+
+
+class ParameterizeTransformer(TypeHintTransformer):
+    """
+    Replaces type variables in a type hint tree with the values in *parameter_map*. This is what
+    :meth:`TypeHint.parameterize` uses under the hood.
+    """
+
+    def __init__(self, parameter_map: Mapping[object, Any]) -> None:
+        self.parameter_map = parameter_map
+
+    def enter(self, hint: TypeHint) -> Tuple[TypeHint, bool]:
+        return hint._parameterize_node(self.parameter_map)
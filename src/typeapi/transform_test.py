@@ -0,0 +1,122 @@
+import inspect
+import sys
+from typing import Any, Callable, Dict, List, Tuple, TypeVar, Union
+
+import pytest
+
+from typeapi.transform import TypeHintTransformer, walk
+from typeapi.typehint import ClassTypeHint, TypeHint
+from typeapi.utils import ForwardRef
+
+T = TypeVar("T")
+
+
+class CountingTransformer(TypeHintTransformer):
+    def __init__(self) -> None:
+        self.entered: List[Any] = []
+
+    def enter(self, hint: TypeHint) -> Tuple[TypeHint, bool]:
+        self.entered.append(hint.hint)
+        return hint, True
+
+    def leave(self, hint: TypeHint, args: Tuple[Any, ...]) -> TypeHint:
+        return hint
+
+
+def test__walk__yields_distinct_nodes_in_preorder() -> None:
+    hint = TypeHint(Dict[str, Union[int, List[str]]])
+    assert [x.hint for x in walk(hint)] == [
+        Dict[str, Union[int, List[str]]],
+        str,
+        Union[int, List[str]],
+        int,
+        List[str],
+    ]
+
+
+def test__TypeHintTransformer__visits_shared_subtrees_once() -> None:
+    shared = Dict[str, List[int]]
+    transformer = CountingTransformer()
+    transformer.transform(TypeHint(Tuple[shared, List[shared], shared]))
+    assert transformer.entered.count(shared) == 1
+    assert transformer.entered.count(int) == 1
+
+
+def test__TypeHintTransformer__does_not_recurse() -> None:
+    hint: Any = int
+    for _ in range(100):
+        hint = List[hint]
+
+    transformer = CountingTransformer()
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack()) + 30)
+    try:
+        assert transformer.transform(TypeHint(hint)).hint is hint
+    finally:
+        sys.setrecursionlimit(limit)
+    assert len(transformer.entered) == 101
+
+
+def test__TypeHint__evaluate__wide_union() -> None:
+    hint = TypeHint(Union[tuple(ForwardRef(f"T{i}") for i in range(300))])  # type: ignore[misc]
+    context = {f"T{i}": type(f"T{i}", (), {}) for i in range(300)}
+    result = hint.evaluate(context)
+    assert result.args == tuple(context.values())
+
+
+def test__TypeHint__parameterize__nested_typevars() -> None:
+    hint = TypeHint(Dict[T, List[Tuple[T, ...]]])  # type: ignore[valid-type]
+    assert hint.parameterize({T: int}).hint == Dict[int, List[Tuple[int, ...]]]
+
+
+def test__TypeHint__evaluate__self_referential_forward_ref() -> None:
+    with pytest.raises(RecursionError):
+        TypeHint("X").evaluate({"X": List["X"]})  # type: ignore[name-defined]  # noqa: F821
+
+    hint = TypeHint("A").evaluate({"A": "B", "B": "int"})
+    assert isinstance(hint, ClassTypeHint)
+    assert hint.type is int
+
+
+def test__TypeHint__evaluate_partial() -> None:
+    context: Dict[str, Any] = {}
+    hint = TypeHint(Dict["A", List[Tuple["B", "C"]]])  # type: ignore[name-defined]  # noqa: F821
+    with pytest.raises(KeyError):
+        hint.evaluate(context)
+
+    context["A"] = str
+    result = hint.evaluate_partial(context)
+    assert not result.complete
+    assert result.missing == {"B", "C"}
+    unresolved: Any = Tuple[ForwardRef("B"), ForwardRef("C")]  # type: ignore[misc]  # noqa: F821
+    assert result.hint.hint == Dict[str, List[unresolved]]
+
+    context["B"] = int
+    result = result.resume()
+    assert result.missing == {"C"}
+
+    result = result.resume({"C": float})
+    assert result.complete
+    assert result.hint.hint == Dict[str, List[Tuple[int, float]]]
+    assert result.resume() is result
+
+
+def test__walk_and_transform__skip_the_ellipsis_of_callable() -> None:
+    T = TypeVar("T")
+    assert [x.hint for x in walk(TypeHint(Callable[..., T]))] == [Callable[..., T], T]
+    assert TypeHint(Callable[..., "int"]).evaluate({}).hint == Callable[..., int]
+    assert TypeHint(Callable[..., T]).parameterize({T: int}).hint == Callable[..., int]
+
+
+class _Unsubscriptable:
+    def __class_getitem__(cls, item: Any) -> Any:
+        raise KeyError
+
+
+def test__TypeHint__evaluate_partial__key_error_without_name() -> None:
+    context = {"Unsubscriptable": _Unsubscriptable}
+    hint = TypeHint(List["Unsubscriptable[int]"])  # type: ignore[name-defined]  # noqa: F821
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            hint.evaluate(context)
+    assert hint.evaluate_partial(context).missing == {"Unsubscriptable[int]"}
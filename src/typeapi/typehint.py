@@ -1,18 +1,25 @@
 import abc
-import sys
-from collections import ChainMap, deque
-from types import ModuleType
+import builtins
+import enum
+import time
+import weakref
+from collections import deque
+from types import MappingProxyType, ModuleType
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     Generator,
     Generic,
     Iterator,
     List,
     Mapping,
-    MutableMapping,
+    NamedTuple,
+    Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
     cast,
@@ -21,18 +28,25 @@ from typing import (
 
 from typing_extensions import Annotated, Literal
 
+from . import hooks, instrumentation
+from .cache import LRUCache
+from .context import EvaluationContext, get_evaluation_context
+from .dependencies import DependencyStamp, record, track_dependencies
 from .utils import (
     ForwardRef,
     HasGetitem,
+    get_annotations,
     get_subscriptable_type_hint_from_origin,
     get_type_hint_args,
     get_type_hint_origin_or_none,
     get_type_hint_original_bases,
     get_type_hint_parameters,
+    is_typed_dict,
     type_repr,
 )
 
 NoneType = type(None)
+T = TypeVar("T")
 
 
 class _TypeHintMeta(abc.ABCMeta):
@@ -48,7 +62,12 @@ class _TypeHintMeta(abc.ABCMeta):
         # If the current class is not the base "TypeHint" class, we should let
         # object construction continue as usual.
         if cls is not TypeHint:
-            return super().__call__(hint, source)  # type: ignore[no-any-return]
+            if not instrumentation.enabled:
+                return super().__call__(hint, source)  # type: ignore[no-any-return]
+            start = time.perf_counter()
+            wrapper: TypeHint = super().__call__(hint, source)
+            instrumentation.record_time(f"typehint.construct.{cls.__name__}", time.perf_counter() - start)
+            return wrapper
         # Otherwise, we are in this "TypeHint" class.
 
         # If the hint is a type hint in itself, we can return it as-is.
@@ -105,6 +124,11 @@ class _TypeHintMeta(abc.ABCMeta):
         elif origin is ClassVar or hint is ClassVar:  # Python >=3.10
             return ClassVarTypeHint(hint, source)
 
+        elif is_typed_dict(hint) or is_typed_dict(origin):
+            return TypedDictTypeHint(hint, source)
+        elif _is_protocol(hint) or _is_protocol(origin):
+            return ProtocolTypeHint(hint, source)
+
         return ClassTypeHint(hint, source)
 
 
@@ -225,11 +249,17 @@ class TypeHint(object, metaclass=_TypeHintMeta):
             type hints.
         """
 
-        if self.origin is not None and self.args:
-            args = tuple(TypeHint(x).parameterize(parameter_map).hint for x in self.args)
-            return self._copy_with_args(args)
-        else:
-            return self
+        from .transform import ParameterizeTransformer
+
+        return ParameterizeTransformer(parameter_map).transform(self)
+
+    def _parameterize_node(self, parameter_map: Mapping[object, Any]) -> "Tuple[TypeHint, bool]":
+        """
+        Internal. Parameterize only this node of the type hint tree. Returns the replacement for this node and
+        whether its arguments should be parameterized as well. See :class:`typeapi.transform.TypeHintTransformer`.
+        """
+
+        return self, True
 
     def evaluate(self, context: "HasGetitem[str, Any] | None" = None) -> "TypeHint":
         """
@@ -243,21 +273,70 @@ class TypeHint(object, metaclass=_TypeHintMeta):
             used instead. If no source exists, a :class:`RuntimeError` is raised.
         """
 
+        from .transform import EvaluateTransformer
+
         if context is None:
             context = self.get_context()
 
-        if self.origin is not None and self.args:
-            args = tuple(TypeHint(x).evaluate(context).hint for x in self.args)
-            return self._copy_with_args(args)
-        else:
-            return self
+        return EvaluateTransformer(context).transform(self)
+
+    def evaluate_partial(self, context: "HasGetitem[str, Any] | None" = None) -> "PartialEvaluation":
+        """
+        Like :meth:`evaluate`, but forward references that refer to names that are not available in the *context*
+        are left in the resulting type hint instead of raising an error. The names are recorded in the result, which
+        can be used to complete the evaluation later with :meth:`PartialEvaluation.resume`. Only the forward
+        references that are still unresolved are evaluated again.
+
+            >>> context = {"List": List}
+            >>> result = TypeHint(List["Node"]).evaluate_partial(context)
+            >>> result.hint, result.missing
+            (TypeHint(typing.List[ForwardRef('Node')]), frozenset({'Node'}))
+            >>> context["Node"] = int
+            >>> result.resume().hint
+            TypeHint(typing.List[int])
+
+        :param context: See :meth:`evaluate`.
+        """
+
+        from .transform import EvaluateTransformer
+
+        if context is None:
+            context = self.get_context()
+
+        transformer = EvaluateTransformer(context, partial=True)
+        return PartialEvaluation(transformer.transform(self), frozenset(transformer.missing), context)
+
+    def _evaluate_node(self, context: HasGetitem[str, Any]) -> "Tuple[TypeHint, bool]":
+        """
+        Internal. Evaluate only this node of the type hint tree. Returns the replacement for this node and whether
+        its arguments should be evaluated as well. See :class:`typeapi.transform.TypeHintTransformer`.
+        """
+
+        return self, True
+
+    def is_assignable_from(self, other: object) -> bool:
+        """
+        Returns `True` if a value of the type hint *other* can be assigned to a variable annotated with this type
+        hint. See :func:`typeapi.assignability.is_assignable` for details.
+
+            >>> from typing import Optional
+            >>> TypeHint(Optional[int]).is_assignable_from(Literal[1, None])
+            True
+            >>> TypeHint(List[int]).is_assignable_from(List[bool])
+            False
+        """
+
+        from .assignability import is_assignable
+
+        return is_assignable(self, other)
 
     def get_context(self) -> HasGetitem[str, Any]:
         """Return the context for this type hint in which forward references must be evaluated.
 
         The context is derived from the `source` attribute, which can be either a `ModuleType`, `Mapping` or
         `type`. In case of a `type`, the context is composed of the class scope (to resolve class-level members)
-        and the scope of the module that contains the type (looked up in `sys.modules`).
+        and the scope of the module that contains the type (looked up in `sys.modules`). The context of a module
+        or `type` is an :class:`EvaluationContext` that is created once and reused.
 
         Raises RuntimeError: If `source` is `None` or has not one of the three supported types.
         """
@@ -268,18 +347,45 @@ class TypeHint(object, metaclass=_TypeHintMeta):
                 "to which we could fall back to. Specify the `context` argument or make sure that the type "
                 "hint's `.source` is set."
             )
-        if isinstance(self.source, ModuleType):
-            return vars(self.source)
+        if isinstance(self.source, (ModuleType, type)):
+            return get_evaluation_context(self.source)
         if isinstance(self.source, Mapping):
             return self.source
-        if isinstance(self.source, type):
-            return ChainMap(
-                cast(MutableMapping[str, Any], vars(self.source)),
-                cast(MutableMapping[str, Any], vars(sys.modules[self.source.__module__])),
-            )
         raise RuntimeError(f"Unable to determine TypeHint.source context from source={self.source!r}")
 
 
+class PartialEvaluation(NamedTuple):
+    """The result of :meth:`TypeHint.evaluate_partial`."""
+
+    #: The type hint in which all forward references that could be resolved are evaluated.
+    hint: TypeHint
+
+    #: The names that were missing in the context to evaluate the remaining forward references.
+    missing: FrozenSet[str]
+
+    #: The context that the type hint was evaluated in.
+    context: HasGetitem[str, Any]
+
+    @property
+    def complete(self) -> bool:
+        """
+        Returns `True` if all forward references were resolved.
+        """
+
+        return not self.missing
+
+    def resume(self, context: "HasGetitem[str, Any] | None" = None) -> "PartialEvaluation":
+        """
+        Evaluate the forward references that could not be resolved before.
+
+        :param context: The context to evaluate the forward references in. Defaults to :attr:`context`.
+        """
+
+        if self.complete:
+            return self
+        return self.hint.evaluate_partial(self.context if context is None else context)
+
+
 class ClassTypeHint(TypeHint):
     """Represents a real, possibly parameterized, type. For example `int`, `list`, `list[int]` or `list[T]`."""
 
@@ -290,10 +396,8 @@ class ClassTypeHint(TypeHint):
             f'Got "{self.hint!r}" with origin "{self.origin}"'
         )
 
-    def parameterize(self, parameter_map: Mapping[object, Any]) -> "TypeHint":
-        if self.type is Generic:  # type: ignore[comparison-overlap]
-            return self
-        return super().parameterize(parameter_map)
+    def _parameterize_node(self, parameter_map: Mapping[object, Any]) -> "Tuple[TypeHint, bool]":
+        return self, self.type is not Generic  # type: ignore[comparison-overlap]
 
     @property
     def type(self) -> type:
@@ -381,6 +485,10 @@ class ClassTypeHint(TypeHint):
 class UnionTypeHint(TypeHint):
     """Represents a union of types, e.g. `typing.Union[A, B]` or `A | B`."""
 
+    def __init__(self, hint: object, source: "Any | None" = None) -> None:
+        super().__init__(hint, source)
+        self._classifier: "_UnionClassifier | None" = None
+
     def has_none_type(self) -> bool:
         return NoneType in self._args
 
@@ -391,16 +499,135 @@ class UnionTypeHint(TypeHint):
         else:
             return self._copy_with_args(args)
 
+    def classify(self, value: Any) -> Tuple[TypeHint, ...]:
+        """
+        Returns the members of the union that *value* matches, in the order in which they appear in the union.
+
+        Class members match instances of the class or its subclasses; generics match by their origin type, `Any`
+        matches everything, `Annotated` members match according to the type they wrap and type variables according
+        to their bound or constraints. `Literal` members match if the value is equal to one of the literal's values
+        and has the same type (i.e. `True` does not match `Literal[1]`). `TypedDict` members match all dictionaries
+        (their keys are not checked) and `Protocol` members match values that have all members of the protocol (see
+        :meth:`ProtocolTypeHint.is_instance`). Other members, such as unevaluated forward references, never match.
+
+        The lookup tables for this are built on the first call and cached on the type hint; matching the classes
+        is cached per type of the value, so repeated calls amount to a dictionary lookup.
+
+            >>> hint = TypeHint(Union[int, str, Literal["a"], None])
+            >>> hint.classify("a") == (TypeHint(str), TypeHint(Literal["a"]))
+            True
+            >>> hint.classify(None)
+            (TypeHint(NoneType),)
+            >>> hint.classify(1.0)
+            ()
+        """
+
+        if self._classifier is None:
+            self._classifier = _UnionClassifier(list(self))
+        return self._classifier.classify(value)
+
+
+class _UnionClassifier:
+    """
+    Internal. Lookup tables to find the members of a union that a value matches. See :meth:`UnionTypeHint.classify`.
+    """
+
+    def __init__(self, members: List[TypeHint]) -> None:
+        self.members = members
+        #: Maps the type of a class member to the indices of the members that match instances of it.
+        self.classes: Dict[Any, List[int]] = {}
+        #: Maps `(type(value), value)` of Literal values to the indices of the members that contain the value.
+        self.literals: Dict[Tuple[type, Any], List[int]] = {}
+        #: Literal values that are not hashable and must be compared one by one.
+        self.unhashable_literals: List[Tuple[Any, int]] = []
+        #: Protocol members, which are matched against every value.
+        self.protocols: List[Tuple[ProtocolTypeHint, int]] = []
+        #: Cache of the class member indices that match a type.
+        self.by_type: Dict[type, Tuple[int, ...]] = {}
+
+        for index, member in enumerate(members):
+            for hint in self._expand(member):
+                if isinstance(hint, LiteralTypeHint):
+                    keys, unhashable = hint._get_index()
+                    for key in keys:
+                        self.literals.setdefault(key, []).append(index)
+                    self.unhashable_literals += [(value, index) for value in unhashable]
+                elif isinstance(hint, TypedDictTypeHint):
+                    self.classes.setdefault(dict, []).append(index)
+                elif isinstance(hint, ProtocolTypeHint):
+                    # NOTE(NiklasRosenstein): `issubclass()` raises a `TypeError` for protocols that are not
+                    #       `runtime_checkable` and does not consider attributes that are assigned in the constructor.
+                    self.protocols.append((hint, index))
+                elif isinstance(hint, ClassTypeHint):
+                    self.classes.setdefault(hint.type, []).append(index)
+
+    @staticmethod
+    def _expand(member: TypeHint) -> List[TypeHint]:
+        """
+        Returns the type hints that determine which values match *member*.
+        """
+
+        if isinstance(member, AnnotatedTypeHint):
+            return _UnionClassifier._expand(TypeHint(member.type))
+        if isinstance(member, TypeVarTypeHint):
+            if member.bound is not None:
+                return _UnionClassifier._expand(TypeHint(member.bound))
+            if member.constraints:
+                return [y for x in member.constraints for y in _UnionClassifier._expand(TypeHint(x))]
+            return [TypeHint(object)]
+        if isinstance(member, UnionTypeHint):
+            return [y for x in member for y in _UnionClassifier._expand(x)]
+        return [member]
+
+    def _match_type(self, type_: Any) -> Tuple[int, ...]:
+        indices: Set[int] = set()
+        for base in type_.__mro__:
+            indices.update(self.classes.get(base, ()))
+        # Account for virtual subclasses of abstract base classes (e.g. `int` and `numbers.Number`).
+        for cls, cls_indices in self.classes.items():
+            if isinstance(cls, abc.ABCMeta) and issubclass(type_, cls):
+                indices.update(cls_indices)
+        return tuple(sorted(indices))
+
+    def classify(self, value: Any) -> Tuple[TypeHint, ...]:
+        type_ = type(value)
+        try:
+            indices = self.by_type[type_]
+        except KeyError:
+            indices = self.by_type[type_] = self._match_type(type_)
+
+        if self.literals or self.unhashable_literals:
+            try:
+                literal_indices = self.literals.get((type_, value), [])
+            except TypeError:
+                literal_indices = []
+            literal_indices = literal_indices + [
+                i for v, i in self.unhashable_literals if type(v) is type_ and v == value
+            ]
+            if literal_indices:
+                indices = tuple(sorted(set(indices).union(literal_indices)))
+
+        if self.protocols:
+            protocol_indices = [i for hint, i in self.protocols if hint.is_instance(value)]
+            if protocol_indices:
+                indices = tuple(sorted(set(indices).union(protocol_indices)))
+
+        return tuple(self.members[i] for i in indices)
+
 
 class LiteralTypeHint(TypeHint):
     """Represents a literal type hint, e.g. `Literal["a", 42]`."""
 
+    def __init__(self, hint: object, source: "Any | None" = None) -> None:
+        super().__init__(hint, source)
+        self._index: "Tuple[FrozenSet[Tuple[type, Any]], Tuple[Any, ...]] | None" = None
+
     @property
     def args(self) -> Tuple[Any, ...]:
         return ()
 
-    def parameterize(self, parameter_map: Mapping[object, Any]) -> "TypeHint":
-        return self
+    def _parameterize_node(self, parameter_map: Mapping[object, Any]) -> "Tuple[TypeHint, bool]":
+        return self, False
 
     def __len__(self) -> int:
         return 0
@@ -416,10 +643,74 @@ class LiteralTypeHint(TypeHint):
 
         return self._args
 
+    @property
+    def flat_values(self) -> Tuple[Any, ...]:
+        """
+        Returns the values of the literal with nested literals flattened and `Enum` classes expanded to their members.
+
+            >>> import enum
+            >>> class Color(enum.Enum):
+            ...     RED = 1
+            ...     GREEN = 2
+            >>> TypeHint(Literal[Color, "a"]).flat_values
+            (<Color.RED: 1>, <Color.GREEN: 2>, 'a')
+        """
+
+        result: List[Any] = []
+        stack = list(reversed(self._args))
+        while stack:
+            value = stack.pop()
+            if str(get_type_hint_origin_or_none(value)).endswith(".Literal"):
+                stack.extend(reversed(get_type_hint_args(value)))
+            elif isinstance(value, type) and issubclass(value, enum.Enum):
+                result.extend(value)
+            else:
+                result.append(value)
+        return tuple(result)
+
+    def _get_index(self) -> "Tuple[FrozenSet[Tuple[type, Any]], Tuple[Any, ...]]":
+        """
+        Internal. Returns the set of `(type(value), value)` keys of the hashable :attr:`flat_values` and a tuple
+        of the values that are not hashable. The index is computed once per type hint.
+        """
+
+        if self._index is None:
+            keys = set()
+            unhashable = []
+            for value in self.flat_values:
+                try:
+                    keys.add((type(value), value))
+                except TypeError:
+                    unhashable.append(value)
+            self._index = (frozenset(keys), tuple(unhashable))
+        return self._index
+
+    def contains(self, value: Any) -> bool:
+        """
+        Returns `True` if *value* is one of the literal's :attr:`flat_values`. Values are compared by type and
+        value, so unlike a check with `in` on :attr:`values`, `True` is not considered a member of `Literal[1]`.
+        Membership is determined with a hash lookup in an index that is built on the first call.
+
+            >>> hint = TypeHint(Literal[1, "a"])
+            >>> hint.contains(1), hint.contains(True), hint.contains("b")
+            (True, False, False)
+        """
+
+        keys, unhashable = self._get_index()
+        try:
+            return (type(value), value) in keys
+        except TypeError:
+            return any(type(x) is type(value) and x == value for x in unhashable)
+
 
 class AnnotatedTypeHint(TypeHint):
     """Represents the `Annotated` type hint."""
 
+    def __init__(self, hint: object, source: "Any | None" = None) -> None:
+        super().__init__(hint, source)
+        self._metadata_index: "Dict[type, List[int]] | None" = None
+        self._metadata_lookup: Dict[type, Tuple[Any, ...]] = {}
+
     @property
     def args(self) -> Tuple[Any, ...]:
         return (self._args[0],)
@@ -455,6 +746,73 @@ class AnnotatedTypeHint(TypeHint):
 
         return self._args[1:]
 
+    @property
+    def merged_metadata(self) -> Tuple[Any, ...]:
+        """
+        Returns the metadata of this type hint merged with that of nested `Annotated` layers that Python does not
+        flatten on its own, such as an `Annotated` hint behind a PEP 695 type alias. The metadata of inner layers
+        comes first.
+        """
+
+        layers = [self.metadata]
+        inner = self.type
+        while True:
+            if type(inner).__name__ == "TypeAliasType":
+                inner = inner.__value__
+            elif ".Annotated" in str(get_type_hint_origin_or_none(inner)):
+                args = get_type_hint_args(inner)
+                layers.append(args[1:])
+                inner = args[0]
+            else:
+                break
+        return tuple(x for layer in reversed(layers) for x in layer)
+
+    def iter_metadata(self, cls: "Type[T]") -> Iterator[T]:
+        """
+        Iterates over all entries in :attr:`merged_metadata` that are instances of *cls*, including instances of
+        its subclasses, in the order they appear in the type hint. The lookup is answered from an index over the
+        metadata types that is built on the first call, and the result for each *cls* is cached.
+
+            >>> class MaxLen(int): pass
+            >>> hint = TypeHint(Annotated[str, MaxLen(10), "doc", MaxLen(5)])
+            >>> list(hint.iter_metadata(MaxLen))
+            [10, 5]
+            >>> list(hint.iter_metadata(int))
+            [10, 5]
+        """
+
+        try:
+            return iter(self._metadata_lookup[cls])
+        except KeyError:
+            pass
+
+        metadata = self.merged_metadata
+        if self._metadata_index is None:
+            index: Dict[type, List[int]] = {}
+            for position, value in enumerate(metadata):
+                index.setdefault(type(value), []).append(position)
+            self._metadata_index = index
+
+        positions = [i for type_, group in self._metadata_index.items() if issubclass(type_, cls) for i in group]
+        result = tuple(metadata[i] for i in sorted(positions))
+        self._metadata_lookup[cls] = result
+        return iter(result)
+
+    def get_metadata(self, cls: "Type[T]") -> "T | None":
+        """
+        Returns the last entry in :attr:`merged_metadata` that is an instance of *cls*, or `None`. When the same
+        kind of metadata is given more than once, the outermost annotation thus takes precedence.
+
+            >>> class MaxLen(int): pass
+            >>> TypeHint(Annotated[str, MaxLen(10), MaxLen(5)]).get_metadata(MaxLen)
+            5
+            >>> TypeHint(Annotated[str, "doc"]).get_metadata(MaxLen) is None
+            True
+        """
+
+        result = tuple(self.iter_metadata(cls))
+        return result[-1] if result else None
+
 
 class TypeVarTypeHint(TypeHint):
     """Represents a `TypeVar` type hint."""
@@ -464,11 +822,11 @@ class TypeVarTypeHint(TypeHint):
         assert isinstance(self._hint, TypeVar)
         return self._hint
 
-    def parameterize(self, parameter_map: Mapping[object, Any]) -> "TypeHint":
-        return TypeHint(parameter_map.get(self.hint, self.hint))
+    def _parameterize_node(self, parameter_map: Mapping[object, Any]) -> "Tuple[TypeHint, bool]":
+        return TypeHint(parameter_map.get(self.hint, self.hint)), False
 
-    def evaluate(self, context: "HasGetitem[str, Any] | None" = None) -> TypeHint:
-        return self
+    def _evaluate_node(self, context: HasGetitem[str, Any]) -> "Tuple[TypeHint, bool]":
+        return self, False
 
     @property
     def name(self) -> str:
@@ -530,6 +888,35 @@ class TypeVarTypeHint(TypeHint):
         return self.hint.__bound__
 
 
+#: Maps a forward reference expression and the identity of the context that its evaluation failed in to a function
+#: that returns the context while it is alive (to check that the identity was not reused) and the name that was missing
+#: in the context.
+_EVALUATION_FAILURES: "LRUCache[Tuple[str, int], Tuple[Callable[[], HasGetitem[str, Any] | None], str]]" = LRUCache(
+    1024, "evaluation_failures"
+)
+
+
+def _get_reference(context: HasGetitem[str, Any]) -> "Callable[[], HasGetitem[str, Any] | None]":
+    # NOTE(NiklasRosenstein): A context is often created for a single call, e.g. by `get_annotations()`, and it keeps
+    #       the scopes it looks names up in alive. We only keep a weak reference to it if we can, so that a cached
+    #       failure does not keep class and module namespaces or frame locals alive. Plain dictionaries can not be
+    #       weakly referenced; they are passed explicitly by the caller, so we keep them alive instead.
+    try:
+        return weakref.ref(context)
+    except TypeError:
+        return lambda: context
+
+
+def _has_name(context: HasGetitem[str, Any], name: str) -> bool:
+    if isinstance(context, EvaluationContext):
+        return name in context
+    try:
+        context[name]
+    except KeyError:
+        return name in vars(builtins)
+    return True
+
+
 class ForwardRefTypeHint(TypeHint):
     """Represents a forward reference, i.e. a string in the type annotation or an explicit `ForwardRef`."""
 
@@ -544,20 +931,45 @@ class ForwardRefTypeHint(TypeHint):
                 f"ForwardRefTypeHint must be initialized from a typing.ForwardRef or str. Got: {type(self._hint)!r}"
             )
 
-    def parameterize(self, parameter_map: Mapping[object, Any]) -> TypeHint:
+    def _parameterize_node(self, parameter_map: Mapping[object, Any]) -> "Tuple[TypeHint, bool]":
         raise RuntimeError(
             "ForwardRef cannot be parameterized. Ensure that your type hint is fully "
             "evaluated before parameterization."
         )
 
-    def evaluate(self, context: "HasGetitem[str, Any] | None" = None) -> TypeHint:
+    def _evaluate_node(self, context: HasGetitem[str, Any]) -> "Tuple[TypeHint, bool]":
         from .future.fake import FakeProvider
 
-        if context is None:
-            context = self.get_context()
+        hint: TypeHint = self
+        seen = set()
+        # The context may itself contain strings that need to be evaluated again.
+        while isinstance(hint, ForwardRefTypeHint):
+            if hint.expr in seen:
+                raise RecursionError(f"{self} is self-referential through {hint}")
+            seen.add(hint.expr)
+
+            # Fail fast if the expression failed to evaluate in the same context before and the name that was
+            # missing back then is still missing.
+            key = (hint.expr, id(context))
+            failure = _EVALUATION_FAILURES.get(key)
+            if failure is not None and failure[0]() is context and not _has_name(context, failure[1]):
+                if instrumentation.enabled:
+                    instrumentation.increment("cache.evaluation_failures.hits")
+                raise KeyError(failure[1])
 
-        hint = FakeProvider(context).execute(self.expr).evaluate()
-        return TypeHint(hint).evaluate(context)
+            try:
+                source = context if self.source is None else self.source
+                with instrumentation.timed("evaluate.forward_ref"):
+                    with hooks.on_evaluate.timed("forward_ref", hint.expr, source):
+                        value = FakeProvider(context).execute(hint.expr).evaluate()
+                hint = TypeHint(value)
+            except KeyError as exc:
+                # NOTE(NiklasRosenstein): A `KeyError` raised by a custom mapping may not carry the missing name, in
+                #       which case we can not tell when the failure becomes stale.
+                if exc.args:
+                    _EVALUATION_FAILURES[key] = (_get_reference(context), exc.args[0])
+                raise
+        return hint, True
 
     @property
     def hint(self) -> "ForwardRef | str":
@@ -621,6 +1033,354 @@ class TupleTypeHint(ClassTypeHint):
         return self._repeated
 
 
+class TypedDictField(NamedTuple):
+    """Describes a field of a `TypedDict`."""
+
+    #: The name of the field.
+    name: str
+
+    #: The type hint of the field, without `Required`, `NotRequired` and `ReadOnly` qualifiers. Forward references
+    #: nested in the hint (e.g. `List["Node"]`) are not evaluated, so that a recursive `TypedDict` does not reference
+    #: itself; use `TypeHint(field.hint, typed_dict)` to evaluate them in the scope of the `TypedDict`.
+    hint: Any
+
+    #: Whether the key must be present in the dictionary.
+    required: bool
+
+    #: Whether the field is marked as `ReadOnly`.
+    readonly: bool
+
+
+class _TypedDictInfo(NamedTuple):
+    fields: Mapping[str, TypedDictField]
+    required_keys: FrozenSet[str]
+    optional_keys: FrozenSet[str]
+    readonly_keys: FrozenSet[str]
+    stamp: DependencyStamp
+
+
+_TYPED_DICT_QUALIFIERS = frozenset(["Required", "NotRequired", "ReadOnly"])
+_TYPED_DICT_INFO: "weakref.WeakKeyDictionary[type, _TypedDictInfo]" = weakref.WeakKeyDictionary()
+
+
+def _get_typed_dict_info(typed_dict: Any) -> _TypedDictInfo:
+    """
+    Internal. Returns the fields of a `TypedDict` class. The result is computed once per class.
+    """
+
+    info = _TYPED_DICT_INFO.get(typed_dict)
+    if info is not None and info.stamp.is_valid():
+        if instrumentation.enabled:
+            instrumentation.increment("cache.typed_dict_info.hits")
+        record(info.stamp.names)
+        return info
+
+    if instrumentation.enabled:
+        instrumentation.increment("cache.typed_dict_info.misses")
+
+    with track_dependencies() as names:
+        return _compute_typed_dict_info(typed_dict, names)
+
+
+def _compute_typed_dict_info(typed_dict: Any, names: Set[str]) -> _TypedDictInfo:
+    from .future.fake import FakeProvider
+
+    # NOTE(NiklasRosenstein): `typing.TypedDict` in Python 3.8 has no `__required_keys__`. All of its keys are either
+    #       required or not, depending on `__total__` (the totality of base classes is lost in Python 3.8).
+    if hasattr(typed_dict, "__required_keys__"):
+        required_keys = set(typed_dict.__required_keys__)
+    elif typed_dict.__total__:
+        required_keys = set(typed_dict.__annotations__)
+    else:
+        required_keys = set()
+    readonly_keys = set(getattr(typed_dict, "__readonly_keys__", ()))
+    fields = {}
+    for name, annotation in get_annotations(typed_dict).items():
+        # NOTE(NiklasRosenstein): Qualifiers in string annotations are not recognized by `TypedDict` itself. We
+        #       can't evaluate the annotation with `TypeHint.evaluate()` because the qualifiers are not type hints.
+        if isinstance(annotation, (str, ForwardRef)):
+            hint = TypeHint(annotation, typed_dict)
+            assert isinstance(hint, ForwardRefTypeHint), hint
+            try:
+                annotation = FakeProvider(hint.get_context()).execute(hint.expr).evaluate()
+            except KeyError:
+                pass
+        while getattr(getattr(annotation, "__origin__", None), "_name", None) in _TYPED_DICT_QUALIFIERS:
+            qualifier = annotation.__origin__._name
+            if qualifier == "Required":
+                required_keys.add(name)
+            elif qualifier == "NotRequired":
+                required_keys.discard(name)
+            else:
+                readonly_keys.add(name)
+            annotation = annotation.__args__[0]
+        fields[name] = TypedDictField(name, annotation, name in required_keys, name in readonly_keys)
+
+    info = _TypedDictInfo(
+        MappingProxyType(fields),
+        frozenset(required_keys),
+        frozenset(fields.keys() - required_keys),
+        frozenset(readonly_keys),
+        DependencyStamp(names),
+    )
+    _TYPED_DICT_INFO[typed_dict] = info
+    return info
+
+
+class TypedDictTypeHint(ClassTypeHint):
+    """
+    Represents a `TypedDict` class, or a parameterization of a generic `TypedDict`. The fields of a `TypedDict` are
+    resolved only once per class and shared between all type hints for that class.
+
+        >>> from typing_extensions import NotRequired, TypedDict
+        >>> class Movie(TypedDict):
+        ...     title: str
+        ...     year: NotRequired[int]
+        >>> hint = TypeHint(Movie)
+        >>> hint.get_field("year")
+        TypedDictField(name='year', hint=<class 'int'>, required=False, readonly=False)
+        >>> sorted(hint.required_keys)
+        ['title']
+    """
+
+    def __init__(self, hint: object, source: "Any | None" = None) -> None:
+        super().__init__(hint, source)
+        self._fields: "Mapping[str, TypedDictField] | None" = None
+
+    @property
+    def total(self) -> bool:
+        """
+        Returns the `total` argument of the `TypedDict` class.
+        """
+
+        return self.type.__total__  # type: ignore[attr-defined,no-any-return]
+
+    @property
+    def fields(self) -> Mapping[str, TypedDictField]:
+        """
+        Returns a read-only mapping of the fields of the `TypedDict`. A field type hint that is a forward reference is
+        evaluated if possible, and type variables are replaced with the type arguments of this type hint. Forward
+        references nested in a field type hint are kept, see :attr:`TypedDictField.hint`.
+        """
+
+        if self._fields is None:
+            fields = _get_typed_dict_info(self.type).fields
+            parameter_map = self.get_parameter_map()
+            if parameter_map:
+                fields = MappingProxyType(
+                    {k: v._replace(hint=TypeHint(v.hint).parameterize(parameter_map).hint) for k, v in fields.items()}
+                )
+            self._fields = fields
+        return self._fields
+
+    def get_field(self, name: str) -> TypedDictField:
+        """
+        Returns the field with the given *name*.
+
+        :raise KeyError: If the `TypedDict` has no such field.
+        """
+
+        return self.fields[name]
+
+    @property
+    def required_keys(self) -> FrozenSet[str]:
+        """
+        Returns the keys that must be present in the dictionary.
+        """
+
+        return _get_typed_dict_info(self.type).required_keys
+
+    @property
+    def optional_keys(self) -> FrozenSet[str]:
+        """
+        Returns the keys that may be absent from the dictionary.
+        """
+
+        return _get_typed_dict_info(self.type).optional_keys
+
+    @property
+    def readonly_keys(self) -> FrozenSet[str]:
+        """
+        Returns the keys of the fields that are marked as `ReadOnly`.
+        """
+
+        return _get_typed_dict_info(self.type).readonly_keys
+
+
+#: Attributes of a `Protocol` class that are not members of the protocol.
+_PROTOCOL_SPECIAL_ATTRS = frozenset(
+    [
+        "__abstractmethods__",
+        "__annotate__",
+        "__annotations__",
+        "__callable_proto_members_only__",
+        "__class_getitem__",
+        "__dict__",
+        "__doc__",
+        "__firstlineno__",
+        "__init__",
+        "__module__",
+        "__new__",
+        "__non_callable_proto_members__",
+        "__orig_bases__",
+        "__orig_class__",
+        "__parameters__",
+        "__protocol_attrs__",
+        "__qualname__",
+        "__slots__",
+        "__static_attributes__",
+        "__subclasshook__",
+        "__type_params__",
+        "__weakref__",
+        "_is_protocol",
+        "_is_runtime_protocol",
+    ]
+)
+
+
+def _is_protocol(hint: Any) -> bool:
+    return (
+        isinstance(hint, type)
+        and getattr(hint, "_is_protocol", False) is True
+        and hint.__module__ not in ("typing", "typing_extensions")
+    )
+
+
+class _ProtocolInfo(NamedTuple):
+    members: FrozenSet[str]
+    methods: FrozenSet[str]
+    #: Maps whether signatures are checked to the verdicts for classes. A verdict is `None` if the class does not
+    #: implement the protocol, otherwise it is the set of members that instances must have because the class has not.
+    verdicts: "Dict[bool, weakref.WeakKeyDictionary[type, FrozenSet[str] | None]]"
+
+
+_PROTOCOL_INFO: "weakref.WeakKeyDictionary[type, _ProtocolInfo]" = weakref.WeakKeyDictionary()
+
+
+def _get_protocol_info(protocol: type) -> _ProtocolInfo:
+    """
+    Internal. Returns the members of a `Protocol` class. The result is computed once per class.
+    """
+
+    try:
+        return _PROTOCOL_INFO[protocol]
+    except KeyError:
+        pass
+
+    members = set()
+    methods = set()
+    for base in protocol.__mro__:
+        if base is object or base is Generic or base.__module__ in ("typing", "typing_extensions"):
+            continue
+        for name in [*vars(base), *vars(base).get("__annotations__", {})]:
+            if name in _PROTOCOL_SPECIAL_ATTRS or name.startswith("_abc_") or name in members:
+                continue
+            members.add(name)
+            if callable(vars(base).get(name)):
+                methods.add(name)
+
+    info = _ProtocolInfo(
+        frozenset(members), frozenset(methods), {False: weakref.WeakKeyDictionary(), True: weakref.WeakKeyDictionary()}
+    )
+    _PROTOCOL_INFO[protocol] = info
+    return info
+
+
+class ProtocolTypeHint(ClassTypeHint):
+    """
+    Represents a `Protocol` class, or a parameterization of a generic `Protocol`. Unlike `isinstance()` checks
+    against a `runtime_checkable` protocol, which look up all protocol members on every call, the conformance checks
+    of this class compute the members of the protocol once and cache their verdict for every checked class.
+
+        >>> from typing_extensions import Protocol
+        >>> class SupportsClose(Protocol):
+        ...     def close(self) -> None: ...
+        >>> class Resource:
+        ...     def close(self) -> None: ...
+        >>> hint = TypeHint(SupportsClose)
+        >>> hint.members
+        frozenset({'close'})
+        >>> hint.is_implemented_by(Resource), hint.is_instance(Resource()), hint.is_instance(42)
+        (True, True, False)
+    """
+
+    @property
+    def members(self) -> FrozenSet[str]:
+        """
+        Returns the names of the protocol's members, including those that are inherited from other protocols.
+        """
+
+        return _get_protocol_info(self.type).members
+
+    def _get_verdict(self, cls: type, signatures: bool) -> "FrozenSet[str] | None":
+        info = _get_protocol_info(self.type)
+        verdicts = info.verdicts[signatures]
+        try:
+            return verdicts[cls]
+        except KeyError:
+            pass
+
+        missing = frozenset(x for x in info.members if not hasattr(cls, x))
+        verdict: "FrozenSet[str] | None" = missing
+        for name in info.methods - missing:
+            # NOTE(NiklasRosenstein): Setting a method to `None` explicitly marks it as not implemented.
+            if getattr(cls, name) is None or (signatures and not self._is_compatible_method(cls, name)):
+                verdict = None
+                break
+
+        try:
+            verdicts[cls] = verdict
+        except TypeError:
+            pass  # The class does not support weak references.
+        return verdict
+
+    def _is_compatible_method(self, cls: type, name: str) -> bool:
+        from .assignability import is_assignable
+        from .signature import get_signature_hints
+
+        try:
+            expected = get_signature_hints(getattr(self.type, name))
+            actual = get_signature_hints(getattr(cls, name))
+        except TypeError:
+            # One of the methods is not a Python function.
+            return True
+        except KeyError:
+            # An annotation refers to a name that is not available at runtime, e.g. one that is only imported in an
+            # `if TYPE_CHECKING:` block. Like a missing annotation, it does not make the method incompatible.
+            return True
+
+        # Parameters are contravariant and the return value is covariant.
+        for key, hint in expected.parameters.items():
+            if key in actual.parameters and not is_assignable(actual.parameters[key], hint):
+                return False
+        if expected.return_hint is not None and actual.return_hint is not None:
+            return is_assignable(expected.return_hint, actual.return_hint)
+        return True
+
+    def is_implemented_by(self, cls: type, signatures: bool = False) -> bool:
+        """
+        Returns `True` if the class *cls* has all members of the protocol. The verdict is cached for every class.
+
+        :param signatures: Whether to also check that the type hints of the class's methods are compatible with the
+            type hints of the protocol's methods. Parameters and return values that are not annotated on either side
+            are considered compatible, and so are methods with annotations that can't be evaluated (e.g. because
+            they refer to names that are only imported when type checking).
+        """
+
+        return self._get_verdict(cls, signatures) == frozenset()
+
+    def is_instance(self, value: Any, signatures: bool = False) -> bool:
+        """
+        Returns `True` if *value* has all members of the protocol. Only the members that the class of *value* does
+        not have, such as attributes that are assigned in the constructor, are looked up on the value itself.
+
+        :param signatures: See :meth:`is_implemented_by`.
+        """
+
+        verdict = self._get_verdict(type(value), signatures)
+        return verdict is not None and all(hasattr(value, x) for x in verdict)
+
+
 class TypeAliasTypeHint(TypeHint):
     """Represents a `TypeAlias` type hint."""
 
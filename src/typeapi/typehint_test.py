@@ -1,7 +1,9 @@
+import sys
+import typing
 from typing import Any, ClassVar, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar, Union
 
-from pytest import mark
-from typing_extensions import Annotated, Literal, TypeAlias
+from pytest import mark, raises
+from typing_extensions import Annotated, Literal, NotRequired, Protocol, ReadOnly, Required, TypeAlias, TypedDict
 
 from typeapi.typehint import (
     AnnotatedTypeHint,
@@ -9,8 +11,11 @@ from typeapi.typehint import (
     ClassVarTypeHint,
     ForwardRefTypeHint,
     LiteralTypeHint,
+    ProtocolTypeHint,
     TupleTypeHint,
     TypeAliasTypeHint,
+    TypedDictField,
+    TypedDictTypeHint,
     TypeHint,
     TypeVarTypeHint,
     UnionTypeHint,
@@ -607,3 +612,307 @@ def test__TypeHint__with_ClassVar() -> None:
 def test__ClassVarTypeHint__copy_with_args() -> None:
     hint = TypeHint(ClassVar[int])
     assert hint._copy_with_args((str,)).hint == ClassVar[str]
+
+
+def test__UnionTypeHint__classify() -> None:
+    import numbers
+
+    class MyInt(int):
+        pass
+
+    hint = TypeHint(
+        Union[  # type: ignore[valid-type]
+            int,
+            Literal[1, "a"],
+            Annotated[str, "meta"],
+            List[int],
+            numbers.Number,
+            TypeVar("B", bound=bytes),
+            "Unresolved",  # noqa: F821
+            None,
+        ]
+    )
+    assert isinstance(hint, UnionTypeHint)
+    int_, literal, annotated, list_, number, typevar, _, none = hint
+    assert hint.classify(1) == (int_, literal, number)
+    assert hint.classify(True) == (int_, number)
+    assert hint.classify(MyInt(2)) == (int_, number)
+    assert hint.classify("a") == (literal, annotated)
+    assert hint.classify("b") == (annotated,)
+    assert hint.classify([]) == (list_,)
+    assert hint.classify(1.0) == (number,)
+    assert hint.classify(b"") == (typevar,)
+    assert hint.classify(None) == (none,)
+    assert hint.classify(object()) == ()
+    assert hint._classifier is not None
+    assert hint.classify(1) == (int_, literal, number)
+
+
+def test__UnionTypeHint__classify_any() -> None:
+    hint = TypeHint(Union[int, Any])
+    assert isinstance(hint, UnionTypeHint)
+    assert hint.classify(1) == (TypeHint(int), TypeHint(Any))
+    assert hint.classify("a") == (TypeHint(Any),)
+
+
+def test__UnionTypeHint__classify_typed_dicts_and_protocols() -> None:
+    hint = TypeHint(Union[int, _Movie, _SupportsRead, None])
+    assert isinstance(hint, UnionTypeHint)
+    int_, movie, supports_read, none = hint
+    assert hint.classify(1) == (int_,)
+    assert hint.classify({"title": "Alien"}) == (movie,)
+    assert hint.classify(_File("a.txt")) == (supports_read,)
+    assert hint.classify(None) == (none,)
+
+
+def test__LiteralTypeHint__contains() -> None:
+    import enum
+
+    class Color(enum.Enum):
+        RED = 1
+        GREEN = 2
+
+    hint = TypeHint(Literal[1, "a", None, Color.RED])
+    assert isinstance(hint, LiteralTypeHint)
+    assert hint.contains(1)
+    assert hint.contains("a")
+    assert hint.contains(None)
+    assert hint.contains(Color.RED)
+    assert not hint.contains(True)
+    assert not hint.contains(1.0)
+    assert not hint.contains(Color.GREEN)
+    assert not hint.contains([1])
+
+
+def test__LiteralTypeHint__flat_values() -> None:
+    import enum
+
+    class Color(enum.Enum):
+        RED = 1
+        GREEN = 2
+
+    hint = TypeHint(Literal[Literal[1, Literal["a"]], Color, 2])  # type: ignore[valid-type]
+    assert isinstance(hint, LiteralTypeHint)
+    assert hint.flat_values == (1, "a", Color.RED, Color.GREEN, 2)
+    assert hint.contains(Color.GREEN)
+    assert hint.contains("a")
+
+
+def test__AnnotatedTypeHint__metadata_lookup() -> None:
+    class Constraint:
+        pass
+
+    class MaxLen(Constraint):
+        def __init__(self, value: int) -> None:
+            self.value = value
+
+    class Alias(Constraint):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    a, b, c = MaxLen(10), Alias("foo"), MaxLen(5)
+    hint = TypeHint(Annotated[str, a, "doc", b, c])
+    assert isinstance(hint, AnnotatedTypeHint)
+    assert list(hint.iter_metadata(MaxLen)) == [a, c]
+    assert list(hint.iter_metadata(Constraint)) == [a, b, c]
+    assert list(hint.iter_metadata(str)) == ["doc"]
+    assert list(hint.iter_metadata(int)) == []
+    assert hint.get_metadata(MaxLen) is c
+    assert hint.get_metadata(Alias) is b
+    assert hint.get_metadata(int) is None
+
+
+@mark.skipif(sys.version_info < (3, 12), reason="PEP 695 type aliases require Python 3.12")
+def test__AnnotatedTypeHint__merges_metadata_of_nested_layers() -> None:
+    from typing import TypeAliasType  # type: ignore[attr-defined]
+
+    Inner = TypeAliasType("Inner", Annotated[int, "inner"])
+    hint = TypeHint(Annotated[Inner, "outer"])
+    assert isinstance(hint, AnnotatedTypeHint)
+    assert hint.metadata == ("outer",)
+    assert hint.merged_metadata == ("inner", "outer")
+    assert hint.get_metadata(str) == "outer"
+
+
+class _Movie(TypedDict, total=False):
+    title: Required[str]
+    year: int
+    rating: "ReadOnly[float]"
+
+
+class _Sequel(_Movie):
+    prequel: _Movie
+    director: "NotRequired[str]"
+
+
+def test__TypedDictTypeHint__fields() -> None:
+    hint = TypeHint(_Sequel)
+    assert isinstance(hint, TypedDictTypeHint)
+    assert hint.total
+    assert list(hint.fields) == ["title", "year", "rating", "prequel", "director"]
+    assert hint.get_field("title") == TypedDictField("title", str, True, False)
+    assert hint.get_field("year") == TypedDictField("year", int, False, False)
+    assert hint.get_field("rating") == TypedDictField("rating", float, False, True)
+    assert hint.get_field("prequel") == TypedDictField("prequel", _Movie, True, False)
+    assert hint.get_field("director") == TypedDictField("director", str, False, False)
+    assert hint.required_keys == {"title", "prequel"}
+    assert hint.optional_keys == {"year", "rating", "director"}
+    assert hint.readonly_keys == {"rating"}
+    other = TypeHint(_Sequel)
+    assert isinstance(other, TypedDictTypeHint)
+    assert other.fields is hint.fields
+
+
+class _TypingMovie(typing.TypedDict):
+    title: str
+    year: "int"
+
+
+class _TypingPartialMovie(typing.TypedDict, total=False):
+    title: str
+
+
+def test__TypedDictTypeHint__fields_of_typing_TypedDict() -> None:
+    # NOTE: `typing.TypedDict` has no `__required_keys__` in Python 3.8.
+    hint = TypeHint(_TypingMovie)
+    assert isinstance(hint, TypedDictTypeHint)
+    assert hint.get_field("year") == TypedDictField("year", int, True, False)
+    assert hint.required_keys == {"title", "year"}
+    partial = TypeHint(_TypingPartialMovie)
+    assert isinstance(partial, TypedDictTypeHint)
+    assert partial.optional_keys == {"title"}
+
+
+def test__TypedDictTypeHint__generic() -> None:
+    class Page(TypedDict, Generic[T]):
+        items: List[T]
+        cursor: "NotRequired[str]"
+
+    hint = TypeHint(Page[int])
+    assert isinstance(hint, TypedDictTypeHint)
+    assert hint.get_field("items").hint == List[int]
+    assert hint.required_keys == {"items"}
+    generic = TypeHint(Page)
+    assert isinstance(generic, TypedDictTypeHint)
+    assert generic.get_field("items").hint == List[T]  # type: ignore[valid-type]
+
+
+class _SupportsRead(Protocol):
+    name: str
+
+    def read(self, size: int) -> bytes: ...
+
+
+class _SupportsReadWrite(_SupportsRead, Protocol):
+    def write(self, data: bytes) -> int: ...
+
+
+class _File:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def read(self, size: int) -> bytes:
+        return b""
+
+    def write(self, data: bytes) -> int:
+        return 0
+
+
+class _TextFile(_File):
+    def read(self, size: int) -> str:  # type: ignore[override]
+        return ""
+
+
+class _Unwritable(_File):
+    write = None  # type: ignore[assignment]
+
+
+def test__ProtocolTypeHint__members() -> None:
+    hint = TypeHint(_SupportsReadWrite)
+    assert isinstance(hint, ProtocolTypeHint)
+    assert hint.members == {"name", "read", "write"}
+    assert not isinstance(TypeHint(_File), ProtocolTypeHint)
+
+
+def test__ProtocolTypeHint__conformance() -> None:
+    hint = TypeHint(_SupportsReadWrite)
+    assert isinstance(hint, ProtocolTypeHint)
+
+    # The `name` attribute is only assigned in the constructor.
+    assert not hint.is_implemented_by(_File)
+    assert hint.is_instance(_File("a"))
+    assert not hint.is_instance(object())
+    assert not hint.is_instance(_Unwritable("a"))
+
+    class NamedFile(_File):
+        name = "b"
+
+    assert hint.is_implemented_by(NamedFile)
+    assert hint._get_verdict(_File, False) is hint._get_verdict(_File, False)
+
+
+def test__ProtocolTypeHint__signatures() -> None:
+    hint = TypeHint(_SupportsRead)
+    assert isinstance(hint, ProtocolTypeHint)
+    assert hint.is_instance(_TextFile("a"))
+    assert not hint.is_instance(_TextFile("a"), signatures=True)
+    assert hint.is_instance(_File("a"), signatures=True)
+
+
+class _SupportsQuantize(Protocol):
+    def quantize(self, exp: "Decimal") -> "Decimal": ...  # type: ignore[name-defined]  # noqa: F821
+
+
+class _Quantizer:
+    def quantize(self, exp: int) -> int:
+        return exp
+
+
+def test__ProtocolTypeHint__signatures_with_unresolvable_annotations() -> None:
+    hint = TypeHint(_SupportsQuantize)
+    assert isinstance(hint, ProtocolTypeHint)
+    assert hint.is_implemented_by(_Quantizer, signatures=True)
+
+
+def test__ForwardRefTypeHint__caches_failed_evaluations(monkeypatch: Any) -> None:
+    from typeapi.future.fake import FakeProvider
+
+    calls: List[str] = []
+    execute = FakeProvider.execute
+
+    def counting_execute(self: FakeProvider, expr: str) -> Any:
+        calls.append(expr)
+        return execute(self, expr)
+
+    monkeypatch.setattr(FakeProvider, "execute", counting_execute)
+
+    context: Dict[str, Any] = {"List": List}
+    hint = TypeHint("List[_NotYetDefined]")
+    for _ in range(3):
+        with raises(KeyError):
+            hint.evaluate(context)
+    assert calls == ["List[_NotYetDefined]"]
+
+    # The failure is not reused for a different context.
+    with raises(KeyError):
+        hint.evaluate(dict(context))
+    assert len(calls) == 2
+
+    context["_NotYetDefined"] = int
+    assert hint.evaluate(context).hint == List[int]
+    assert len(calls) == 3
+
+
+def test__ForwardRefTypeHint__cached_failure_does_not_keep_context_alive() -> None:
+    import gc
+    import weakref
+
+    from typeapi.context import EvaluationContext
+
+    context = EvaluationContext({"List": List})
+    with raises(KeyError):
+        TypeHint("List[_NotYetDefined]").evaluate(context)
+    ref = weakref.ref(context)
+    del context
+    gc.collect()
+    assert ref() is None
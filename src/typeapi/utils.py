@@ -1,14 +1,17 @@
 import collections
+import importlib
 import sys
 import types
 import typing
 import warnings
 from types import FrameType, FunctionType, ModuleType
-from typing import Any, Callable, Dict, Generic, MutableMapping, Optional, Set, Tuple, TypeVar, Union, cast
+from typing import Any, Callable, Dict, Generic, Optional, Set, Tuple, TypeVar, Union
 
 import typing_extensions
 from typing_extensions import Protocol, TypeGuard
 
+from . import hooks, instrumentation
+from ._special_aliases import SPECIAL_ALIAS_PARAMETERS, SPECIAL_ALIASES
 from .backport.inspect import get_annotations as _inspect_get_annotations
 
 IS_PYTHON_AT_LAST_3_6 = sys.version_info[:2] <= (3, 6)
@@ -158,8 +161,9 @@ def get_type_hint_parameters(hint: object) -> Tuple[Any, ...]:
     # their type variables as parameters anymore; we try to restore those.
     if IS_PYTHON_AT_LEAST_3_9 and getattr(hint, "_nparams", 0) > 0:
         type_hint_name = getattr(hint, "_name", None) or hint.__name__  # type: ignore
-        if type_hint_name in _SPECIAL_ALIAS_TYPEVARS:
-            return tuple(get_type_var_from_string_repr(x) for x in _SPECIAL_ALIAS_TYPEVARS[type_hint_name])
+        parameters = SPECIAL_ALIAS_PARAMETERS.get((type_hint_name, hint._nparams))  # type: ignore[attr-defined]
+        if parameters is not None:
+            return tuple(get_type_var_from_string_repr(x) for x in parameters)
 
         warnings.warn(
             "The following type hint appears like a special generic alias but its type parameters are not "
@@ -204,67 +208,32 @@ def get_subscriptable_type_hint_from_origin(origin: object, *, __cache: Dict[Any
     from the :mod:`typing` module instead."""
 
     if not __cache:
-        if sys.version_info[:2] <= (3, 6):
-            attr = "__extra__"
-        else:
-            attr = "__origin__"
+        # NOTE(NiklasRosenstein): The aliases are looked up in a table that is generated for every version of Python
+        #       with scripts/dump_type_vars.py, instead of scanning the `typing` module. `typing_extensions` may
+        #       provide its own implementation of an alias (e.g. one that supports more type parameters), which takes
+        #       precedence over the one in `typing`.
+        for name, (module_name, qualname) in _get_special_aliases().items():
+            value: Any = sys.modules.get(module_name) or importlib.import_module(module_name)
+            for part in qualname.split("."):
+                value = getattr(value, part, None)
+            alias = getattr(typing_extensions, name, None)
+            if value is None or getattr(alias, "__origin__", None) is not value:
+                alias = getattr(typing, name, None)
+            if value is not None and alias is not None:
+                __cache[value] = alias
 
-        def _populate(hint: Any) -> None:
-            origin = getattr(hint, attr, None)
-            if origin is not None:
-                __cache[origin] = hint
+    return __cache.get(origin, origin)
 
-        for value in vars(typing).values():
-            _populate(value)
-        for value in vars(typing_extensions).values():
-            _populate(value)
 
-    return __cache.get(origin, origin)
+def _get_special_aliases() -> Dict[str, Tuple[str, str]]:
+    """
+    Returns the table of special generic aliases for the current version of Python, or for the latest version known
+    to `typeapi` if the current version is newer.
+    """
 
+    version = sys.version_info[:2]
+    return SPECIAL_ALIASES[max(x for x in SPECIAL_ALIASES if x <= version)]
 
-# Generated in Python 3.8 with scripts/dump_type_vars.py.
-# We use this map to create TypeVars in get_type_hint_parameters() on the fly
-# for Python 3.9+ since they no longer come with this information embedded.
-_SPECIAL_ALIAS_TYPEVARS = {
-    "Awaitable": ["+T_co"],
-    "Coroutine": ["+T_co", "-T_contra", "+V_co"],
-    "AsyncIterable": ["+T_co"],
-    "AsyncIterator": ["+T_co"],
-    "Iterable": ["+T_co"],
-    "Iterator": ["+T_co"],
-    "Reversible": ["+T_co"],
-    "Container": ["+T_co"],
-    "Collection": ["+T_co"],
-    "AbstractSet": ["+T_co"],
-    "MutableSet": ["~T"],
-    "Mapping": ["~KT", "+VT_co"],
-    "MutableMapping": ["~KT", "~VT"],
-    "Sequence": ["+T_co"],
-    "MutableSequence": ["~T"],
-    "List": ["~T"],
-    "Deque": ["~T"],
-    "Set": ["~T"],
-    "FrozenSet": ["+T_co"],
-    "MappingView": ["+T_co"],
-    "KeysView": ["~KT"],
-    "ItemsView": ["~KT", "+VT_co"],
-    "ValuesView": ["+VT_co"],
-    "ContextManager": ["+T_co"],
-    "AsyncContextManager": ["+T_co"],
-    "Dict": ["~KT", "~VT"],
-    "DefaultDict": ["~KT", "~VT"],
-    "OrderedDict": ["~KT", "~VT"],
-    "Counter": ["~T"],
-    "ChainMap": ["~KT", "~VT"],
-    "Generator": ["+T_co", "-T_contra", "+V_co"],
-    "AsyncGenerator": ["+T_co", "-T_contra"],
-    "Type": ["+CT_co"],
-    "SupportsAbs": ["+T_co"],
-    "SupportsRound": ["+T_co"],
-    "IO": ["~AnyStr"],
-    "Pattern": ["~AnyStr"],
-    "Match": ["~AnyStr"],
-}
 
 _TYPEVARS_CACHE = {
     "~AnyStr": TypeVar("AnyStr", bytes, str),
@@ -309,46 +278,56 @@ def get_annotations(
     This function will take into account the locals and globals accessible through the frame associated with
     a function or type by the #scoped() decorator."""
 
-    if hasattr(obj, "__typeapi_frame__"):
-        frame: FrameType = obj.__typeapi_frame__  # type: ignore[union-attr]
-        globalns = frame.f_globals
-        localns = frame.f_locals
-        del frame
-
-    elif hasattr(obj, "__module__"):
-        module = sys.modules.get(obj.__module__)
-        if module is None:
-            warnings.warn(
-                f"sys.modules[{obj.__module__!r}] does not exist, type hint resolution context for object of type "
-                f"{type(obj).__name__!r} will not be available.",
-                UserWarning,
-            )
-        else:
-            assert hasattr(module, "__dict__"), module
-            globalns = vars(module)
-
-    from collections import ChainMap
-
-    from .typehint import TypeHint
-
-    def eval_callback(hint_expr: str, globals: Any, locals: Any) -> Any:
-        chainmap = ChainMap(locals or {}, globals or {})
-        if isinstance(obj, type):
-            chainmap = chainmap.new_child(cast(MutableMapping[str, Any], vars(obj)))
-        hint = TypeHint(hint_expr, chainmap)
-        return hint.evaluate().hint
-
-    annotations = _inspect_get_annotations(obj, globals=globalns, locals=localns, eval_str=eval_str, eval=eval_callback)
+    with instrumentation.timed("get_annotations"), hooks.on_evaluate.timed("get_annotations", None, obj):
+        if hasattr(obj, "__typeapi_frame__"):
+            frame: FrameType = obj.__typeapi_frame__  # type: ignore[union-attr]
+            globalns = frame.f_globals
+            localns = frame.f_locals
+            del frame
+
+        elif hasattr(obj, "__module__"):
+            module = sys.modules.get(obj.__module__)
+            if module is None:
+                warnings.warn(
+                    f"sys.modules[{obj.__module__!r}] does not exist, type hint resolution context for object of type "
+                    f"{type(obj).__name__!r} will not be available.",
+                    UserWarning,
+                )
+            else:
+                assert hasattr(module, "__dict__"), module
+                globalns = vars(module)
+
+        from .context import EvaluationContext
+        from .typehint import TypeHint
+
+        # NOTE(NiklasRosenstein): The same globals and locals are passed for all annotations of a class or function, so
+        #       we create the context only once for each of them. The entries keep the globals and locals alive.
+        contexts: Dict[Tuple[int, int], Tuple[Any, Any, EvaluationContext]] = {}
+
+        def eval_callback(hint_expr: str, globals: Any, locals: Any) -> Any:
+            key = (id(globals), id(locals))
+            entry = contexts.get(key)
+            if entry is None:
+                scopes = [locals or {}, globals or {}]
+                if isinstance(obj, type):
+                    scopes.insert(0, vars(obj))
+                entry = contexts[key] = (globals, locals, EvaluationContext(*scopes))
+            hint = TypeHint(hint_expr, entry[2])
+            return hint.evaluate().hint
+
+        annotations = _inspect_get_annotations(
+            obj, globals=globalns, locals=localns, eval_str=eval_str, eval=eval_callback
+        )
 
-    if isinstance(obj, type) and include_bases:
-        annotations = {}
-        for base in obj.__mro__:
-            base_annotations = _inspect_get_annotations(
-                base, globals=globalns, locals=localns, eval_str=eval_str, eval=eval_callback
-            )
-            annotations.update({k: v for k, v in base_annotations.items() if k not in annotations})
+        if isinstance(obj, type) and include_bases:
+            annotations = {}
+            for base in obj.__mro__:
+                base_annotations = _inspect_get_annotations(
+                    base, globals=globalns, locals=localns, eval_str=eval_str, eval=eval_callback
+                )
+                annotations.update({k: v for k, v in base_annotations.items() if k not in annotations})
 
-    return annotations
+        return annotations
 
 
 class TypedDictProtocol(Protocol):
@@ -372,14 +351,14 @@ def is_typed_dict(hint: Any) -> TypeGuard[TypedDictProtocol]:
         #typeapi.models.Type.
     """
 
-    import typing
+    return isinstance(hint, _TYPED_DICT_METAS)
 
-    import typing_extensions
 
-    for m in (typing, typing_extensions):
-        if hasattr(m, "_TypedDictMeta") and isinstance(hint, m._TypedDictMeta):  # type: ignore[attr-defined]
-            return True
-    return False
+# NOTE(NiklasRosenstein): `typing_extensions` may provide its own implementation of `TypedDict`, with its own
+#       metaclass, in addition to the one in `typing`.
+_TYPED_DICT_METAS = tuple(
+    m._TypedDictMeta for m in (typing, typing_extensions) if hasattr(m, "_TypedDictMeta")  # type: ignore[attr-defined]
+)
 
 
 class HasGetitem(Protocol, Generic[T_contra, U_co]):
@@ -431,6 +431,26 @@ def test__get_subscriptable_type_hint_from_origin():
     assert get_subscriptable_type_hint_from_origin(int) is int
 
 
+def test__get_subscriptable_type_hint_from_origin__covers_all_special_aliases():
+    import contextlib
+    import re
+
+    # Some of these are created lazily by `typing.__getattr__()` in newer versions of Python.
+    assert get_subscriptable_type_hint_from_origin(re.Pattern) is t.Pattern
+    assert get_subscriptable_type_hint_from_origin(contextlib.AbstractContextManager).__origin__ is (
+        contextlib.AbstractContextManager
+    )
+    assert get_subscriptable_type_hint_from_origin(collections.abc.Callable).__origin__ is collections.abc.Callable
+
+
+@pytest.mark.filterwarnings("error")
+def test__get_type_hint_parameters__of_special_aliases():
+    KT, VT_co = get_type_hint_parameters(t.Mapping)
+    assert (str(KT), str(VT_co)) == ("~KT", "+VT_co")
+    assert len(get_type_hint_parameters(t.ContextManager)) == getattr(t.ContextManager, "_nparams", 1)
+    assert get_type_hint_parameters(t.Callable) == ()
+
+
 def test__get_annotations__does_not_evaluate_strings() -> None:
     class A:
         a: "str | None"